@@ -1,11 +1,47 @@
+import importlib
+from typing import Dict, List, Optional
+
 import click
 
-from commit_assistant.commands import commit, config, install, style, summary, update, upgrade
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.utils.upgrade_checker import UpgradeChecker
 
+# 不需要檢查更新的命令
+# upgrade 本身就會檢查更新，config 只是本地操作，不需要為此發送網路請求
+# style 只有 list 不需要檢查，由 style 群組自行判斷
+_SKIP_UPGRADE_CHECK_COMMANDS = ("upgrade", "config", "style")
+
+
+class LazyGroup(click.Group):
+    """延遲載入子命令的 click Group
+
+    子命令只有在真正被呼叫時才會 import 對應的模組，
+    避免 `--help`、`config` 等指令也要載入 AI 相關的套件
+    """
+
+    # 子命令名稱 -> "模組路徑:屬性名稱"
+    lazy_subcommands: Dict[str, str] = {
+        "commit": "commit_assistant.commands.commit:commit",
+        "config": "commit_assistant.commands.config:config",
+        "install": "commit_assistant.commands.install:install",
+        "style": "commit_assistant.commands.style:style",
+        "summary": "commit_assistant.commands.summary:summary",
+        "update": "commit_assistant.commands.update:update",
+        "upgrade": "commit_assistant.commands.upgrade:upgrade",
+    }
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
-@click.group(invoke_without_command=True)
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+        return getattr(importlib.import_module(module_name), attr_name)
+
+
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(version=ProjectInfo.VERSION, prog_name=ProjectInfo.NAME)
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -17,20 +53,11 @@ def cli(ctx: click.Context) -> None:
     # 取得當前執行的命令
     cmd_name = ctx.invoked_subcommand
 
-    # 當 upgrade 以外的命令執行時，檢查更新
-    if cmd_name != "upgrade":
-        upgrade_checker = UpgradeChecker()
-        upgrade_checker.run_version_check()
-
+    if cmd_name in _SKIP_UPGRADE_CHECK_COMMANDS:
+        return
 
-# 註冊子命令
-cli.add_command(commit)
-cli.add_command(install)
-cli.add_command(config)
-cli.add_command(style)
-cli.add_command(summary)
-cli.add_command(update)
-cli.add_command(upgrade)
+    # 在背景執行版本檢查，不等待檢查結果，有新版本時於命令結束後才提示
+    ctx.call_on_close(UpgradeChecker().start_background_check())
 
 
 if __name__ == "__main__":  # pragma: no cover
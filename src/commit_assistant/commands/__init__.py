@@ -1,11 +1,37 @@
-"""Commit-Assistant CLI 工具 中的各項commands"""
+"""Commit-Assistant CLI 工具 中的各項commands
 
-from .commit import commit
-from .config import config
-from .install import install
-from .style import style
-from .summary import summary
-from .update import update
-from .upgrade import upgrade
+各個 command 會在第一次被存取時才載入 (PEP 562)，
+避免只使用其中一個 command 時也要載入所有 command 的相依套件
+"""
 
-__all__ = ["commit", "install", "config", "summary", "update", "style", "upgrade"]
+import importlib
+from typing import Any, List
+
+# command 名稱 -> 所在的子模組
+_LAZY_COMMANDS = {
+    "commit": ".commit",
+    "config": ".config",
+    "install": ".install",
+    "style": ".style",
+    "summary": ".summary",
+    "update": ".update",
+    "upgrade": ".upgrade",
+}
+
+__all__ = ("commit", "install", "config", "summary", "update", "style", "upgrade")
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_COMMANDS[name], __name__)
+    command = getattr(module, name)
+
+    # 匯入子模組時會將同名的子模組設定到 package 上，這裡改回 command 本身並快取
+    globals()[name] = command
+    return command
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_COMMANDS})
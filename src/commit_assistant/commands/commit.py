@@ -1,9 +1,12 @@
 import os
+import re
 import sys
+from pathlib import Path
 from typing import List, Optional
 
 import click
-import questionary
+from rich.panel import Panel
+from rich.text import Text
 
 from commit_assistant.core.base_generator import BaseGeminiAIGenerator
 from commit_assistant.enums.commit_style import CommitStyle
@@ -14,6 +17,25 @@ from commit_assistant.utils.command_runners import GitCommandRunner
 from commit_assistant.utils.config_utils import load_config
 from commit_assistant.utils.console_utils import console, display_ai_message, loading_spinner
 
+# 一次去除頭尾的空白與 ``` 符號
+_TRIM_PATTERN = re.compile(r"^[\s`]+|[\s`]+$")
+
+# 設定值中視為「啟用」的字串
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# 送給 AI 的 diff 內容上限，超過的部分不會被讀取
+_MAX_DIFF_BYTES = 1024 * 1024
+
+
+def _is_commit_assistant_enabled() -> bool:
+    """判斷設定中是否要執行 commit assistant
+
+    Returns:
+        bool: 未設定時預設為啟用
+    """
+    value = os.environ.get(ConfigKey.ENABLE_COMMIT_ASSISTANT.value, "true")
+    return value.strip().lower() in _TRUE_VALUES
+
 
 class EnhancedCommitGenerator(BaseGeminiAIGenerator):
     def generate_structured_message(self, changed_files: List[str], diff_content: str) -> Optional[str]:
@@ -28,15 +50,15 @@ class EnhancedCommitGenerator(BaseGeminiAIGenerator):
         """
 
         # 獲取指定風格的 prompt
-        use_style = os.getenv(ConfigKey.COMMIT_STYLE.value, CommitStyle.CONVENTIONAL.value)
+        use_style = os.environ.get(ConfigKey.COMMIT_STYLE.value, CommitStyle.CONVENTIONAL.value)
         prompt = self.style_manager.get_prompt(use_style, changed_files, diff_content)
 
         if self._use_claude_cli:  # pragma: no cover
             console.print(f"[cyan] 生成 commit message 使用 <{use_style}> 風格，採用 Claude CLI [/cyan]")
         else:
-            use_model = os.getenv(ConfigKey.USE_MODEL.value, "gemini-2.5-flash")
+            # 直接使用初始化時已讀取的模型名稱，不再重新讀取環境變數
             console.print(
-                f"[cyan] 生成 commit message 使用 <{use_style}> 風格，採用模型 <{use_model}> [/cyan]"
+                f"[cyan] 生成 commit message 使用 <{use_style}> 風格，採用模型 <{self.model}> [/cyan]"
             )
 
         try:
@@ -47,7 +69,7 @@ class EnhancedCommitGenerator(BaseGeminiAIGenerator):
             return None
 
 
-def get_user_choice(choices: List[str]) -> str:
+def get_user_choice(choices: List[str]) -> Optional[str]:
     """
     提供簡單的數字選單供使用者選擇
 
@@ -55,21 +77,24 @@ def get_user_choice(choices: List[str]) -> str:
         choices (List[str]): 選項列表
 
     Returns:
-        str: 使用者選擇的選項
+        str | None: 使用者選擇的選項，使用者取消輸入時回傳 None
     """
     console.print("\n請選擇操作：")
     for i, choice in enumerate(choices, 1):
         console.print(f"[cyan]{i}.[/cyan] {choice}")
 
-    while True:
-        try:
-            selection = input("\n請輸入數字選項 (1-{}): ".format(len(choices)))
-            idx = int(selection) - 1
-            if 0 <= idx < len(choices):
-                return choices[idx]
-            console.print("[red] 無效的選擇，請重試 [/red]")
-        except ValueError:
-            console.print("[red] 請輸入有效的數字 [/red]")
+    # 提示文字與範圍只需建立一次，重新詢問時直接沿用
+    num_choices = len(choices)
+    prompt_text = f"\n請輸入數字選項 (1-{num_choices})"
+
+    # 交由 click 驗證輸入範圍，輸入無效時會自動提示並重新詢問
+    try:
+        idx = click.prompt(prompt_text, type=click.IntRange(1, num_choices), show_choices=False)
+    except click.Abort:
+        # 使用者按了 Ctrl+C 或 Ctrl+D
+        return None
+
+    return choices[idx - 1]
 
 
 def edit_commit_message(initial_message: str = "") -> tuple[str, bool]:
@@ -79,6 +104,9 @@ def edit_commit_message(initial_message: str = "") -> tuple[str, bool]:
     Returns:
         tuple[str, bool]: (編輯後的訊息，是否確認提交)
     """
+    # questionary 會載入整個 prompt_toolkit，只有在使用者選擇編輯時才需要
+    import questionary
+
     while True:
         message = questionary.text(
             "請輸入/編輯 commit message：",
@@ -89,11 +117,10 @@ def edit_commit_message(initial_message: str = "") -> tuple[str, bool]:
         if message is None:  # 使用者按了 Ctrl+C
             return "", False
 
-        # 確認訊息
-        console.print("\n您輸入的 commit message：")
-        console.print("=" * 50)
-        console.print(f"[blue]{message}[/blue]")
-        console.print("=" * 50)
+        # 確認訊息，以單一 panel 一次輸出
+        console.print(
+            Panel(Text(message, style="blue"), title="您輸入的 commit message", border_style="blue")
+        )
 
         if questionary.confirm("確認使用這個 message？").ask():
             return message, True
@@ -152,11 +179,10 @@ def update_commit_message(commit_msg_file: str, ai_message: str) -> tuple[int, b
             return ExitCode.ERROR.value, need_regenerate
 
         # 去除頭尾的 ``` 符號
-        final_message = final_message.strip().strip("`")
+        final_message = _TRIM_PATTERN.sub("", final_message)
 
         # 寫入 commit message
-        with open(commit_msg_file, "w", encoding="utf-8") as f:
-            f.write(final_message)
+        Path(commit_msg_file).write_text(final_message, encoding="utf-8")
 
         console.print("[green]✓[/green] Commit message 已更新")
         return ExitCode.SUCCESS.value, need_regenerate
@@ -192,22 +218,23 @@ def commit(commit_msg_file: str, repo_path: str) -> int:
         load_config(repo_path)
 
         # 判斷設定中是否要執行 commit assistant
-        enable_commit_assistant = os.getenv("ENABLE_COMMIT_ASSISTANT", "true").lower() == "true"
-
-        if not enable_commit_assistant:
+        if not _is_commit_assistant_enabled():
             sys.exit(ExitCode.SUCCESS.value)
 
         git_command_runner = GitCommandRunner(repo_path)
 
-        # 獲取變更資訊
+        # 獲取變更資訊，暫存的檔案列表與 diff 內容同時讀取
         with loading_spinner("分析 Git 變更"):
-            changed_files = git_command_runner.get_staged_files()
-            if not changed_files:
-                console.print("[yellow] 沒有發現暫存的變更 [/yellow]")
-                sys.exit(ExitCode.CANCEL.value)
+            changed_files, diff_content = git_command_runner.get_staged_changes(_MAX_DIFF_BYTES)
+
+        if not changed_files:
+            console.print("[yellow] 沒有發現暫存的變更 [/yellow]")
+            sys.exit(ExitCode.CANCEL.value)
 
-        # 獲取 diff 內容
-        diff_content = git_command_runner.get_staged_diff()
+        if not diff_content.strip():
+            # 沒有任何 diff 內容時，不需要建立 generator 與呼叫 AI
+            console.print("[yellow] 暫存的變更沒有任何 diff 內容 [/yellow]")
+            sys.exit(ExitCode.CANCEL.value)
 
         # 生成 commit message
         generator = EnhancedCommitGenerator()
@@ -219,7 +246,7 @@ def commit(commit_msg_file: str, repo_path: str) -> int:
 
             if not response:
                 console.print("[red]✗[/red] 生成 commit message 失敗")
-                sys.exit(ExitCode.ERROR)
+                sys.exit(ExitCode.ERROR.value)
 
             # 更新 commit message
             exit_code, need_regenerate = update_commit_message(commit_msg_file, response)
@@ -230,7 +257,7 @@ def commit(commit_msg_file: str, repo_path: str) -> int:
             console.print("[blue] 重新生成 commit message... [/blue]")
     except KeyboardInterrupt:
         console.print("\n[yellow] 操作已取消 [/yellow]")
-        sys.exit(ExitCode.CANCEL)
+        sys.exit(ExitCode.CANCEL.value)
     except Exception as e:
         console.print(f"[red] 錯誤：{str(e)}[/red]")
-        sys.exit(ExitCode.ERROR)
+        sys.exit(ExitCode.ERROR.value)
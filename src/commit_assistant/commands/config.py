@@ -25,13 +25,9 @@ def setup(key: str) -> None:
     """設定 Google Gemini API Key"""
     try:
         # 寫入 key 到.env 文件
-        env_file = ProjectPaths.PACKAGE_DIR / ".env"
-
-        if not env_file.exists():
-            env_file.touch()
-
-        with open(env_file, "w") as f:
-            f.write(f"GEMINI_API_KEY={key}\n")
+        # write_bytes 會自動建立不存在的檔案，不需要事先 touch
+        env_file = ProjectPaths.get_env_file()
+        env_file.write_bytes(f"GEMINI_API_KEY={key}\n".encode("utf-8"))
 
         console.print("[green]✓[/green] API Key 已成功保存")
         console.print("\n您可以使用以下命令來確認設定：")
@@ -47,25 +43,29 @@ def show() -> None:
     """顯示當前配置"""
     load_config()
 
+    # 迴圈外先取出常用的值，避免每次迭代都重複查詢
+    env = os.environ
+    api_key_name = ConfigKey.GEMINI_API_KEY.value
+
     for config_member in ConfigKey:
-        if config_member.value == ConfigKey.GEMINI_API_KEY.value:
+        name = config_member.value
+        if name == api_key_name:
             # 對於敏感信息，只顯示部分內容
-            api_key = os.getenv(ConfigKey.GEMINI_API_KEY.value)
+            api_key = env.get(name)
 
             if api_key is None:
-                console.print(f"{config_member.value}: [yellow] 未配置 [/yellow]")
+                console.print(f"{name}: [yellow] 未配置 [/yellow]")
             else:
                 console.print(_mask_api_key(api_key))
         else:
-            config_member_value = os.getenv(config_member.value)
-            console.print(f"{config_member.value}: {config_member_value}")
+            console.print(f"{name}: {env.get(name)}")
 
 
 @config.command()
 def clear() -> None:
     """清除所有配置"""
     # 判斷.env 文件是否存在，存在則刪除
-    env_file = ProjectPaths.PACKAGE_DIR / ".env"
+    env_file = ProjectPaths.get_env_file()
     if env_file.exists():
         if click.confirm("確定要清除所有配置嗎？"):
             env_file.unlink()
@@ -1,17 +1,27 @@
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 import click
-import questionary
-import yaml
-from rich.text import Text
+from rich.markup import escape
 
 from commit_assistant.core.paths import ProjectPaths
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.enums.commit_style import StyleScope
 from commit_assistant.utils.console_utils import console
-from commit_assistant.utils.style_utils import CommitStyleManager, StyleImporter
+from commit_assistant.utils.style_cache import StyleDescriptionCache
+from commit_assistant.utils.style_utils import CommitStyleManager, StyleImporter, _safe_load_yaml
+from commit_assistant.utils.upgrade_checker import UpgradeChecker
+
+# style 檔案的副檔名
+_STYLE_SUFFIX = ".yaml"
+
+# style 檔案超過此數量時，才改用多執行緒解析，避免建立執行緒池的成本大於解析本身
+_PARALLEL_THRESHOLD = 4
+_MAX_PARSE_WORKERS = 8
 
 
 def _validate_yaml(ctx: Optional[click.Context], param: Optional[click.Parameter], value: str) -> Path:
@@ -20,34 +30,105 @@ def _validate_yaml(ctx: Optional[click.Context], param: Optional[click.Parameter
     return Path(value)
 
 
-def _print_all_styles(dir: Path) -> None:
-    """讀取該目錄下的所有 style 檔案並列印"""
-    found_file = False
+def _read_description(content: Union[str, bytes]) -> Any:
+    """從 style 內容中取出 description 欄位
+
+    完整解析整份內容，合併鍵 (<<)、重複的鍵與格式錯誤都與載入 style 時的結果一致，
+    重複解析的成本交由 description 快取避免
+
+    Args:
+        content (Union[str, bytes]): style yaml 的內容
+
+    Returns:
+        Any: description 的內容，沒有設定時回傳「無描述」
+    """
+    return _safe_load_yaml(content).get("description", "無描述")
+
+
+def _load_description(entry: os.DirEntry, cache: Optional[StyleDescriptionCache]) -> Optional[str]:
+    """取得單一 style 檔案的 description
 
-    for yaml_file in dir.glob("*.yaml"):
-        found_file = True
-        try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                style_name = yaml_file.stem
+    Args:
+        entry (os.DirEntry): style 檔案
+        cache (Optional[StyleDescriptionCache]): description 快取
 
-                style_data = yaml.safe_load(f)
-                description = style_data.get("description", "無描述")
+    Returns:
+        Optional[str]: style 的 description，讀取失敗時回傳 None
+    """
+    try:
+        stat = entry.stat()
+        description = cache.get(entry.path, stat) if cache is not None else None
+
+        if description is None:
+            # 一次讀出整個檔案的 bytes，直接交由 yaml 解析，省去文字模式的解碼
+            with open(entry.path, "rb") as f:
+                description = str(_read_description(f.read()))
+
+            if cache is not None:
+                cache.set(entry.path, stat, description)
+
+        return description
+    except Exception:
+        return None
 
-                # 使用 rich Text 來避免英文的描述文字無法被 rich 正確解析
-                text = Text()
-                text.append(f"  - {style_name}  ")
-                text.append(f"[{description}]", style="blue")
-                console.print(text)
-        except Exception:
-            console.print(f"  - {yaml_file.stem} [red] 讀取失敗 [/red]")
 
-    if not found_file:
+def _print_all_styles(dir: Path, cache: Optional[StyleDescriptionCache] = None) -> None:
+    """讀取該目錄下的所有 style 檔案並列印
+
+    Args:
+        dir (Path): style 檔案所在的目錄
+        cache (Optional[StyleDescriptionCache]): description 快取，沒有傳入時每次都重新解析
+    """
+    # 使用 os.scandir 一次取得目錄內容，目錄不存在時視為沒有任何 style
+    # 同時略過隱藏檔 (例如編輯器產生的 .xxx.yaml 暫存檔)
+    try:
+        with os.scandir(dir) as entries:
+            style_files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(_STYLE_SUFFIX) and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        style_files = []
+
+    if not style_files:
         console.print("  - [red] 尚無可用的 style[/red]")
+        return
+
+    # 各檔案的解析互不相關，檔案較多時交由執行緒池同時處理
+    if len(style_files) > _PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(style_files))) as executor:
+            descriptions = [*executor.map(partial(_load_description, cache=cache), style_files)]
+    else:
+        descriptions = [_load_description(entry, cache) for entry in style_files]
+
+    # 依照原本的順序輸出
+    for entry, description in zip(style_files, descriptions):
+        # 前面已經過濾出 .yaml 結尾的檔案，直接切掉副檔名即可
+        style_name = entry.name[: -len(_STYLE_SUFFIX)]
+
+        if description is None:
+            console.print(f"  - {style_name} [red] 讀取失敗 [/red]")
+            continue
+
+        # 描述文字先跳脫，避免內容中的 [] 被 rich 當成 markup 解析
+        # 關閉 highlight，省去 rich 對每一行做語法上色的成本
+        console.print(f"  - {escape(style_name)}  [blue]\\[{escape(description)}][/blue]", highlight=False)
+
+
+# 不需要檢查更新的子命令，只是讀取本地的風格列表
+_SKIP_UPGRADE_CHECK_COMMANDS = ("list",)
 
 
 @click.group()
-def style() -> None:
+@click.pass_context
+def style(ctx: click.Context) -> None:
     """管理 commit message 使用的風格"""
+    if ctx.invoked_subcommand in _SKIP_UPGRADE_CHECK_COMMANDS:
+        return
+
+    # 在背景執行版本檢查，不等待檢查結果，有新版本時於命令結束後才提示
+    ctx.call_on_close(UpgradeChecker().start_background_check())
 
 
 @style.command()
@@ -61,25 +142,23 @@ def list(repo_path: str) -> None:
     """列出所有可用的風格"""
     console.print("可用的風格：")
 
+    # 目錄不存在時不需要另外檢查，掃描結果為空時會直接提示尚無可用的 style
+    # 沒有變動的 style 檔案直接使用上次解析的 description
+    cache = StyleDescriptionCache()
+
     # 列出系統內建的 style
     console.print(f"[cyan]{StyleScope.SYSTEM.value}風格:[/cyan]")
-    system_style_dir = ProjectPaths.STYLE_DIR / "system"
-    if system_style_dir.exists():
-        _print_all_styles(system_style_dir)
+    _print_all_styles(ProjectPaths.STYLE_DIR / "system", cache)
 
     # 使用者全域設定的 style
     console.print(f"[green]{StyleScope.GLOBAL.value}風格:[/green]")
-    global_style_dir = ProjectPaths.STYLE_DIR / "global"
-    if global_style_dir.exists():
-        _print_all_styles(global_style_dir)
+    _print_all_styles(ProjectPaths.STYLE_DIR / "global", cache)
 
     # 專案內設定的 style
     console.print(f"[yellow]{StyleScope.PROJECT.value}風格:[/yellow]")
-    project_style_dir = Path(repo_path).absolute() / ProjectInfo.REPO_ASSISTANT_DIR / "style"
-    if project_style_dir.exists():
-        _print_all_styles(project_style_dir)
-    else:
-        console.print("  - [red] 尚無可用的 style[/red]")
+    _print_all_styles(Path(repo_path).absolute() / ProjectInfo.REPO_ASSISTANT_DIR / "style", cache)
+
+    cache.save()
 
 
 @style.command()
@@ -101,8 +180,10 @@ def template(output: str) -> None:
     output_path = Path(output).absolute()
 
     # 將檔案複製到指定目錄
+    # 只複製內容，不沿用套件內檔案的權限，讓使用者可以直接編輯
+    # copyfile 在支援的平台上會使用 os.sendfile 等方式直接在核心中複製
     output_file = output_path / ProjectInfo.STYLE_TEMPLATE_NAME
-    shutil.copy(template_path, output_file)
+    shutil.copyfile(template_path, output_file)
 
     console.print(f"[green]✓ 成功將 style 模板複製到：{output_file}[/green]")
 
@@ -111,10 +192,11 @@ def template(output: str) -> None:
 @click.argument("style-file", type=click.Path(exists=True), callback=_validate_yaml)
 @click.option("--name", "-n", help="custom style name, if not set, use the file name")
 @click.option("--global", "-g", "global_", is_flag=True, help="need import style as global template")
-def add(style_file: str, name: Optional[str], global_: bool) -> None:
+def add(style_file: Path, name: Optional[str], global_: bool) -> None:
     """匯入風格 yaml 檔"""
     try:
-        style_importer = StyleImporter(Path(style_file), name, global_)
+        # style_file 已經由 _validate_yaml 轉換為 Path
+        style_importer = StyleImporter(style_file, name, global_)
         style_importer.start_import()
     except Exception as e:
         console.print(f"[red] 錯誤：{e}[/red]")
@@ -144,7 +226,7 @@ def remove(name: str, global_: bool) -> None:
         style_folder_dir = ProjectPaths.STYLE_DIR / "global"
     else:
         scope = StyleScope.PROJECT.value
-        style_folder_dir = Path(".").absolute() / ProjectInfo.REPO_ASSISTANT_DIR / "style"
+        style_folder_dir = Path.cwd() / ProjectInfo.REPO_ASSISTANT_DIR / "style"
 
     try:
         style_path = style_folder_dir / f"{name}.yaml"
@@ -156,6 +238,9 @@ def remove(name: str, global_: bool) -> None:
             console.print("請確認風格名稱是否正確，或者指定的層級是否正確")
             return
 
+        # questionary 會載入整個 prompt_toolkit，只有確認刪除時才需要
+        import questionary
+
         if questionary.confirm(f"確定要刪除 [{scope}] 風格 '{name}' 嗎？").ask():
             style_path.unlink()
             console.print(f"[green]✓ 成功刪除 {scope}風格 '{name}'[/green]")
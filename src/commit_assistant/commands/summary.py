@@ -1,9 +1,9 @@
+import re
 import sys
 from datetime import datetime, timedelta
 from typing import Optional
 
 import click
-import pyperclip
 
 from commit_assistant.core.base_generator import BaseGeminiAIGenerator
 from commit_assistant.enums.exit_code import ExitCode
@@ -11,6 +11,20 @@ from commit_assistant.utils.command_runners import GitCommandRunner
 from commit_assistant.utils.config_utils import load_config
 from commit_assistant.utils.console_utils import console, display_ai_message, loading_spinner
 
+# 支援的日期格式，依照常用程度排序
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y.%m.%d",
+    "%Y%m%d",
+    "%d-%m-%Y",
+)
+
+# 以年開頭、使用 - / . 分隔的日期 (可選擇加上時間)，可直接由 regex 解析，不需要逐一嘗試 strptime
+_DATE_PATTERN = re.compile(r"(\d{4})([-/.])(\d{1,2})\2(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?")
+
 
 class CommitSummaryGenerator(BaseGeminiAIGenerator):
     def generate_commit_summary(
@@ -83,18 +97,18 @@ def _parse_date(date_str: Optional[str]) -> datetime:
             pass
 
     # 如果不是上述的特殊日期，則進行日期格式解析
-    # 以下是支援的日期格式
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%Y.%m.%d",
-        "%Y%m%d",
-        "%d-%m-%Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y/%m/%d %H:%M:%S",
-    ]
-
-    for fmt in formats:
+    # 大部分的輸入都是以年開頭的日期，先以 regex 直接解析
+    match = _DATE_PATTERN.fullmatch(date_str)
+    if match is not None and not (match.group(2) == "." and match.group(5) is not None):
+        year, _, month, day, hour, minute, second = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0)
+            )
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -134,9 +148,6 @@ def summary(start_from: Optional[str], end_to: Optional[str], author: Optional[s
         author (str): 作者名稱，預設為 None(不篩選作者)
         repo_path (str): git repository 路徑
     """
-    # 載入環境設定
-    load_config(repo_path)
-
     start_dt = _parse_date(start_from)
     end_dt = _parse_date(end_to)
 
@@ -155,6 +166,9 @@ def summary(start_from: Optional[str], end_to: Optional[str], author: Optional[s
         console.print(f"[yellow]{start_dt} ~ {end_dt} 範圍內沒有找到符合條件的 commit message[/yellow]")
         sys.exit(ExitCode.CANCEL)
 
+    # 確定有 commit 需要摘要後才載入環境設定，查詢 commit 本身不需要任何設定
+    load_config(repo_path)
+
     with loading_spinner("正在產生 commit 摘要"):
         # 透過 AI 進行摘要
         summary_generator = CommitSummaryGenerator()
@@ -166,6 +180,9 @@ def summary(start_from: Optional[str], end_to: Optional[str], author: Optional[s
 
     # 將摘要複製到剪貼簿
     try:
+        # 只有成功產生摘要時才需要剪貼簿功能，延遲載入
+        import pyperclip
+
         pyperclip.copy(summary)
         console.print("[green]✓[/green] 摘要已複製到剪貼簿")
 
@@ -1,12 +1,43 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
 import click
+from rich.markup import escape
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 from commit_assistant.utils.console_utils import console
 from commit_assistant.utils.installation_manager import InstallationManager
 from commit_assistant.utils.update_utils import UpdateManager
 
+# 同時更新專案的最大數量
+_MAX_UPDATE_WORKERS = 8
+
+
+def _update_repo(repo_path: Path) -> Optional[Exception]:
+    """更新單一專案
+
+    會在背景執行緒中執行，更新過程中的訊息不直接輸出，避免多個專案的訊息交錯，
+    所有專案的結果會在更新完成後統一以表格呈現
+
+    Args:
+        repo_path (Path): 要更新的專案路徑
+
+    Returns:
+        Optional[Exception]: 更新失敗時的錯誤，成功時回傳 None
+    """
+    # rich 的 capture 是以執行緒為單位，不會攔截到其他執行緒的輸出
+    with console.capture():
+        try:
+            update_manager = UpdateManager(repo_path)
+            update_manager.update()
+        except Exception as e:
+            return e
+
+    return None
+
 
 def _update_all_repos() -> None:
     """更新所有專案底下的相關檔案"""
@@ -21,21 +52,42 @@ def _update_all_repos() -> None:
         return
 
     console.print(f"[yellow][bold] 找到 {len(installations)} 個已安裝的專案 [/bold][/yellow]")
-    for installation in installations:
-        repo_path = Path(installation["repo_path"])
-
-        console.print(f"[yellow] 開始更新專案：{repo_path}...[/yellow]")
-
-        try:
-            update_manager = UpdateManager(repo_path)
-            update_manager.update()
-        except Exception as e:
-            console.print(f"[red] 更新失敗{repo_path}，錯誤：{str(e)}[/red]")
+    repo_paths = [Path(installation["repo_path"]) for installation in installations]
+
+    # 各個專案的更新互不相關，同時進行更新，更新期間只顯示進度條
+    errors: List[Optional[Exception]] = []
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("更新專案中", total=len(repo_paths))
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_UPDATE_WORKERS, len(repo_paths))) as executor:
+            for error in executor.map(_update_repo, repo_paths):
+                errors.append(error)
+                progress.advance(task)
+
+    # 依照原本的順序整理結果，最後一次輸出
+    # 安裝紀錄只在主執行緒中寫入，避免同時寫入同一個檔案
+    table = Table(title=f"已更新 {len(repo_paths)} 個專案")
+    table.add_column("Repo")
+    table.add_column("Status")
+    table.add_column("Detail")
+
+    for repo_path, error in zip(repo_paths, errors):
+        if error is not None:
+            table.add_row(escape(str(repo_path)), "[red]✗ 更新失敗[/red]", escape(str(error)))
             continue
 
         # 更新成功，紀錄該 repo 的安裝訊息
         installation_manager.add_installation(repo_path)
+        table.add_row(escape(str(repo_path)), "[green]✓ 成功[/green]", "")
 
+    console.print(table)
     console.print("[green] 所有專案底下的相關檔案更新完成!![/green]\n")
 
 
@@ -6,12 +6,17 @@ from commit_assistant.utils.console_utils import console
 from commit_assistant.utils.upgrade_checker import UpgradeChecker
 
 
-def _upgrade(yes: bool) -> None:
-    """更新 commit assistant 至最新版本"""
+def _upgrade(yes: bool, force: bool = False) -> None:
+    """更新 commit assistant 至最新版本
+
+    Args:
+        yes (bool): 是否自動確認更新
+        force (bool, optional): 是否忽略快取，強制向 GitHub 查詢最新版本。Defaults to False.
+    """
     # 先檢查是否真的需要更新
     checker = UpgradeChecker()
 
-    newest_version = checker.check_for_updates_version()
+    newest_version = checker.check_for_updates_version(force=force)
 
     if not newest_version:
         console.print(f"[green] 目前已是最新版本。當前版本：[cyan]{ProjectInfo.VERSION}[/cyan][/green]")
@@ -45,20 +50,22 @@ def _upgrade(yes: bool) -> None:
 
 @click.group(invoke_without_command=True)
 @click.option("--yes", "-y", is_flag=True, help="auto confirm")
+@click.option("--force", "-f", is_flag=True, help="ignore cached version and check GitHub directly")
 @click.pass_context
-def upgrade(ctx: click.Context, yes: bool = False) -> None:
+def upgrade(ctx: click.Context, yes: bool = False, force: bool = False) -> None:
     """更新 commit assistant 至最新版本"""
     # 如果沒有其他子命令，則執行更新
     if ctx.invoked_subcommand is None:
-        _upgrade(yes)
+        _upgrade(yes, force)
 
 
 @upgrade.command()
-def check() -> None:
+@click.option("--force", "-f", is_flag=True, help="ignore cached version and check GitHub directly")
+def check(force: bool = False) -> None:
     """檢查更新"""
     checker = UpgradeChecker()
 
-    newest_version = checker.check_for_updates_version()
+    newest_version = checker.check_for_updates_version(force=force)
 
     if newest_version:
         checker.print_update_message(newest_version)
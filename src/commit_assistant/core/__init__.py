@@ -12,9 +12,29 @@
 3. 共用類別的重用性
 """
 
-from .base_generator import BaseGeminiAIGenerator
-from .paths import ProjectPaths
-from .project_config import ProjectInfo
-from .pyproject_config import generate_toml_config
+import importlib
+from typing import Any, List
+
+# 名稱 -> 所在的子模組，第一次存取時才載入 (PEP 562)
+# 避免只需要 ProjectInfo / ProjectPaths 時，也要載入 AI 生成器與其相依套件
+_LAZY_ATTRS = {
+    "BaseGeminiAIGenerator": ".base_generator",
+    "ProjectPaths": ".paths",
+    "ProjectInfo": ".project_config",
+    "generate_toml_config": ".pyproject_config",
+}
 
 __all__ = ["BaseGeminiAIGenerator", "ProjectPaths", "ProjectInfo", "generate_toml_config"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
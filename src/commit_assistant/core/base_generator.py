@@ -6,32 +6,53 @@
 
 import os
 import subprocess
-from typing import Optional
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
 from commit_assistant.enums.config_key import ConfigKey
 from commit_assistant.enums.default_value import DefaultValue
 from commit_assistant.utils.console_utils import console
 from commit_assistant.utils.style_utils import CommitStyleManager
 
+if TYPE_CHECKING:
+    from google.genai import Client
+
 
 class BaseGeminiAIGenerator:
     """建立一個 AI Generator 的基類，支援 Gemini API 和 Claude CLI"""
 
+    # 同一次執行中，所有 generator 共用同一個風格管理器
+    _style_manager: Optional[CommitStyleManager] = None
+    _style_manager_lock = threading.Lock()
+
+    @classmethod
+    def _get_style_manager(cls) -> CommitStyleManager:
+        """取得共用的風格管理器，第一次使用時才建立"""
+        with BaseGeminiAIGenerator._style_manager_lock:
+            if BaseGeminiAIGenerator._style_manager is None:
+                BaseGeminiAIGenerator._style_manager = CommitStyleManager()
+            return BaseGeminiAIGenerator._style_manager
+
     def __init__(self) -> None:
         self._use_claude_cli = os.getenv(ConfigKey.USE_CLAUDE_CLI.value, "false").lower() == "true"
 
-        if not self._use_claude_cli:
-            from google import genai
+        # 只先檢查 API key 是否存在，讓錯誤能盡早被發現
+        # 實際的 client 會在第一次生成內容時才建立
+        self._api_key = os.getenv("GEMINI_API_KEY")
+        if not self._use_claude_cli and self._api_key is None:
+            console.print("[yellow] 檢測到尚未設定 Gemini api key [/yellow]")
+            raise ValueError("請先執行 commit-assistant config setup 設定 API 金鑰")
 
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key is None:
-                console.print("[yellow] 檢測到尚未設定 Gemini api key [/yellow]")
-                raise ValueError("請先執行 commit-assistant config setup 設定 API 金鑰")
+        self.model = os.getenv(str(ConfigKey.USE_MODEL.value), DefaultValue.DEFAULT_MODEL.value)
+        self.style_manager = self._get_style_manager()
 
-            self.client = genai.Client(api_key=api_key)
+    @cached_property
+    def client(self) -> "Client":
+        """Gemini API client，第一次使用時才載入 google.genai 並建立"""
+        from google import genai
 
-        self.model = os.getenv(str(ConfigKey.USE_MODEL.value), DefaultValue.DEFAULT_MODEL.value)
-        self.style_manager = CommitStyleManager()
+        return genai.Client(api_key=self._api_key)
 
     def _generate_content(self, prompt: str) -> Optional[str]:
         try:
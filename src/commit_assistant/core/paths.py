@@ -16,13 +16,16 @@
 from pathlib import Path
 from typing import Any, Final
 
+# 本檔案所在位置的各層上層目錄，只需計算一次
+_PARENTS = Path(__file__).parents
+
 
 class ProjectPaths:
     # 取得專案根目錄
-    ROOT_DIR: Final[Path] = Path(__file__).parent.parent.parent.parent
+    ROOT_DIR: Final[Path] = _PARENTS[3]
 
     # 套件相關路徑
-    PACKAGE_DIR: Final[Path] = Path(__file__).parent.parent
+    PACKAGE_DIR: Final[Path] = _PARENTS[1]
     RESOURCES_DIR: Final[Path] = PACKAGE_DIR / "resources"
 
     # 配置相關路徑
@@ -51,3 +54,8 @@ class ProjectPaths:
     def get_config_template(cls, name: str) -> Path:
         """取得設定檔模板路徑"""
         return cls.CONFIG_DIR / name
+
+    @classmethod
+    def get_env_file(cls) -> Path:
+        """取得儲存 API Key 等個人設定的 .env 檔案路徑"""
+        return cls.PACKAGE_DIR / ".env"
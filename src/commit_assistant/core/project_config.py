@@ -13,40 +13,41 @@
 3. 版本控制與更新檢查
 """
 
-from enum import Enum
-from typing import List
+from typing import Final, List, Tuple
 
 
 class ProjectInfo:
-    NAME: str = "commit-assistant"
-    VERSION: str = "0.1.15"
-    DESCRIPTION: str = "Commit Assistant - 一個幫助你更好寫 commit message 的 CLI 工具"
-    PYTHON_REQUIRES: str = ">=3.10"
-    LICENSE: str = "Apache-2.0"
+    NAME: Final[str] = "commit-assistant"
+    VERSION: Final[str] = "0.1.15"
+    DESCRIPTION: Final[str] = "Commit Assistant - 一個幫助你更好寫 commit message 的 CLI 工具"
+    PYTHON_REQUIRES: Final[str] = ">=3.10"
+    LICENSE: Final[str] = "Apache-2.0"
 
     # 專案的相依套件
-    class Dependencies(Enum):
-        CLICK = "click>=8.0.0"
-        PYTHON_DOTENV = "python-dotenv>=1.0.1"
-        GOOGLE_GENAI = "google-genai>=1.50.0"
-        QUESTIONARY = "questionary>=2.1.0"
-        RICH = "rich>=13.9.4"
-        PYPERCLIP = "pyperclip>=1.9.0"
-        TOMLI = "tomli>=2.2.1"
-        TOMLW = "tomli-w>=1.2.0"
-        YAML = "PyYAML>=6.0.2"
-        REQUEST = "requests>=2.32.3"
-        PACKAGING = "packaging>=24.2"
+    DEPENDENCIES: Final[Tuple[str, ...]] = (
+        "click>=8.0.0",
+        "python-dotenv>=1.0.1",
+        "google-genai>=1.50.0",
+        "questionary>=2.1.0",
+        "rich>=13.9.4",
+        "pyperclip>=1.9.0",
+        "tomli>=2.2.1",
+        "tomli-w>=1.2.0",
+        "PyYAML>=6.0.2",
+        "requests>=2.32.3",
+        "packaging>=24.2",
+    )
 
     # 專案開發的相依套件
     # 僅有開發時才需要的套件
-    class DevDependencies(Enum):
-        PRE_COMMIT = "pre-commit>=4.1.0"
-        PYTEST = "pytest>=8.3.4"
-        PYTEST_COV = "pytest-cov>=6.0.0"
-        YAML_TYPE = "types-PyYAML>=6.0.12.20241230"
-        REQUEST_TYPE = "types-requests>=2.32.0.20241016"
-        FREEZEGUN = "freezegun>=1.5.1"
+    DEV_DEPENDENCIES: Final[Tuple[str, ...]] = (
+        "pre-commit>=4.1.0",
+        "pytest>=8.3.4",
+        "pytest-cov>=6.0.0",
+        "types-PyYAML>=6.0.12.20241230",
+        "types-requests>=2.32.0.20241016",
+        "freezegun>=1.5.1",
+    )
 
     # 專案的 GitHub Repo URL
     GITHUB_REPO_URL = "git+https://github.com/OrarioGit/Commit-Assistant.git"
@@ -99,12 +100,22 @@ class ProjectInfo:
     # 用來記錄上次檢查更新的時間檔名
     UPGRADE_CHECK_FILE = "latest_upgrade_check"
 
+    # 用來快取各個 style 檔案 description 的檔名
+    STYLE_CACHE_FILE = "style_description_cache.json"
+
+    # 用來快取 GitHub Release Tag 查詢結果 (ETag 等) 的檔名
+    RELEASE_TAGS_CACHE_FILE = "release_tags_cache.json"
+
     # unit test 相關
     TEST_DIRS = ["commit-assistant"]
     TEST_COMMAND = (
         "--cov=commit_assistant --cov-branch --cov-report=term-missing --cov-report=html --cov-report=xml -v"
     )
 
+    # pytest 搜尋測試的目錄
+    # 只在測試目錄中搜尋，不需要走訪整個專案
+    TEST_PATHS: Final[Tuple[str, ...]] = ("tests",)
+
     # 要忽略的檔案
     OMIT_FILES = [
         "tests/*",
@@ -122,10 +133,13 @@ class ProjectInfo:
 
     @classmethod
     def get_dependencies(cls) -> List[str]:
-        """取得專案的相依套件清單"""
-        return [dep.value for dep in cls.Dependencies]
+        """取得專案的相依套件清單
+
+        每次回傳新的 list，避免呼叫端修改到共用的設定
+        """
+        return list(cls.DEPENDENCIES)
 
     @classmethod
     def get_dev_dependencies(cls) -> List[str]:
         """取得專案的開發相依套件清單"""
-        return [dep.value for dep in cls.DevDependencies]
+        return list(cls.DEV_DEPENDENCIES)
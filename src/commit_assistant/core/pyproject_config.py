@@ -30,7 +30,12 @@ def generate_toml_config() -> Dict[str, Any]:
                     }
                 },
             },
-            "pytest": {"ini_options": {"addopts": ProjectInfo.TEST_COMMAND}},
+            "pytest": {
+                "ini_options": {
+                    "testpaths": list(ProjectInfo.TEST_PATHS),
+                    "addopts": ProjectInfo.TEST_COMMAND,
+                }
+            },
             "coverage": {
                 "run": {"source": ProjectInfo.TEST_DIRS, "omit": ProjectInfo.OMIT_FILES},
                 "report": {
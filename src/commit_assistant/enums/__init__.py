@@ -1,9 +1,29 @@
 """Commit Assistant 相關的枚舉類型"""
 
-from .commit_style import CommitStyle, StyleScope
-from .config_key import ConfigKey
-from .default_value import DefaultValue
-from .exit_code import ExitCode
-from .user_choices import UserChoices
+import importlib
+from typing import Any, List
+
+# 名稱 -> 所在的子模組，第一次存取時才載入 (PEP 562)
+_LAZY_ATTRS = {
+    "ExitCode": ".exit_code",
+    "UserChoices": ".user_choices",
+    "ConfigKey": ".config_key",
+    "CommitStyle": ".commit_style",
+    "StyleScope": ".commit_style",
+    "DefaultValue": ".default_value",
+}
 
 __all__ = ["ExitCode", "UserChoices", "ConfigKey", "CommitStyle", "StyleScope", "DefaultValue"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
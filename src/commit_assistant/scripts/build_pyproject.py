@@ -26,8 +26,19 @@ def update_pyproject_toml() -> None:
     project_root = ProjectPaths.ROOT_DIR
     toml_path = project_root / "pyproject.toml"
 
+    # 先在記憶體中產生完整內容，再一次寫入檔案
+    content = tomli_w.dumps(config).encode("utf-8")
+
+    # 內容沒有變動時不需要重新寫入
+    try:
+        with open(toml_path, "rb") as f:
+            if f.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+
     with open(toml_path, "wb") as f:
-        tomli_w.dump(config, f)
+        f.write(content)
 
 
 if __name__ == "__main__":  # pragma: no cover
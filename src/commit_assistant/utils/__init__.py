@@ -1,12 +1,23 @@
 """Commit Assistant 相關的工具模組"""
 
-from .command_runners import CommandRunner, GitCommandRunner
-from .config_utils import install_config, load_config
-from .console_utils import console
-from .hook_manager import HookManager
-from .style_utils import CommitStyleManager, StyleImporter
-from .update_utils import UpdateManager
-from .upgrade_checker import UpgradeChecker
+import importlib
+from typing import Any, List
+
+# 名稱 -> 所在的子模組，第一次存取時才載入 (PEP 562)
+# 避免只需要其中一個工具時，也要載入 git、hook、更新等所有模組與其相依套件
+_LAZY_ATTRS = {
+    "console": ".console_utils",
+    "CommitStyleManager": ".style_utils",
+    "CommandRunner": ".command_runners",
+    "GitCommandRunner": ".command_runners",
+    "load_config": ".config_utils",
+    "install_config": ".config_utils",
+    "HookManager": ".hook_manager",
+    "UpdateManager": ".update_utils",
+    "StyleImporter": ".style_utils",
+    "StyleDescriptionCache": ".style_cache",
+    "UpgradeChecker": ".upgrade_checker",
+}
 
 __all__ = [
     "console",
@@ -18,5 +29,19 @@ __all__ = [
     "HookManager",
     "UpdateManager",
     "StyleImporter",
+    "StyleDescriptionCache",
     "UpgradeChecker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
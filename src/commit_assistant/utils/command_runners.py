@@ -1,22 +1,57 @@
+import codecs
 import locale
 import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional, Tuple, cast
 
 from commit_assistant.utils.console_utils import console
 
 
+def _resolve_system_encoding() -> str:
+    """取得執行命令時使用的編碼"""
+    if sys.platform == "win32":
+        return "utf-8"
+    return locale.getpreferredencoding()
+
+
+# 執行期間編碼不會改變，載入模組時取得一次即可，不需要每次建立 runner 都重新查詢
+_SYSTEM_ENCODING = _resolve_system_encoding()
+
+# 執行命令時指定的語系，Windows 上 git 的輸出編碼由 i18n 設定決定，不需要另外指定
+_COMMAND_LANG: Optional[str] = None if sys.platform == "win32" else f"zh_TW.{_SYSTEM_ENCODING}"
+
+# 逐段讀取命令輸出時，每次讀取的大小
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class CommandRunner:
     """通用的 command runner 基類"""
 
-    def __init__(self) -> None:
-        if sys.platform == "win32":
-            self.system_encoding = "utf-8"
-        else:
-            self.system_encoding = locale.getpreferredencoding()
+    system_encoding: str = _SYSTEM_ENCODING
+
+    def _build_env(self, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """建立執行命令時使用的環境變數
+
+        Args:
+            env (Optional[Dict[str, str]]): 額外的環境變數
+
+        Returns:
+            Dict[str, str]: 目前的環境變數加上額外的環境變數與編碼設定
+        """
+        my_env = os.environ.copy()
+        if env:
+            my_env.update(env)
+
+        my_env["PYTHONIOENCODING"] = self.system_encoding
+        if _COMMAND_LANG is not None:
+            my_env["LANG"] = _COMMAND_LANG
+
+        return my_env
 
     def run_command(
         self, cmd: List[str], cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None
@@ -32,29 +67,19 @@ class CommandRunner:
             str: 命令執行結果
         """
         try:
-            my_env = os.environ.copy()
-            if env:
-                my_env.update(env)
-
-            my_env["PYTHONIOENCODING"] = self.system_encoding
-            my_env["LANG"] = f"zh_TW.{self.system_encoding}"
-
-            process = subprocess.Popen(
+            result = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                capture_output=True,
                 cwd=cwd,
-                env=my_env,
+                env=self._build_env(env),
                 encoding=self.system_encoding,
             )
 
-            stdout, stderr = process.communicate()
-
-            if process.returncode != 0:
-                console.print(f"[red] 命令執行失敗：{stderr}[/red]")
-                raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+            if result.returncode != 0:
+                console.print(f"[red] 命令執行失敗：{result.stderr}[/red]")
+                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
 
-            return stdout
+            return result.stdout
         except Exception as e:
             console.print(f"[red] 執行命令時出錯：{e}[/red]")
             raise
@@ -81,11 +106,34 @@ class GitCommandRunner(CommandRunner):
         result = self.run_git_command(cmd)
         return result.splitlines()
 
-    def get_staged_diff(self) -> str:
-        """獲取暫存的 diff 內容"""
+    def get_staged_diff(self, max_bytes: Optional[int] = None) -> str:
+        """獲取暫存的 diff 內容
+
+        Args:
+            max_bytes (Optional[int]): 最多讀取的 bytes 數，超過時只保留前面的內容，None 表示不限制
+
+        Returns:
+            str: 暫存的 diff 內容
+        """
         cmd = ["git", "diff", "--cached"]
-        result = self.run_git_command(cmd)
-        return result
+        if max_bytes is None:
+            return self.run_git_command(cmd)
+        return self.stream_git_command(cmd, max_bytes)
+
+    def get_staged_changes(self, max_diff_bytes: Optional[int] = None) -> Tuple[List[str], str]:
+        """同時獲取暫存的文件列表與 diff 內容
+
+        Args:
+            max_diff_bytes (Optional[int]): diff 內容最多讀取的 bytes 數，None 表示不限制
+
+        Returns:
+            Tuple[List[str], str]: (暫存的文件列表，暫存的 diff 內容)
+        """
+        # 文件列表交由背景執行緒讀取，與讀取 diff 內容同時進行
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            files_future = executor.submit(self.get_staged_files)
+            diff = self.get_staged_diff(max_diff_bytes)
+            return files_future.result(), diff
 
     def get_commits_in_date_range(self, start_dt: datetime, end_dt: datetime, author: Optional[str]) -> str:
         """獲取指定日期範圍內的 commit message
@@ -96,12 +144,14 @@ class GitCommandRunner(CommandRunner):
             author: 作者名稱
 
         Returns:
-            str: commits 的完整內容
+            str: 範圍內所有 commit 的 message
         """
         start_str = start_dt.strftime("%Y-%m-%d %H:%M:%S")
         end_str = end_dt.strftime("%Y-%m-%d %H:%M:%S")
 
-        cmd = ["git", "log", f"--since={start_str}", f"--until={end_str}"]
+        # 只輸出 commit message 本身，不需要 hash、作者、日期等資訊
+        # 可以大幅減少要暫存並送給 AI 的內容
+        cmd = ["git", "log", "--format=%B", f"--since={start_str}", f"--until={end_str}"]
 
         if author is not None and author.strip():
             cmd.extend(["--author", author])
@@ -118,3 +168,66 @@ class GitCommandRunner(CommandRunner):
             str: 命令執行結果
         """
         return self.run_command(cmd, cwd=self.repo_path)
+
+    def stream_git_command(self, cmd: List[str], max_bytes: int) -> str:
+        """逐段讀取 git 命令的輸出，達到上限時直接結束程序
+
+        輸出很大時 (例如大量重構的 diff)，不需要把全部內容讀進記憶體後才截斷
+
+        Args:
+            cmd (List[str]): 要執行的 git 命令
+            max_bytes (int): 最多讀取的 bytes 數
+
+        Returns:
+            str: 命令執行結果，超過上限時只包含前 max_bytes 的內容
+        """
+        chunks: List[bytes] = []
+        remaining = max_bytes
+        truncated = False
+
+        try:
+            # stderr 寫到暫存檔，避免只讀取 stdout 時，stderr 的 pipe 被寫滿而造成 git 卡住
+            with (
+                tempfile.TemporaryFile() as stderr_file,
+                subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    cwd=self.repo_path,
+                    env=self._build_env(),
+                ) as process,
+            ):
+                # 已指定 stdout=PIPE，stdout 一定存在
+                stdout = cast(IO[bytes], process.stdout)
+
+                while remaining > 0:
+                    chunk = stdout.read(min(_STREAM_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    remaining -= len(chunk)
+
+                if remaining == 0 and stdout.read(1):
+                    # 還有沒讀完的內容，已達上限，不需要再等待 git 輸出
+                    truncated = True
+                    process.kill()
+
+                process.wait()
+
+                if not truncated and process.returncode != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read()
+                    stderr_text = stderr.decode(self.system_encoding, errors="replace")
+                    console.print(f"[red] 命令執行失敗：{stderr_text}[/red]")
+                    raise subprocess.CalledProcessError(process.returncode, cmd, b"".join(chunks), stderr)
+        except Exception as e:
+            console.print(f"[red] 執行命令時出錯：{e}[/red]")
+            raise
+
+        if truncated:
+            console.print(f"[yellow] 輸出內容超過 {max_bytes} bytes，只使用前面的部分 [/yellow]")
+
+        # 截斷的位置可能切在多 byte 字元的中間，只捨棄最後不完整的字元 (final=False 時會保留在 decoder 中)
+        # 其餘無法解碼的 byte 以替代字元表示，不會被默默丟掉
+        decoder = codecs.getincrementaldecoder(self.system_encoding)(errors="replace")
+        return decoder.decode(b"".join(chunks), final=not truncated)
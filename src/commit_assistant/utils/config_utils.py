@@ -1,7 +1,8 @@
 import os
 import shutil
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from dotenv import load_dotenv
 
@@ -11,6 +12,18 @@ from commit_assistant.enums.commit_style import CommitStyle
 from commit_assistant.enums.config_key import ConfigKey
 from commit_assistant.utils.console_utils import console
 
+# 預設的設定值，載入模組時建立一次，不需要每次載入設定都重新存取各個 enum 的值
+# enum 的值都是合法識別字的字串常數，Python 已自動 intern，直接作為 dict key 使用即可
+# 以唯讀的 mapping 包裝，避免共用的預設值被意外修改
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        ConfigKey.ENABLE_COMMIT_ASSISTANT.value: True,
+        ConfigKey.USE_MODEL.value: "gemini-2.5-flash",
+        ConfigKey.GEMINI_API_KEY.value: None,
+        ConfigKey.COMMIT_STYLE.value: CommitStyle.CONVENTIONAL.value,
+    }
+)
+
 
 def _load_config_from_config_file(config: dict[str, Any], repo_root: str) -> None:
     """
@@ -23,18 +36,17 @@ def _load_config_from_config_file(config: dict[str, Any], repo_root: str) -> Non
     repo_root_path = Path(repo_root)
     config_file = repo_root_path / ProjectInfo.REPO_ASSISTANT_DIR / ProjectInfo.CONFIG_TEMPLATE_NAME
 
-    if not config_file.exists():
+    # 一次讀出整個檔案，檔案不存在時視為沒有任何設定
+    try:
+        text = config_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return
 
-    with open(config_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-
-            # '#' 開頭的行為註解，忽略
-            # 其餘的設定進行寫入
-            if line and not line.startswith("#"):
-                key, value = line.split("=", 1)
-                config[key.strip()] = value.strip()
+    # '#' 開頭的行為註解，忽略
+    # 其餘的設定進行寫入，缺少 '=' 的行會在拆解時拋出錯誤
+    lines = (line.strip() for line in text.splitlines())
+    for key, value in (line.split("=", 1) for line in lines if line and line[0] != "#"):
+        config[key.strip()] = value.strip()
 
 
 def load_config(repo_root: str = ".") -> None:
@@ -49,21 +61,10 @@ def load_config(repo_root: str = ".") -> None:
     Args:
         repo_root (str, optional): 專案根目錄路徑。Defaults to ".".
     """
-    # 定義默認配置
-    config: dict[str, Any] = {
-        ConfigKey.ENABLE_COMMIT_ASSISTANT.value: True,
-        ConfigKey.USE_MODEL.value: "gemini-2.5-flash",
-        ConfigKey.GEMINI_API_KEY.value: None,
-        ConfigKey.COMMIT_STYLE.value: CommitStyle.CONVENTIONAL.value,
-    }
-
-    # 從 .env 載入，覆蓋默認配置
-    dotenv_path = ProjectPaths.PACKAGE_DIR / ".env"
+    # 從 .env 載入，有設定的值覆蓋默認配置
+    dotenv_path = ProjectPaths.get_env_file()
     load_dotenv(dotenv_path)
-    for key in config:
-        env_value = os.getenv(key)
-        if env_value is not None:
-            config[key] = env_value
+    config = {key: os.getenv(key, default) for key, default in _DEFAULT_CONFIG.items()}
 
     # 從專案配置文件載入
     try:
@@ -71,10 +72,8 @@ def load_config(repo_root: str = ".") -> None:
     except Exception as e:
         console.print(f"[yellow] 載入 commit-assistant config 失敗：{e}[/yellow]")
 
-    # 將 config 設定進環境變數
-    for key, value in config.items():
-        if value is not None:
-            os.environ[key] = str(value)
+    # 將 config 一次設定進環境變數
+    os.environ.update({key: str(value) for key, value in config.items() if value is not None})
 
 
 def _add_to_gitignore(repo_root: str, entry: str) -> None:
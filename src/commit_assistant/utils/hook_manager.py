@@ -1,7 +1,7 @@
 import enum
 import json
-import re
-import shutil
+import os
+import stat
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -25,17 +25,48 @@ class HookManager:
     # TODO: 如果確定所有使用者都已經更新，可以刪除這個標記以及相關邏輯
     OLD_MARKER = "# 以下內容由 commit-assistant 提供"
 
+    # 用來定位 commit-assistant 部分 (包含標記) 的開頭與結尾
+    _SECTION_START = COMMIT_ASSISTANT_MARKER_START + "\n"
+    _SECTION_END = "\n" + COMMIT_ASSISTANT_MARKER_END
+
     def __init__(self, repo_path: Path) -> None:
         self.repo_path = repo_path
         self.hooks_dir = repo_path / ".git" / "hooks"
         self.hook_path = self.hooks_dir / ProjectInfo.HOOK_TEMPLATE_NAME
 
+    @staticmethod
+    def _ensure_executable(hook_file: Path) -> None:
+        """確保 hook 文件具有執行權限，權限已正確時不重複設置"""
+        if stat.S_IMODE(hook_file.stat().st_mode) != 0o755:
+            hook_file.chmod(0o755)
+
+    @staticmethod
+    def _write_hook_file(hook_file: Path, content: str, append: bool = False) -> None:
+        """寫入 hook 文件
+
+        建立檔案時直接指定執行權限 (仍受 umask 影響)，權限正確時不需要再另外設置
+
+        Args:
+            hook_file (Path): hook 文件路徑
+            content (str): 要寫入的內容
+            append (bool): 是否添加到檔案末尾，否則覆寫整個檔案
+        """
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+        flags |= os.O_APPEND if append else os.O_TRUNC
+
+        with os.fdopen(os.open(hook_file, flags, 0o755), "wb") as f:
+            f.write(content.encode("utf-8"))
+
     def _backup_existing_hook(self) -> Optional[Path]:
-        """備份現有的 hook"""
+        """備份現有的 hook
+
+        備份與 hook 位於同一個目錄，直接將現有的 hook 重新命名為備份檔，不需要複製檔案內容，
+        呼叫後原本的 hook 會被移走，呼叫端需要接著寫入新的 hook 內容
+        """
         if self.hook_path.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.hook_path.with_suffix(f".backup_{timestamp}")
-            shutil.copy2(self.hook_path, backup_path)
+            os.replace(self.hook_path, backup_path)
             return backup_path
         return None
 
@@ -49,9 +80,14 @@ class HookManager:
 
         if husky_config.exists():
             try:
-                with open(husky_config) as f:
-                    package_json = json.load(f)
-                    return "husky" in package_json.get("devDependencies", {})
+                data = husky_config.read_bytes()
+
+                # 內容中完全沒有出現 "husky" 時，不需要解析整個 package.json
+                if b'"husky"' not in data:
+                    return False
+
+                package_json = json.loads(data)
+                return "husky" in package_json.get("devDependencies", {})
             except Exception:
                 pass
 
@@ -80,26 +116,27 @@ class HookManager:
                 return
 
             # 添加到現有 hook 的末尾
-            with hook_file.open("a", encoding="utf-8") as f:
-                f.write(f"\n{full_hook_content}\n")
+            self._write_hook_file(hook_file, f"\n{full_hook_content}\n", append=True)
         else:
             # 創建新的 hook 文件
-            with hook_file.open("w", encoding="utf-8") as f:
-                f.write(f"{full_hook_content}\n")
+            self._write_hook_file(hook_file, f"{full_hook_content}\n")
 
         # 設置執行權限
-        hook_file.chmod(0o755)
+        self._ensure_executable(hook_file)
 
     def _inject_hooks(self, hook_template_content: str) -> str:
         """往使用者的 hook 文件中注入 commit-assistant 的內容"""
         # 使用者沒有自定義 hook，直接使用我們的模板
         if not self.hook_path.exists():
             # 加入 bin/sh 開頭和標記
-            content = "#!/bin/sh\n\n"
-            content += f"{self.COMMIT_ASSISTANT_MARKER_START}\n"
-            content += hook_template_content
-            content += f"\n{self.COMMIT_ASSISTANT_MARKER_END}\n"
-            return content
+            return "".join(
+                (
+                    "#!/bin/sh\n\n",
+                    f"{self.COMMIT_ASSISTANT_MARKER_START}\n",
+                    hook_template_content,
+                    f"\n{self.COMMIT_ASSISTANT_MARKER_END}\n",
+                )
+            )
 
         current_content = self.hook_path.read_text(encoding="utf-8")
 
@@ -107,22 +144,20 @@ class HookManager:
         if self.COMMIT_ASSISTANT_MARKER_START in current_content:
             return current_content
 
-        # 注入
-        merged_content = "#!/bin/sh\n\n"
-        merged_content += "# Original hook content\n"
-        merged_content += current_content.replace("#!/bin/sh\n", "")
-        merged_content += f"\n{self.COMMIT_ASSISTANT_MARKER_START}\n"
-        merged_content += hook_template_content
-        merged_content += f"\n{self.COMMIT_ASSISTANT_MARKER_END}\n"
-
-        return merged_content
+        # 注入，各段內容一次串接，不需要逐段複製累加中的字串
+        return "".join(
+            (
+                "#!/bin/sh\n\n",
+                "# Original hook content\n",
+                current_content.replace("#!/bin/sh\n", ""),
+                f"\n{self.COMMIT_ASSISTANT_MARKER_START}\n",
+                hook_template_content,
+                f"\n{self.COMMIT_ASSISTANT_MARKER_END}\n",
+            )
+        )
 
     def _replace_commit_assistant_section(self, current_content: str, new_hook_content: str) -> str:
         """替換文件中的 commit-assistant 部分"""
-        # 透過標記來定位 commit-assistant 部分
-        start_pattern = re.escape(self.COMMIT_ASSISTANT_MARKER_START + "\n")
-        end_pattern = re.escape("\n" + self.COMMIT_ASSISTANT_MARKER_END)
-
         # 本次更新的內容
         # ! 注意：這裡的 new_hook_content 已經包含了標記
         replacement = (
@@ -136,11 +171,35 @@ class HookManager:
                 current_content += "\n"
             return current_content + f"\n{replacement}\n"
 
-        # 使用正則表達式替換整個部分（包含標記）
-        pattern = f"{start_pattern}.*?{end_pattern}"
-        updated_content = re.sub(pattern, replacement, current_content, flags=re.DOTALL)
+        # 以字串搜尋找出每一組標記，替換整個部分（包含標記）
+        # 標記都是固定字串，不需要使用正則表達式，替換內容中的 \ 也不會被當成跳脫字元
+        parts = []
+        pos = 0
+        changed = False
+        while True:
+            start = current_content.find(self._SECTION_START, pos)
+            if start == -1:
+                break
+            end = current_content.find(self._SECTION_END, start + len(self._SECTION_START))
+            if end == -1:
+                break
+
+            section_end = end + len(self._SECTION_END)
+            # 直接比對原本的內容，不需要切出子字串
+            if section_end - start != len(replacement) or not current_content.startswith(replacement, start):
+                changed = True
+
+            parts.append(current_content[pos:start])
+            parts.append(replacement)
+            pos = section_end
+
+        # 沒有任何需要替換的部分時直接回傳原本的字串，不需要重新組合
+        # 呼叫端比對內容是否有變化時，同一個物件可以直接判斷為相同
+        if not changed:
+            return current_content
 
-        return updated_content
+        parts.append(current_content[pos:])
+        return "".join(parts)
 
     def _detect_hook_version(self, content: str) -> HookVersion:
         """檢測 hook 的版本
@@ -218,7 +277,7 @@ class HookManager:
                 console.print(f"[yellow] 已備份當前 hook 至 {backup_path}[/yellow]")
 
             self.hook_path.write_text(updated_content, encoding="utf-8")
-            self.hook_path.chmod(0o755)
+            self._ensure_executable(self.hook_path)
             console.print("[green] 已成功更新 git hook[/green]")
         else:
             console.print("[yellow]hook 內容已是最新版本 [/yellow]")
@@ -249,7 +308,7 @@ class HookManager:
         # 如果內容有變化才寫入
         if updated_content != current_content:
             hook_file.write_text(updated_content, encoding="utf-8")
-            hook_file.chmod(0o755)
+            self._ensure_executable(hook_file)
             console.print("[green] 已成功更新 husky hook[/green]")
         else:
             console.print("[yellow]husky hook 內容已是最新版本 [/yellow]")
@@ -262,15 +321,21 @@ class HookManager:
             self._install_hook_husky(hook_content)
             return
 
+        # 將我們的 hook 內容注入到現有 hook 文件中
+        injected_content = self._inject_hooks(hook_content)
+
+        # 內容沒有變化時不需要備份，也不重新寫入，避免多餘的檔案寫入
+        if self.hook_path.exists() and self.hook_path.read_text(encoding="utf-8") == injected_content:
+            self._ensure_executable(self.hook_path)
+            return
+
         # 備份現有的 hook
         backup_path = self._backup_existing_hook()
         if backup_path:
             console.print(f"已備份舊版 hook 於 {backup_path}...")
 
-        # 將我們的 hook 內容注入到現有 hook 文件中
-        injected_content = self._inject_hooks(hook_content)
         self.hook_path.write_text(injected_content, encoding="utf-8")
-        self.hook_path.chmod(0o755)
+        self._ensure_executable(self.hook_path)
 
     def update_hook(self, new_hook_content: str) -> None:
         """更新 hook 中的 commit-assistant 部分"""
@@ -1,42 +1,101 @@
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-
-import tomli
-import tomli_w
+from typing import Dict, List, Optional
 
 from commit_assistant.core.paths import ProjectPaths
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.utils.console_utils import console
 
+# 安裝紀錄超過此數量時，才改用多執行緒檢查路徑，避免建立執行緒池的成本大於檢查本身
+_PARALLEL_THRESHOLD = 4
+_MAX_EXISTS_WORKERS = 32
+
+
+def _repo_path_exists(info: Dict) -> bool:
+    """檢查安裝紀錄中的倉庫路徑是否存在"""
+    return Path(info["repo_path"]).exists()
+
 
 class InstallationManager:
     def __init__(self) -> None:
         self.installations_path = ProjectPaths.RESOURCES_DIR / ProjectInfo.INSTALLATIONS_FILE
 
+        # 已解析的安裝紀錄，檔案的修改時間沒有變化時直接使用，不需要重新解析 TOML
+        self._cache: Optional[dict] = None
+        self._cache_mtime = -1
+
     def _normalize_path(self, path: Path) -> str:
         """規範化路徑，使得路徑一致"""
         return str(path.resolve()).replace("\\", "/")
 
-    def _generate_installation_id(self, repo_path: Path) -> str:
-        """生成安裝紀錄的 ID"""
-        normalized_path = self._normalize_path(repo_path)
-        return hashlib.md5(normalized_path.encode()).hexdigest()
+    def _generate_installation_id(self, normalized_path: str) -> str:
+        """生成安裝紀錄的 ID
+
+        ID 只用來查詢紀錄，不需要密碼學上的安全性，使用 blake2b 並維持 32 個字元的長度
+
+        Args:
+            normalized_path (str): 經過 _normalize_path 規範化的路徑
+        """
+        return hashlib.blake2b(normalized_path.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _generate_legacy_installation_id(self, normalized_path: str) -> str:
+        """生成舊版以 md5 產生的安裝紀錄 ID，用於相容既有的安裝紀錄"""
+        return hashlib.md5(normalized_path.encode(), usedforsecurity=False).hexdigest()
+
+    def _find_installation_id(self, installations: dict, normalized_path: str) -> Optional[str]:
+        """找出該路徑在安裝紀錄中使用的 ID
+
+        Args:
+            installations (dict): 安裝紀錄中的 installations 部分
+            normalized_path (str): 經過 _normalize_path 規範化的倉庫路徑
+
+        Returns:
+            Optional[str]: 安裝紀錄的 ID，找不到時回傳 None
+        """
+        installation_id = self._generate_installation_id(normalized_path)
+        if installation_id in installations:
+            return installation_id
+
+        # 舊版安裝時產生的紀錄
+        legacy_id = self._generate_legacy_installation_id(normalized_path)
+        if legacy_id in installations:
+            return legacy_id
+
+        return None
 
     def _read_installations(self) -> dict:
         """讀取歷史安裝紀錄"""
-        if not self.installations_path.exists():
+        try:
+            mtime = self.installations_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
 
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+
+        # 延遲載入，不會讀取安裝紀錄的命令不需要載入 TOML 套件
+        import tomli
+
         try:
-            return tomli.loads(self.installations_path.read_text(encoding="utf-8"))
+            installations = tomli.loads(self.installations_path.read_text(encoding="utf-8"))
         except Exception as e:
             console.print(f"[red] 讀取配置文件時發生錯誤：{e}[/red]")
             return {}
 
+        self._cache = installations
+        self._cache_mtime = mtime
+        return installations
+
     def _save_installations(self, installation_info: dict) -> None:
         """儲存安裝紀錄"""
+        # 傳入的紀錄可能就是快取本身並已被修改，無論寫入是否成功都讓下次讀取重新解析
+        self._cache = None
+        self._cache_mtime = -1
+
+        import tomli_w
+
         try:
             self.installations_path.write_text(tomli_w.dumps(installation_info), encoding="utf-8")
         except Exception as e:
@@ -50,21 +109,24 @@ class InstallationManager:
         normalized_path = self._normalize_path(repo_path)
 
         # 產生安裝 ID
-        installation_id = self._generate_installation_id(repo_path)
+        installation_id = self._generate_installation_id(normalized_path)
 
-        # 準備新的安裝記錄
+        # 準備新的安裝記錄，安裝時間與最後更新時間使用同一個時間點
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         installation = {
             "id": installation_id,
             "repo_path": normalized_path,
             "version": ProjectInfo.VERSION,
-            "installed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "last_updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "installed_at": now,
+            "last_updated_at": now,
         }
 
         # 更新安裝紀錄
         if "installations" not in installation_info:
             installation_info["installations"] = {}
 
+        # 移除舊版 ID 的紀錄，避免同一個倉庫留下兩筆紀錄
+        installation_info["installations"].pop(self._generate_legacy_installation_id(normalized_path), None)
         installation_info["installations"][installation_id] = installation
         self._save_installations(installation_info)
 
@@ -72,29 +134,34 @@ class InstallationManager:
 
     def get_installation(self, repo_path: Path) -> Dict:
         """獲取安裝記錄"""
-        installations_info = self._read_installations()
+        installations = self._read_installations().get("installations", {})
 
         # 取得安裝 ID
-        installation_id = self._generate_installation_id(repo_path)
+        installation_id = self._find_installation_id(installations, self._normalize_path(repo_path))
 
-        if "installations" in installations_info and installation_id in installations_info["installations"]:
-            return installations_info["installations"][installation_id]
+        if installation_id is not None:
+            return installations[installation_id]
         else:
             return {}
 
     def get_all_installations(self) -> List[Dict]:
         """獲取所有安裝記錄"""
         installations_info = self._read_installations()
+        infos = [*installations_info.get("installations", {}).values()]
         installations = []
 
-        for _, info in installations_info.get("installations", {}).items():
-            repo_path = info["repo_path"]
+        # 檢查路徑是否仍然存在，紀錄較多時交由執行緒池同時檢查
+        if len(infos) > _PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(_MAX_EXISTS_WORKERS, len(infos))) as executor:
+                exists = [*executor.map(_repo_path_exists, infos)]
+        else:
+            exists = [_repo_path_exists(info) for info in infos]
 
-            # 檢查路徑是否仍然存在
-            if Path(repo_path).exists():
+        for info, repo_exists in zip(infos, exists):
+            if repo_exists:
                 installations.append(info)
             else:
-                console.print(f"[yellow] 警告：倉庫路徑不存在，將跳過：{repo_path}[/yellow]")
+                console.print(f"[yellow] 警告：倉庫路徑不存在，將跳過：{info['repo_path']}[/yellow]")
 
         return installations
 
@@ -104,10 +171,12 @@ class InstallationManager:
         normalized_path = self._normalize_path(repo_path)
 
         # 取得安裝 ID
-        installation_id = self._generate_installation_id(repo_path)
+        installation_id = self._find_installation_id(
+            installations_info.get("installations", {}), normalized_path
+        )
 
         # 移除安裝記錄
-        if "installations" in installations_info and installation_id in installations_info["installations"]:
+        if installation_id is not None:
             del installations_info["installations"][installation_id]
             self._save_installations(installations_info)
             console.print(f"[green] 已移除安裝信息：{normalized_path} ID:{installation_id} [/green]")
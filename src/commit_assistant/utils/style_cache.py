@@ -0,0 +1,63 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+from commit_assistant.core.paths import ProjectPaths
+from commit_assistant.core.project_config import ProjectInfo
+
+
+class StyleDescriptionCache:
+    """快取各個 style 檔案的 description
+
+    以 (修改時間, 檔案大小) 判斷檔案是否有變動，
+    檔案沒有變動時直接使用快取，不需要再重新解析 yaml
+    """
+
+    def __init__(self) -> None:
+        self.cache_path = ProjectPaths.RESOURCES_DIR / ProjectInfo.STYLE_CACHE_FILE
+        self._entries: Dict[str, List] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List]:
+        """讀取快取檔案，檔案不存在或格式錯誤時視為沒有快取"""
+        try:
+            entries = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """取得快取的 description
+
+        Args:
+            path (str): style 檔案路徑
+            stat (os.stat_result): style 檔案的狀態
+
+        Returns:
+            Optional[str]: 檔案沒有變動時回傳快取的 description，否則回傳 None
+        """
+        entry = self._entries.get(path)
+        if entry is None or entry[:2] != [stat.st_mtime_ns, stat.st_size]:
+            return None
+        return entry[2]
+
+    def set(self, path: str, stat: os.stat_result, description: str) -> None:
+        """更新快取的 description"""
+        self._entries[path] = [stat.st_mtime_ns, stat.st_size, description]
+        self._dirty = True
+
+    def save(self) -> None:
+        """有變動時才寫回快取檔案，並移除已經不存在的 style 檔案"""
+        if not self._dirty:
+            return
+
+        entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+
+        try:
+            self.cache_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            # 快取寫入失敗不影響功能，下次再重新解析即可
+            return
+
+        self._dirty = False
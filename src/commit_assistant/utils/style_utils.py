@@ -1,8 +1,7 @@
+import re
+import shutil
 from pathlib import Path
-from typing import List, Optional
-
-import questionary
-import yaml
+from typing import IO, Any, Dict, List, Optional, Union
 
 from commit_assistant.core.paths import ProjectPaths
 from commit_assistant.core.project_config import ProjectInfo
@@ -10,6 +9,28 @@ from commit_assistant.enums.commit_style import StyleScope
 from commit_assistant.enums.config_key import ConfigKey
 from commit_assistant.utils.console_utils import console
 
+# 專案設定檔中設定 COMMIT_STYLE 的行，key 前後允許空白
+_COMMIT_STYLE_LINE_RE = re.compile(
+    rf"^[ \t]*{re.escape(ConfigKey.COMMIT_STYLE.value)}[ \t]*=.*$", re.MULTILINE
+)
+
+
+def _safe_load_yaml(stream: Union[str, bytes, IO[str]]) -> Any:
+    """以安全模式解析 yaml 內容
+
+    優先使用 LibYAML 的 C 實作解析，未編譯 LibYAML 時退回純 Python 版本
+
+    Args:
+        stream (Union[str, bytes, IO[str]]): yaml 內容或檔案
+
+    Returns:
+        Any: 解析後的內容
+    """
+    # 延遲載入，只有實際讀取 style 檔案時才需要
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
 
 class StyleValidator:
     """用於驗證 Style 內容的驗證器"""
@@ -63,7 +84,7 @@ class StyleImporter:
             return ProjectPaths.STYLE_DIR / "global"
 
         # 專案，放在對應專案的 style 目錄下
-        current_dir = Path(".").absolute()
+        current_dir = Path.cwd()
         if not self._validate_repo(current_dir):
             raise ValueError("當前目錄不是有效的 git 倉庫")
         return current_dir / ProjectInfo.REPO_ASSISTANT_DIR / "style"
@@ -76,6 +97,9 @@ class StyleImporter:
     def _handle_existing_file(self) -> bool:
         """處理已存在的檔案"""
         if self.target_file.exists():
+            # 延遲載入，避免 commit 流程也要載入 prompt_toolkit
+            import questionary
+
             return questionary.confirm(f"風格:{self.style_name} 已存在，是否要覆寫？").ask()
         return True
 
@@ -83,7 +107,7 @@ class StyleImporter:
         """開始匯入"""
         # 讀取和驗證匯入的內容是否正確
         with open(self.source_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+            content = _safe_load_yaml(f)
 
         StyleValidator.validate_content(content)
 
@@ -95,9 +119,8 @@ class StyleImporter:
             console.print("[yellow] 已取消匯入 [/yellow]")
             return
 
-        # 開始匯入
-        with open(self.target_file, "w", encoding="utf-8") as f:
-            yaml.dump(content, f, allow_unicode=True)
+        # 開始匯入，內容已驗證過，直接複製原始檔案即可 (同時保留使用者的註解與排版)
+        shutil.copyfile(self.source_path, self.target_file)
 
         # 匯入完成提示使用者訊息
         scope = f"[{StyleScope.GLOBAL.value}]" if self.is_global else f"[{StyleScope.PROJECT.value}]"
@@ -111,12 +134,19 @@ class CommitStyleManager:
         # 各個風格的存放位置
         self.system_styles_dir = ProjectPaths.STYLE_DIR / "system"
         self.global_styles_dir = ProjectPaths.STYLE_DIR / "global"
-        self.project_styles_dir = Path(".").absolute() / ProjectInfo.REPO_ASSISTANT_DIR / "style"
+        # 專案相關的路徑都以目前的工作目錄為基準，只需取得一次
+        project_assistant_dir = Path.cwd() / ProjectInfo.REPO_ASSISTANT_DIR
+        self.project_styles_dir = project_assistant_dir / "style"
 
         # 專案設定檔的位置
-        self.project_config_file = (
-            Path(".").absolute() / ProjectInfo.REPO_ASSISTANT_DIR / ProjectInfo.CONFIG_TEMPLATE_NAME
-        )
+        self.project_config_file = project_assistant_dir / ProjectInfo.CONFIG_TEMPLATE_NAME
+
+        # 已找到的風格路徑，重新生成 commit message 時不需要再重新查找檔案
+        self._style_path_cache: Dict[str, tuple[Path, bool]] = {}
+
+        # 已讀取並驗證過的 prompt 模板，以 (檔案路徑, 修改時間) 作為 key
+        # 只有實際使用到的風格才會讀取，檔案被編輯後會自動重新讀取
+        self._prompt_cache: Dict[tuple[str, int], str] = {}
 
     def get_style_path(self, style_name: str) -> tuple[Path, bool]:
         """取得指定 style 的檔案路徑，如有重名優先使用專案模板
@@ -130,6 +160,16 @@ class CommitStyleManager:
         Raises:
             ValueError: 當找不到指定風格時拋出錯誤
         """
+        cached = self._style_path_cache.get(style_name)
+        if cached is not None:
+            return cached
+
+        result = self._find_style_path(style_name)
+        self._style_path_cache[style_name] = result
+        return result
+
+    def _find_style_path(self, style_name: str) -> tuple[Path, bool]:
+        """依照 專案 -> 全域 -> 系統 的順序查找風格檔案"""
         is_global_style = False
 
         # 先檢查專案模板
@@ -167,27 +207,18 @@ class CommitStyleManager:
         # 讀取現有設定
         project_config_content = self.project_config_file.read_text(encoding="utf-8")
 
-        # 更新 COMMIT_STYLE
-        found = False
-        result_lines = []
-        for line in project_config_content.splitlines():
-            if line.startswith("#") or not line.strip():
-                result_lines.append(line)
-            else:
-                key = line.split("=", 1)[0].strip()
-
-                # 如果找到 COMMIT_STYLE，則更新
-                if key == ConfigKey.COMMIT_STYLE.value:
-                    result_lines.append(f"{key}={style_name}")
-                    found = True
-                else:
-                    result_lines.append(line)
+        # 更新 COMMIT_STYLE，以函式回傳替換內容，避免風格名稱中的 \ 被當成跳脫字元
+        style_line = f"{ConfigKey.COMMIT_STYLE.value}={style_name}"
+        new_content, count = _COMMIT_STYLE_LINE_RE.subn(lambda _: style_line, project_config_content)
 
-        if not found:
-            result_lines.append(f"{ConfigKey.COMMIT_STYLE.value}={style_name}")
+        # 沒有設定過 COMMIT_STYLE 時，加在檔案最後
+        if count == 0:
+            separator = "" if not new_content or new_content.endswith("\n") else "\n"
+            new_content = f"{new_content}{separator}{style_line}"
 
-        # 回寫專案設定檔
-        self.project_config_file.write_text("\n".join(result_lines), encoding="utf-8")
+        # 回寫專案設定檔，內容沒有變化時不需要寫入
+        if new_content != project_config_content:
+            self.project_config_file.write_text(new_content, encoding="utf-8")
 
         # 如果使用全域模板，有可能其他專案成員會無法使用
         # 這裡提示使用者注意
@@ -213,13 +244,16 @@ class CommitStyleManager:
         """
         # 先取出要使用的風格檔案路徑
         style_path, _ = self.get_style_path(style)
+        cache_key = (str(style_path), style_path.stat().st_mtime_ns)
+        prompt = self._prompt_cache.get(cache_key)
 
-        # 讀取 yaml prompt 內容
-        with open(style_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+        if prompt is None:
+            # 讀取 yaml prompt 內容
+            content = _safe_load_yaml(style_path.read_text(encoding="utf-8"))
 
-        # 檢查內容是否正確
-        StyleValidator.validate_content(content)
+            # 檢查內容是否正確，通過驗證後才放入快取
+            StyleValidator.validate_content(content)
+            prompt = self._prompt_cache[cache_key] = content["prompt"]
 
         # 返回生成的 prompt
-        return content["prompt"].format(changed_files=changed_files, diff_content=diff_content)
+        return prompt.format(changed_files=changed_files, diff_content=diff_content)
@@ -1,5 +1,6 @@
-import shutil
+import os
 from pathlib import Path
+from typing import Optional
 
 from commit_assistant.core.paths import ProjectPaths
 from commit_assistant.core.project_config import ProjectInfo
@@ -8,6 +9,11 @@ from commit_assistant.utils.hook_manager import HookManager
 
 
 class UpdateManager:
+    # 套件內的模板與紀錄檔路徑不會因專案而不同，只在載入時計算一次
+    _HOOK_TEMPLATE_PATH = ProjectPaths.HOOKS_DIR / ProjectInfo.HOOK_TEMPLATE_NAME
+    _EXAMPLE_TEMPLATE_PATH = ProjectPaths.CONFIG_DIR / ProjectInfo.CONFIG_EXAMPLE_NAME
+    _INSTALLATIONS_PATH = ProjectPaths.RESOURCES_DIR / ProjectInfo.INSTALLATIONS_FILE
+
     def __init__(self, repo_path: Path) -> None:
         self.repo_path = repo_path
         self.hook_path = repo_path / ".git" / "hooks" / ProjectInfo.HOOK_TEMPLATE_NAME
@@ -20,9 +26,18 @@ class UpdateManager:
             repo_path / ProjectInfo.REPO_ASSISTANT_DIR / ProjectInfo.CONFIG_EXAMPLE_NAME
         )
 
-        self.hook_template_path = ProjectPaths.HOOKS_DIR / ProjectInfo.HOOK_TEMPLATE_NAME
-        self.example_template_path = ProjectPaths.CONFIG_DIR / ProjectInfo.CONFIG_EXAMPLE_NAME
-        self.installations_path = ProjectPaths.RESOURCES_DIR / ProjectInfo.INSTALLATIONS_FILE
+        self.hook_template_path = self._HOOK_TEMPLATE_PATH
+        self.example_template_path = self._EXAMPLE_TEMPLATE_PATH
+        self.installations_path = self._INSTALLATIONS_PATH
+
+        # 已讀取的 example 模板內容，同一次更新中只需讀取一次
+        self._example_template_content: Optional[str] = None
+
+    def _read_example_template(self) -> str:
+        """讀取 example 設定檔模板的內容"""
+        if self._example_template_content is None:
+            self._example_template_content = self.example_template_path.read_text(encoding="utf-8")
+        return self._example_template_content
 
     def _update_example_config(self) -> None:
         """更新 example 設定檔為最新模板內容"""
@@ -32,7 +47,16 @@ class UpdateManager:
             console.print("[yellow] 發現設定檔資料夾不存在，正在建立...[/yellow]")
             self.example_config_path.parent.mkdir(parents=True)
 
-        template_content = self.example_template_path.read_text(encoding="utf-8")
+        template_content = self._read_example_template()
+
+        # 內容沒有變動時不需要重新寫入
+        try:
+            if self.example_config_path.read_text(encoding="utf-8") == template_content:
+                console.print("[yellow] 設定檔範本已是最新版本 [/yellow]\n")
+                return
+        except FileNotFoundError:
+            pass
+
         self.example_config_path.write_text(template_content, encoding="utf-8")
 
         console.print("[green] 設定檔範本更新完成!![/green]\n")
@@ -45,7 +69,7 @@ class UpdateManager:
         console.print("[yellow] 偵測到舊版設定格式，正在遷移至新格式...[/yellow]")
 
         # 從模板建立 example 檔（不動使用者已有的個人設定）
-        template_content = self.example_template_path.read_text(encoding="utf-8")
+        template_content = self._read_example_template()
         self.example_config_path.write_text(template_content, encoding="utf-8")
 
         # 確保個人設定檔被 gitignore
@@ -66,7 +90,8 @@ class UpdateManager:
             new_config_dir.mkdir(exist_ok=True)
 
             console.print(f"[yellow] 偵測到舊版本的設定檔，正在移動到新位置 {new_config_dir}[/yellow]")
-            shutil.move(old_root_config_path, self.config_path)
+            # 新舊位置都在同一個專案底下，直接 rename 即可，不需要 shutil.move 的複製流程
+            os.replace(old_root_config_path, self.config_path)
             console.print("[green] 設定檔移動完成!![/green]\n")
 
         # 處理 v0.1.12 版本遷移
@@ -76,8 +101,15 @@ class UpdateManager:
         self._update_example_config()
 
         # 更新 hook
+        self._update_hook(self.hook_template_path.read_text(encoding="utf-8"))
+
+    def _update_hook(self, new_hook_content: str) -> None:
+        """更新 hook 中的 commit-assistant 部分
+
+        Args:
+            new_hook_content (str): 最新的 hook 模板內容
+        """
         hook_manager = HookManager(self.repo_path)
-        new_hook_content = self.hook_template_path.read_text(encoding="utf-8")
         hook_manager.update_hook(new_hook_content)
 
 
@@ -1,31 +1,67 @@
+import json
+import os
+import threading
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Optional
-
-import requests
-from packaging import version
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 from commit_assistant.core.paths import ProjectPaths
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.utils.console_utils import console, loading_spinner
 
+if TYPE_CHECKING:
+    import requests
+
 
 class UpgradeChecker:
     UNTAGGED_VERSION = "v0.0.0"
     CHECK_INTERVAL = 60 * 60 * 24  # 1 天 每次檢查的時間間隔
+    REQUEST_TIMEOUT = 10  # 向 GitHub 查詢的逾時秒數，避免網路異常時一直等待
+
+    # 同一個行程中是否已經執行過背景版本檢查，避免重複讀取紀錄檔或重複提示
+    _version_checked = False
+
+    def __init__(self) -> None:
+        # 紀錄檔路徑在各個方法中都會用到，建立實例時計算一次即可
+        self.latest_check_file = ProjectPaths.RESOURCES_DIR / ProjectInfo.UPGRADE_CHECK_FILE
+        self.tags_cache_file = ProjectPaths.RESOURCES_DIR / ProjectInfo.RELEASE_TAGS_CACHE_FILE
 
     def get_latest_check_time(self) -> Optional[datetime]:
-        """取得上次檢查更新的時間"""
-        latest_check_file = ProjectPaths.RESOURCES_DIR / ProjectInfo.UPGRADE_CHECK_FILE
+        """取得上次檢查更新的時間
+
+        直接使用紀錄檔的修改時間，不需要開啟並解析檔案內容
+        """
+        try:
+            return datetime.fromtimestamp(self.latest_check_file.stat().st_mtime)
+        except OSError:
+            return None
+
+    def get_cached_latest_tag(self) -> Optional[str]:
+        """取得快取的最新版本號
+
+        紀錄檔第一行為上次檢查的時間，第二行（若有）為當時查到的最新版本號
 
-        if not latest_check_file.exists():
+        Returns:
+            Optional[str]: 距離上次檢查未超過 CHECK_INTERVAL 時回傳當時查到的最新版本號，否則回傳 None
+        """
+        if self.should_check_update():
             return None
 
+        return self._read_cached_tag()
+
+    def _read_cached_tag(self) -> Optional[str]:
+        """讀取紀錄檔中記錄的最新版本號，不檢查紀錄是否過期
+
+        Returns:
+            Optional[str]: 紀錄檔中的最新版本號，沒有紀錄時回傳 None
+        """
         try:
-            with open(latest_check_file, "r", encoding="utf-8") as f:
-                return datetime.fromisoformat(f.read())
-        except Exception:
+            lines = self.latest_check_file.read_text(encoding="utf-8").splitlines()
+        except OSError:
             return None
 
+        return lines[1].strip() if len(lines) > 1 and lines[1].strip() else None
+
     def should_check_update(self) -> bool:
         """檢查是否要檢查更新"""
         last_check_time = self.get_latest_check_time()
@@ -37,67 +73,220 @@ class UpgradeChecker:
         # 距離上次檢查的時間超過 CHECK_INTERVAL，需要更新
         return (datetime.now() - last_check_time).total_seconds() > self.CHECK_INTERVAL
 
-    def save_latest_check_time(self) -> None:
-        """儲存最新的檢查時間"""
-        latest_check_file = ProjectPaths.RESOURCES_DIR / ProjectInfo.UPGRADE_CHECK_FILE
+    def save_latest_check_time(self, latest_tag: Optional[str] = None) -> None:
+        """儲存最新的檢查時間
+
+        Args:
+            latest_tag (Optional[str], optional): 本次查到的最新版本號。Defaults to None.
+        """
+        now = datetime.now()
+        content = now.isoformat()
+        if latest_tag:
+            content += f"\n{latest_tag}"
+
+        with open(self.latest_check_file, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        # 檢查時間以檔案的修改時間為準，明確設定為本次檢查的時間
+        timestamp = now.timestamp()
+        os.utime(self.latest_check_file, (timestamp, timestamp))
+
+    def _read_tags_cache(self) -> Dict[str, str]:
+        """讀取上次查詢 GitHub 的快取 (ETag、Last-Modified 與當時的最新版本號)
+
+        Returns:
+            Dict[str, str]: 快取內容，檔案不存在或格式錯誤時回傳空的 dict
+        """
+        try:
+            cache = json.loads(self.tags_cache_file.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_tags_cache(self, response: "requests.Response", latest_tag: str) -> None:
+        """儲存本次查詢 GitHub 的快取
+
+        Args:
+            response (requests.Response): GitHub 的回應
+            latest_tag (str): 本次查到的最新版本號
+        """
+        cache = {"latest_tag": latest_tag}
+        for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            value = response.headers.get(header)
+            if value:
+                cache[key] = value
+
+        try:
+            self.tags_cache_file.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:
+            # 快取寫入失敗不影響功能，下次再完整查詢即可
+            return
+
+    def fetch_latest_tag(self) -> str:
+        """向 GitHub 取得最新的版本號
+
+        帶上次查詢的 ETag / Last-Modified 發送條件式請求，
+        GitHub 回應 304 (沒有變動) 時直接使用快取的版本號，不需要重新下載與解析 tag 列表
+
+        Returns:
+            str: 最新的版本號，沒有任何 tag 時回傳 UNTAGGED_VERSION
+        """
+        # requests 會一併載入 urllib3 等套件，只有實際向 GitHub 查詢時才需要
+        import requests
+        from packaging import version
+
+        cache = self._read_tags_cache()
+        cached_tag = cache.get("latest_tag")
+
+        headers = {}
+        if cached_tag:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
+
+        response = requests.get(ProjectInfo.RELEASE_TAG_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
 
-        with open(latest_check_file, "w", encoding="utf-8") as f:
-            f.write(datetime.now().isoformat())
+        if response.status_code == 304 and cached_tag:
+            return cached_tag
 
-    def check_for_updates_version(self) -> Optional[str]:
+        response.raise_for_status()
+        tags = [tag["name"] for tag in response.json()]
+
+        # max 的 key 對每個 tag 只會解析一次，沒有任何 tag 時回傳 UNTAGGED_VERSION
+        latest_tag = max(tags, key=lambda x: version.parse(x.lstrip("v")), default=self.UNTAGGED_VERSION)
+        self._save_tags_cache(response, latest_tag)
+        return latest_tag
+
+    def check_for_updates_version(
+        self, show_spinner: bool = True, force: bool = False, quiet: bool = False
+    ) -> Optional[str]:
         """檢查是否有新版本
 
+        距離上次檢查未超過 CHECK_INTERVAL 時，直接使用快取的版本號，不再發送網路請求
+
+        Args:
+            show_spinner (bool, optional): 是否顯示讀取動畫。Defaults to True.
+            force (bool, optional): 是否忽略快取，強制向 GitHub 查詢。Defaults to False.
+            quiet (bool, optional): 檢查失敗時是否不輸出錯誤訊息 (例如在背景執行緒中檢查時)。Defaults to False.
+
         Returns:
             Optional[str]: 如果有新版本，回傳新版本號；否則回傳 None
         """
         try:
-            with loading_spinner("檢查更新中..."):
-                # 獲取最新的版本號
-                response = requests.get(ProjectInfo.RELEASE_TAG_URL)
-                tags = [tag["name"] for tag in response.json()]
+            latest_tag = None if force else self.get_cached_latest_tag()
 
-            # 按版本排序
-            sorted_tags = sorted(tags, key=lambda x: version.parse(x.lstrip("v")), reverse=True)
+            if latest_tag is None:
+                # 先記錄檢查時間 (保留上次查到的版本號)，查詢途中程序就結束時 (例如背景執行緒隨命令結束)，
+                # 下次執行命令也不會再重新查詢
+                self.save_latest_check_time(self._read_cached_tag())
 
-            latest_tag = sorted_tags[0] if sorted_tags else self.UNTAGGED_VERSION
-            current = version.parse(ProjectInfo.VERSION.lstrip("v"))
+                try:
+                    with loading_spinner("檢查更新中...") if show_spinner else nullcontext():
+                        latest_tag = self.fetch_latest_tag()
+                finally:
+                    # 查詢失敗也記錄檢查時間，避免網路異常時每次執行命令都重新連線
+                    self.save_latest_check_time(latest_tag)
 
-            # 如果有新版本，回傳新版本號
-            if version.parse(latest_tag.lstrip("v")) > current:
-                return latest_tag
-
-            return None
+            return self._get_newer_version(latest_tag)
 
         except Exception:
-            console.print("[red] 檢查更新失敗，請稍後再試")
+            if not quiet:
+                console.print("[red] 檢查更新失敗，請稍後再試")
             return None
 
+    def _get_newer_version(self, latest_tag: str) -> Optional[str]:
+        """比較版本號與目前安裝的版本
+
+        Args:
+            latest_tag (str): 最新的版本號
+
+        Returns:
+            Optional[str]: 比目前版本新時回傳該版本號，否則回傳 None
+        """
+        from packaging import version
+
+        current = version.parse(ProjectInfo.VERSION.lstrip("v"))
+
+        # 如果有新版本，回傳新版本號
+        if version.parse(latest_tag.lstrip("v")) > current:
+            return latest_tag
+
+        return None
+
     def print_update_message(self, newest_version: str) -> None:
         """印出更新訊息
 
         Args:
             newest_version (str): 最新版本號
         """
+        # 組合成一段訊息後一次輸出，只需經過一次 rich 的渲染與寫入
         console.print(
-            f"[yellow] 發現新版本 [cyan]{newest_version}[/cyan]！您可以透過以下方式更新：[/yellow]\n"
+            "\n".join(
+                [
+                    f"[yellow] 發現新版本 [cyan]{newest_version}[/cyan]！您可以透過以下方式更新：[/yellow]\n",
+                    "[yellow]1. 執行更新指令 [/yellow]",
+                    f"   [green]{ProjectInfo.CLI_MAIN_COMMAND} upgrade[/green]",
+                    "[yellow]2. 透過 pip 安裝最新版本 [/yellow]",
+                    f"   [green]pip install {ProjectInfo.GITHUB_REPO_URL} -U[/green]\n",
+                ]
+            )
         )
-        console.print("[yellow]1. 執行更新指令 [/yellow]")
-        console.print(f"   [green]{ProjectInfo.CLI_MAIN_COMMAND} upgrade[/green]")
-        console.print("[yellow]2. 透過 pip 安裝最新版本 [/yellow]")
-        console.print(f"   [green]pip install {ProjectInfo.GITHUB_REPO_URL} -U[/green]\n")
 
-    def run_version_check(self, force: bool = False) -> None:
+    def run_version_check(self, force: bool = False) -> Optional[str]:
         """執行版本檢查
 
+        此方法會在背景執行緒中執行，因此不顯示讀取動畫，也不直接輸出訊息，避免與命令本身的輸出衝突
+        非強制檢查時，同一個行程中只會執行一次
+
         Args:
             force (bool, optional): 是否強制檢查更新。Defaults to False.
+
+        Returns:
+            Optional[str]: 如果有新版本，回傳新版本號；否則回傳 None
         """
-        if not force and not self.should_check_update():
-            return
+        if not force:
+            if UpgradeChecker._version_checked:
+                return None
+            UpgradeChecker._version_checked = True
+
+            if not self.should_check_update():
+                # 未超過檢查間隔時，直接使用紀錄檔中的版本號，不發送網路請求
+                return self._get_cached_newer_version()
+
+        # 已確定需要檢查，直接向 GitHub 查詢，查詢結果會一併寫入紀錄檔
+        return self.check_for_updates_version(show_spinner=False, force=True, quiet=True)
+
+    def _get_cached_newer_version(self) -> Optional[str]:
+        """使用紀錄檔中的版本號檢查是否有新版本
+
+        Returns:
+            Optional[str]: 紀錄檔中的版本號比目前版本新時回傳該版本號；沒有紀錄或無法比較時回傳 None
+        """
+        cached_tag = self._read_cached_tag()
+        if cached_tag is None:
+            return None
+
+        try:
+            return self._get_newer_version(cached_tag)
+        except Exception:
+            # 紀錄檔內容異常，等到下次查詢時再覆寫
+            return None
+
+    def start_background_check(self) -> Callable[[], None]:
+        """在背景執行緒中檢查更新，不等待檢查結果，命令可以直接繼續執行
 
-        newest_version = self.check_for_updates_version()
+        Returns:
+            Callable[[], None]: 於命令結束時呼叫，檢查已完成且有新版本時印出更新訊息；
+                尚未完成時不再等待，查到的版本號會記錄在紀錄檔中，於之後執行命令時提示
+        """
+        result: List[Optional[str]] = []
+        check_thread = threading.Thread(target=lambda: result.append(self.run_version_check()), daemon=True)
+        check_thread.start()
 
-        if newest_version:
-            self.print_update_message(newest_version)
+        def print_pending_update_message() -> None:
+            if result and result[0]:
+                self.print_update_message(result[0])
 
-        self.save_latest_check_time()
+        return print_pending_update_message
@@ -0,0 +1,8 @@
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """共用的 CliRunner，每次 invoke 都會各自建立隔離的執行環境，可以安全地在測試間共用"""
+    return CliRunner()
@@ -12,7 +12,7 @@ from commit_assistant.utils.style_utils import CommitStyleManager
 @pytest.fixture
 def mock_genai() -> Generator[Mock, None, None]:
     """模擬 Google Generative AI"""
-    with patch("google.genai") as mock:
+    with patch("google.genai", create=True) as mock:
         client_instance = Mock()
         mock.Client.return_value = client_instance
         client_instance.models.generate_content.return_value = Mock(text="generated text")
@@ -31,11 +31,22 @@ def test_init_with_api_key(mock_genai: Mock) -> None:
     with patch.dict("os.environ", {"GEMINI_API_KEY": "test-key", ConfigKey.USE_MODEL.value: "test-model"}):
         generator = BaseGeminiAIGenerator()
 
-        mock_genai.Client.assert_called_once_with(api_key="test-key")
         assert generator.model == "test-model"
         assert isinstance(generator.style_manager, CommitStyleManager)
 
 
+def test_client_created_lazily(mock_genai: Mock) -> None:
+    """測試 Gemini client 在第一次使用時才建立，且只建立一次"""
+    with patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"}):
+        generator = BaseGeminiAIGenerator()
+        mock_genai.Client.assert_not_called()
+
+        generator._generate_content("first prompt")
+        generator._generate_content("second prompt")
+
+        mock_genai.Client.assert_called_once_with(api_key="test-key")
+
+
 def test_init_with_default_model(mock_genai: Mock) -> None:
     """測試使用預設模型的情況"""
     with patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"}):
@@ -52,6 +63,16 @@ def test_init_with_claude_cli() -> None:
     assert isinstance(generator.style_manager, CommitStyleManager)
 
 
+def test_style_manager_shared_between_instances() -> None:
+    """測試多個 generator 共用同一個風格管理器"""
+    with patch.object(BaseGeminiAIGenerator, "_style_manager", None):
+        with patch.dict("os.environ", {ConfigKey.USE_CLAUDE_CLI.value: "true"}, clear=True):
+            first = BaseGeminiAIGenerator()
+            second = BaseGeminiAIGenerator()
+
+        assert first.style_manager is second.style_manager
+
+
 def test_generate_content_success(mock_genai: Mock) -> None:
     """測試成功生成內容（Gemini）"""
     with patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"}):
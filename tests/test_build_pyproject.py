@@ -65,3 +65,13 @@ def test_update_pyproject_toml_permission_error(mock_root_dir: Path, mock_config
     with patch("builtins.open", side_effect=PermissionError("Permission denied")):
         with pytest.raises(PermissionError):
             update_pyproject_toml()
+
+
+def test_update_pyproject_toml_unchanged(mock_root_dir: Path, mock_config: dict) -> None:
+    """測試內容沒有變動時，不會重新寫入檔案"""
+    update_pyproject_toml()
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        update_pyproject_toml()
+
+    assert all("wb" not in call.args for call in mock_open.call_args_list)
@@ -1,17 +1,19 @@
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from commit_assistant.cli import cli
+from commit_assistant.cli import LazyGroup, cli
 from commit_assistant.core.project_config import ProjectInfo
 
 cli_module = sys.modules["commit_assistant.cli"]
 
 
-def test_cli_version() -> None:
+def test_cli_version(runner: CliRunner) -> None:
     """測試顯示版本資訊"""
-    runner = CliRunner()
     result = runner.invoke(cli, ["--version"])
 
     # 檢查是否有成功執行
@@ -21,9 +23,8 @@ def test_cli_version() -> None:
     assert ProjectInfo.NAME in result.output
 
 
-def test_cli_help() -> None:
+def test_cli_help(runner: CliRunner) -> None:
     """測試 CLI help 指令"""
-    runner = CliRunner()
     result = runner.invoke(cli, ["--help"])
 
     # 檢查是否有成功執行
@@ -38,9 +39,8 @@ def test_cli_help() -> None:
     assert "update" in result.output
 
 
-def test_cli_without_command() -> None:
+def test_cli_without_command(runner: CliRunner) -> None:
     """測試沒有指定子命令時的行為"""
-    runner = CliRunner()
     result = runner.invoke(cli)
 
     # 應該顯示幫助訊息而不是錯誤
@@ -49,29 +49,106 @@ def test_cli_without_command() -> None:
 
 
 @patch.object(cli_module, "UpgradeChecker")
-def test_upgrade_check_on_commands(mock_upgrade_checker: MagicMock) -> None:
+def test_upgrade_check_on_commands(mock_upgrade_checker: MagicMock, runner: CliRunner) -> None:
     """測試非 upgrade 命令會觸發版本檢查"""
     mock_checker_instance = MagicMock()
     mock_upgrade_checker.return_value = mock_checker_instance
 
-    runner = CliRunner()
     # 測試隨便一個非 upgrade 的命令
     runner.invoke(cli, ["commit", "--help"])
 
-    # 驗證 UpgradeChecker 被初始化並執行了檢查
+    # 驗證 UpgradeChecker 被初始化並在背景執行了檢查
     mock_upgrade_checker.assert_called_once()
-    mock_checker_instance.run_version_check.assert_called_once()
+    mock_checker_instance.start_background_check.assert_called_once()
+    # 命令結束時才提示檢查的結果
+    mock_checker_instance.start_background_check.return_value.assert_called_once()
 
 
 @patch.object(cli_module, "UpgradeChecker")
-def test_upgrade_check_on_upgrade_command(mock_upgrade_checker: MagicMock) -> None:
+def test_upgrade_check_on_upgrade_command(mock_upgrade_checker: MagicMock, runner: CliRunner) -> None:
     """測試 upgrade 命令不會觸發版本檢查"""
     mock_checker_instance = MagicMock()
     mock_upgrade_checker.return_value = mock_checker_instance
 
-    runner = CliRunner()
     # 測試 upgrade 命令
     runner.invoke(cli, ["upgrade", "--help"])
 
     # 驗證 UpgradeChecker 沒有執行檢查
     mock_upgrade_checker.assert_not_called()
+
+
+def test_lazy_group_list_commands() -> None:
+    """測試 LazyGroup 會列出所有延遲載入的子命令"""
+    ctx = click.Context(cli)
+
+    assert cli.list_commands(ctx) == sorted(LazyGroup.lazy_subcommands)
+
+
+def test_lazy_group_list_commands_ignore_argv(monkeypatch: pytest.MonkeyPatch, runner: CliRunner) -> None:
+    """測試子命令列表不受行程的 sys.argv 影響，只依照 click 實際解析的參數"""
+    monkeypatch.setattr(sys, "argv", ["pytest", "-k", "commit"])
+
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LazyGroup.lazy_subcommands:
+        assert name in result.output
+
+
+def test_lazy_group_get_command() -> None:
+    """測試 LazyGroup 在取得子命令時才載入對應模組"""
+    ctx = click.Context(cli)
+
+    command = cli.get_command(ctx, "config")
+
+    assert isinstance(command, click.Group)
+    assert command.name == "config"
+
+
+def test_lazy_group_get_unknown_command() -> None:
+    """測試 LazyGroup 取得不存在的子命令時回傳 None"""
+    ctx = click.Context(cli)
+
+    assert cli.get_command(ctx, "not-exist") is None
+
+
+def test_cli_import_does_not_load_subcommands() -> None:
+    """測試載入 cli 時不會一併載入任何子命令模組"""
+    code = (
+        "import sys, commit_assistant.cli; "
+        "print(any(m.startswith('commit_assistant.commands.') for m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_import_does_not_load_generator() -> None:
+    """測試載入 cli 時不會一併載入 AI 生成器模組"""
+    code = "import sys, commit_assistant.cli; print('commit_assistant.core.base_generator' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_import_does_not_load_unused_utils() -> None:
+    """測試載入 cli 時不會因為 utils 套件而載入其他用不到的工具模組"""
+    code = (
+        "import sys, commit_assistant.cli; "
+        "print([m for m in ('commit_assistant.utils.hook_manager', 'commit_assistant.utils.style_utils') "
+        "if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("command", ["config", "style"])
+@patch.object(cli_module, "UpgradeChecker")
+def test_upgrade_check_skipped_on_local_commands(
+    mock_upgrade_checker: MagicMock, command: str, runner: CliRunner
+) -> None:
+    """測試只有本地操作的命令不會觸發版本檢查"""
+    runner.invoke(cli, [command, "--help"])
+
+    mock_upgrade_checker.assert_not_called()
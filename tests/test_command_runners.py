@@ -1,11 +1,19 @@
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Generator, Optional
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from commit_assistant.utils.command_runners import CommandRunner, GitCommandRunner
+from commit_assistant.utils import command_runners
+from commit_assistant.utils.command_runners import (
+    _SYSTEM_ENCODING,
+    CommandRunner,
+    GitCommandRunner,
+    _resolve_system_encoding,
+)
 
 
 @pytest.fixture
@@ -22,102 +30,93 @@ def git_runner(git_repo: Path) -> GitCommandRunner:
     return GitCommandRunner(str(git_repo))
 
 
-def test_init_encoding_windows(git_repo: Path) -> None:
+def test_resolve_encoding_windows() -> None:
     """測試 Windows 平台的編碼設定"""
     with patch("sys.platform", "win32"):
-        runner = GitCommandRunner(str(git_repo))
-        assert runner.system_encoding == "utf-8"
-
-
-@patch("subprocess.Popen")
-@patch("os.environ.copy")
-def test_run_command_without_env(mock_environ_copy: MagicMock, mock_popen: MagicMock) -> None:
-    """測試執行命令不帶額外環境變數"""
-    # 設置模擬對象的返回值
-    mock_process = MagicMock()
-    mock_process.returncode = 0
-    mock_process.communicate.return_value = ("command output", "")
-    mock_popen.return_value = mock_process
-
-    mock_env: dict[str, str] = {}
-    mock_environ_copy.return_value = mock_env
-
-    # 建立 CommandRunner 並執行命令
-    runner = CommandRunner()
-    with patch.object(runner, "system_encoding", "utf-8"):
-        result = runner.run_command(["git", "status"])
+        assert _resolve_system_encoding() == "utf-8"
 
-    # 驗證環境變數有正確被設置
-    assert mock_env["PYTHONIOENCODING"] == "utf-8"
-    assert mock_env["LANG"] == "zh_TW.utf-8"
 
-    # 驗證 subprocess.Popen 被正確調用
-    mock_popen.assert_called_once()
-    args, kwargs = mock_popen.call_args
-    assert args[0] == ["git", "status"]
-    assert kwargs["env"] == mock_env
-    assert kwargs["encoding"] == "utf-8"
-    assert result == "command output"
+def test_init_encoding(git_repo: Path) -> None:
+    """測試 runner 直接使用載入模組時取得的編碼"""
+    with patch("locale.getpreferredencoding") as mock_encoding:
+        runner = GitCommandRunner(str(git_repo))
 
+    assert runner.system_encoding == _SYSTEM_ENCODING
+    mock_encoding.assert_not_called()
 
-@patch("subprocess.Popen")
-@patch("os.environ.copy")
-def test_run_command_with_env(mock_environ_copy: MagicMock, mock_popen: MagicMock) -> None:
-    """測試執行命令帶額外環境變數"""
-    # 設置模擬對象的返回值
-    mock_process = MagicMock()
-    mock_process.returncode = 0
-    mock_process.communicate.return_value = ("command output", "")
-    mock_popen.return_value = mock_process
 
-    base_env = {"PATH": "/usr/bin", "HOME": "/home/user"}
-    mock_environ_copy.return_value = base_env.copy()
+@pytest.fixture
+def mock_run() -> Generator[MagicMock, None, None]:
+    """模擬 subprocess.run，預設回傳執行成功"""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="command output", stderr="")
+        yield mock_run
 
-    # 創建額外的環境變數
-    custom_env = {"GIT_DIR": "/custom/git", "CUSTOM_VAR": "value"}
 
-    # 創建 CommandRunner 實例並執行命令
+@pytest.fixture
+def mock_environ_copy() -> Generator[MagicMock, None, None]:
+    """模擬 os.environ.copy，回傳固定的基本環境變數"""
+    with patch("os.environ.copy", return_value={"PATH": "/usr/bin", "HOME": "/home/user"}) as mock_copy:
+        yield mock_copy
+
+
+@pytest.mark.parametrize(
+    "env, cwd",
+    [
+        (None, None),
+        ({"GIT_DIR": "/custom/git", "CUSTOM_VAR": "value"}, Path("/some/path")),
+    ],
+    ids=["without_env", "with_env"],
+)
+@patch.object(command_runners, "_COMMAND_LANG", "zh_TW.utf-8")
+def test_run_command_env(
+    mock_environ_copy: MagicMock, mock_run: MagicMock, env: Optional[Dict[str, str]], cwd: Optional[Path]
+) -> None:
+    """測試執行命令時，環境變數會加上額外的環境變數與編碼設定"""
     runner = CommandRunner()
     with patch.object(runner, "system_encoding", "utf-8"):
-        result = runner.run_command(["git", "status"], env=custom_env, cwd=Path("/some/path"))
+        result = runner.run_command(["git", "status"], env=env, cwd=cwd)
 
     # 預期被更新後的環境變數
     expected_env = {
         "PATH": "/usr/bin",
         "HOME": "/home/user",
-        "GIT_DIR": "/custom/git",
-        "CUSTOM_VAR": "value",
+        **(env or {}),
         "PYTHONIOENCODING": "utf-8",
         "LANG": "zh_TW.utf-8",
     }
 
-    # 驗證 my_env.update(env) 是否正確執行
-    for key, value in custom_env.items():
-        assert key in mock_environ_copy.return_value
-        assert mock_environ_copy.return_value[key] == value
-
-    # 驗證 subprocess.Popen 被正確調用
-    mock_popen.assert_called_once()
-    args, kwargs = mock_popen.call_args
+    # 驗證 subprocess.run 被正確調用
+    mock_run.assert_called_once()
+    args, kwargs = mock_run.call_args
     assert args[0] == ["git", "status"]
     assert kwargs["env"] == expected_env
     assert kwargs["encoding"] == "utf-8"
-    assert kwargs["cwd"] == Path("/some/path")
+    assert kwargs["cwd"] == cwd
+    assert kwargs["capture_output"] is True
     assert result == "command output"
 
 
-def test_init_encoding_linux(git_repo: Path) -> None:
+def test_resolve_encoding_linux() -> None:
     """測試 Linux 平台的編碼設定"""
     with patch("sys.platform", "linux"), patch("locale.getpreferredencoding", return_value="UTF-8"):
-        runner = GitCommandRunner(str(git_repo))
-        assert runner.system_encoding == "UTF-8"
+        assert _resolve_system_encoding() == "UTF-8"
 
 
-def test_init_encoding_mac(git_repo: Path) -> None:
+def test_resolve_encoding_mac() -> None:
     """測試 MacOS 平台的編碼設定"""
     with patch("sys.platform", "darwin"), patch("locale.getpreferredencoding", return_value="UTF-8"):
-        runner = GitCommandRunner(str(git_repo))
-        assert runner.system_encoding == "UTF-8"
+        assert _resolve_system_encoding() == "UTF-8"
+
+
+@patch.object(command_runners, "_COMMAND_LANG", None)
+def test_run_command_without_lang(mock_environ_copy: MagicMock, mock_run: MagicMock) -> None:
+    """測試不需要指定語系的平台 (Windows)，不會設定 LANG"""
+    CommandRunner().run_command(["git", "status"])
+
+    env = mock_run.call_args.kwargs["env"]
+    assert "LANG" not in env
+    assert "PYTHONIOENCODING" in env
 
 
 def test_validate_repo(git_repo: Path) -> None:
@@ -156,6 +155,124 @@ def test_get_staged_diff(git_runner: GitCommandRunner) -> None:
         mock_run.assert_called_once_with(["git", "diff", "--cached"])
 
 
+def test_get_staged_diff_with_limit(git_runner: GitCommandRunner) -> None:
+    """測試設定上限時改為逐段讀取 diff 內容"""
+    with patch.object(git_runner, "stream_git_command", return_value="partial diff") as mock_stream:
+        diff = git_runner.get_staged_diff(max_bytes=10)
+
+    assert diff == "partial diff"
+    mock_stream.assert_called_once_with(["git", "diff", "--cached"], 10)
+
+
+def test_stream_git_command_within_limit(git_runner: GitCommandRunner) -> None:
+    """測試輸出未超過上限時回傳完整內容"""
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.write('hello diff')"]
+
+    assert git_runner.stream_git_command(cmd, max_bytes=1024) == "hello diff"
+
+
+def test_stream_git_command_exact_limit(git_runner: GitCommandRunner) -> None:
+    """測試輸出剛好等於上限時不視為截斷"""
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.write('12345')"]
+
+    with patch.object(command_runners.console, "print") as mock_print:
+        assert git_runner.stream_git_command(cmd, max_bytes=5) == "12345"
+
+    mock_print.assert_not_called()
+
+
+def test_stream_git_command_truncated(git_runner: GitCommandRunner) -> None:
+    """測試輸出超過上限時只保留前面的內容並結束程序"""
+    # 輸出量遠大於 pipe 緩衝區，沒有結束程序的話會一直阻塞
+    cmd = [sys.executable, "-c", "import sys\nwhile True: sys.stdout.write('x' * 65536)"]
+
+    with (
+        patch.object(command_runners, "_STREAM_CHUNK_SIZE", 4),
+        patch.object(command_runners.console, "print") as mock_print,
+    ):
+        result = git_runner.stream_git_command(cmd, max_bytes=10)
+
+    assert result == "x" * 10
+    assert "超過 10 bytes" in mock_print.call_args[0][0]
+
+
+def test_stream_git_command_truncated_multibyte(git_runner: GitCommandRunner) -> None:
+    """測試截斷位置在多 byte 字元中間時忽略不完整的字元"""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdout.read.side_effect = ["中文".encode("utf-8")[:4], b"x"]
+
+    with (
+        patch("subprocess.Popen", return_value=process),
+        patch.object(git_runner, "system_encoding", "utf-8"),
+    ):
+        result = git_runner.stream_git_command(["git", "diff", "--cached"], max_bytes=4)
+
+    assert result == "中"
+    process.kill.assert_called_once()
+
+
+def test_stream_git_command_truncated_keep_invalid_bytes(git_runner: GitCommandRunner) -> None:
+    """測試截斷時，只捨棄最後不完整的字元，其他無法解碼的 byte 以替代字元表示"""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdout.read.side_effect = [b"a\xffb" + "中".encode("utf-8")[:2], b"x"]
+
+    with (
+        patch("subprocess.Popen", return_value=process),
+        patch.object(git_runner, "system_encoding", "utf-8"),
+    ):
+        result = git_runner.stream_git_command(["git", "diff", "--cached"], max_bytes=5)
+
+    assert result == "a\ufffdb"
+
+
+def test_stream_git_command_invalid_bytes_not_truncated(git_runner: GitCommandRunner) -> None:
+    """測試未截斷時，無法解碼的 byte 以替代字元表示"""
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'a\\xffb')"]
+
+    with patch.object(git_runner, "system_encoding", "utf-8"):
+        assert git_runner.stream_git_command(cmd, max_bytes=1024) == "a\ufffdb"
+
+
+def test_stream_git_command_large_stderr(git_runner: GitCommandRunner) -> None:
+    """測試 stderr 輸出量超過 pipe 緩衝區時，不會卡住"""
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; sys.stderr.write('w' * 1024 * 1024); sys.stderr.flush(); sys.stdout.write('done')",
+    ]
+
+    assert git_runner.stream_git_command(cmd, max_bytes=1024) == "done"
+
+
+def test_stream_git_command_error(git_runner: GitCommandRunner) -> None:
+    """測試命令執行失敗時拋出錯誤"""
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(2)"]
+
+    with patch.object(command_runners.console, "print") as mock_print:
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            git_runner.stream_git_command(cmd, max_bytes=1024)
+
+    assert exc_info.value.returncode == 2
+    assert "boom" in mock_print.call_args_list[0][0][0]
+
+
+def test_get_staged_changes(git_runner: GitCommandRunner) -> None:
+    """測試同時獲取暫存的檔案列表與 diff 內容"""
+    outputs = {
+        ("git", "diff", "--cached", "--name-only"): "file1.py\nfile2.py",
+        ("git", "diff", "--cached"): "mock diff content",
+    }
+
+    with patch.object(git_runner, "run_git_command", side_effect=lambda cmd: outputs[tuple(cmd)]) as mock_run:
+        files, diff = git_runner.get_staged_changes()
+
+    assert files == ["file1.py", "file2.py"]
+    assert diff == "mock diff content"
+    assert mock_run.call_count == 2
+
+
 def test_get_commits_in_date_range(git_runner: GitCommandRunner) -> None:
     """測試獲取指定日期範圍內的 commits"""
     start_dt = datetime(2024, 2, 1)
@@ -171,6 +288,7 @@ def test_get_commits_in_date_range(git_runner: GitCommandRunner) -> None:
         mock_run.assert_called_once()
         # 驗證命令參數
         cmd = mock_run.call_args[0][0]
+        assert "--format=%B" in cmd
         assert "--since=2024-02-01 00:00:00" in cmd
         assert "--until=2024-02-15 00:00:00" in cmd
         assert "--author" in cmd
@@ -219,21 +337,17 @@ def test_get_commits_in_date_range_author_is_empty_str(git_runner: GitCommandRun
 
 def test_run_git_command_success(git_runner: GitCommandRunner) -> None:
     """測試成功執行 git 命令"""
-    mock_process = Mock()
-    mock_process.returncode = 0
-    mock_process.communicate.return_value = ("output", "")
+    mock_result = Mock(returncode=0, stdout="output", stderr="")
 
-    with patch("subprocess.Popen", return_value=mock_process):
+    with patch("subprocess.run", return_value=mock_result):
         output = git_runner.run_git_command(["git", "status"])
         assert output == "output"
 
 
 def test_run_git_command_error(git_runner: GitCommandRunner) -> None:
     """測試執行 git 命令失敗"""
-    mock_process = Mock()
-    mock_process.returncode = 1
-    mock_process.communicate.return_value = ("", "error message")
+    mock_result = Mock(returncode=1, stdout="", stderr="error message")
 
-    with patch("subprocess.Popen", return_value=mock_process):
+    with patch("subprocess.run", return_value=mock_result):
         with pytest.raises(subprocess.CalledProcessError):
             git_runner.run_git_command(["git", "invalid-command"])
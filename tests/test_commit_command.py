@@ -1,3 +1,4 @@
+import subprocess
 import sys
 from pathlib import Path
 from typing import Generator
@@ -10,6 +11,7 @@ from commit_assistant.commands.commit import (
     EnhancedCommitGenerator,
     ExitCode,
     UserChoices,
+    _is_commit_assistant_enabled,
     commit,
     edit_commit_message,
     get_user_choice,
@@ -26,8 +28,7 @@ def mock_git_runner() -> Generator[Mock, None, None]:
     """模擬 GitCommandRunner"""
     with patch.object(commit_module, "GitCommandRunner") as mock:
         runner = mock.return_value
-        runner.get_staged_files.return_value = ["file1.py", "file2.py"]
-        runner.get_staged_diff.return_value = "mock diff content"
+        runner.get_staged_changes.return_value = (["file1.py", "file2.py"], "mock diff content")
         yield runner
 
 
@@ -43,7 +44,7 @@ def mock_generator() -> Generator[Mock, None, None]:
 # EnhancedCommitGenerator 測試
 def test_generate_structured_message() -> None:
     """測試生成結構化的 commit message"""
-    with patch("google.genai") as mock_genai:
+    with patch("google.genai", create=True) as mock_genai:
         mock_genai.Client.return_value = Mock()
         with patch.dict("os.environ", {ConfigKey.GEMINI_API_KEY.value: "test_api_key"}):
             generator = EnhancedCommitGenerator()
@@ -63,7 +64,7 @@ def test_generate_structured_message() -> None:
 
 def test_generate_structured_message_error() -> None:
     """測試生成結構化的 commit message 出現錯誤"""
-    with patch("google.genai") as mock_genai:
+    with patch("google.genai", create=True) as mock_genai:
         mock_genai.Client.return_value = Mock()
         with patch.dict("os.environ", {ConfigKey.GEMINI_API_KEY.value: "test_api_key"}):
             generator = EnhancedCommitGenerator()
@@ -93,7 +94,7 @@ def test_get_user_choice(monkeypatch: pytest.MonkeyPatch) -> None:
     ]
 
     # 模擬使用者輸入 2
-    monkeypatch.setattr("builtins.input", lambda _: "2")
+    monkeypatch.setattr("click.termui.visible_prompt_func", lambda _: "2")
 
     user_choice = get_user_choice(choices)
 
@@ -110,21 +111,33 @@ def test_get_user_choice_invalid_then_valid(monkeypatch: pytest.MonkeyPatch) ->
     ]
 
     inputs = iter(["0", "abc", "1"])  # 先輸入無效選項，最後輸入有效選項 1
-    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    monkeypatch.setattr("click.termui.visible_prompt_func", lambda _: next(inputs))
 
     user_choice = get_user_choice(choices)
 
     assert user_choice == UserChoices.USE_AI_MESSAGE.value
 
 
+def test_get_user_choice_abort(monkeypatch: pytest.MonkeyPatch) -> None:
+    """測試使用者在選擇時按下 Ctrl+C"""
+    choices = [UserChoices.USE_AI_MESSAGE.value, UserChoices.CANCEL_OPERATION.value]
+
+    def _raise_interrupt(_: str) -> str:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("click.termui.visible_prompt_func", _raise_interrupt)
+
+    assert get_user_choice(choices) is None
+
+
 # commit 命令測試
-def test_commit_command_success(mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path) -> None:
+def test_commit_command_success(
+    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
     """測試 commit 命令成功"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬使用者選擇直接使用 AI 訊息
     with patch.object(commit_module, "get_user_choice", return_value=UserChoices.USE_AI_MESSAGE.value):
         result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -133,26 +146,55 @@ def test_commit_command_success(mock_git_runner: Mock, mock_generator: Mock, tmp
     assert msg_file.read_text() == "feat: test commit message"
 
 
-def test_commit_command_no_staged_files(mock_git_runner: Mock, tmp_path: Path) -> None:
+def test_update_commit_message_strip_code_fence(tmp_path: Path) -> None:
+    """測試寫入 commit message 時，會去除頭尾的空白與 ``` 符號"""
+    msg_file = tmp_path / "COMMIT_MSG"
+
+    with patch.object(commit_module, "get_user_choice", return_value=UserChoices.USE_AI_MESSAGE.value):
+        exit_code, need_regenerate = commit_module.update_commit_message(
+            str(msg_file), "  ```\nfeat: fenced message\n\n- detail\n```\n"
+        )
+
+    assert exit_code == ExitCode.SUCCESS.value
+    assert need_regenerate is False
+    assert msg_file.read_text(encoding="utf-8") == "feat: fenced message\n\n- detail"
+
+
+def test_commit_command_no_staged_files(mock_git_runner: Mock, tmp_path: Path, runner: CliRunner) -> None:
     """測試 git stage 沒有任何檔案的情況"""
-    mock_git_runner.get_staged_files.return_value = []
+    mock_git_runner.get_staged_changes.return_value = ([], "")
 
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
     result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
 
     assert result.exit_code == ExitCode.CANCEL.value
     assert "沒有發現暫存的變更" in result.output
 
 
-def test_commit_command_user_cancel(mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path) -> None:
-    """測試使用者直接 Ctrl+C 取消操作"""
+def test_commit_command_empty_diff(
+    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
+    """測試有暫存檔案但 diff 內容為空的情況"""
+    mock_git_runner.get_staged_changes.return_value = (["file1.py"], "  \n")
+
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
+    result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
+
+    assert result.exit_code == ExitCode.CANCEL.value
+    assert "暫存的變更沒有任何 diff 內容" in result.output
+    commit_module.EnhancedCommitGenerator.assert_not_called()
+
+
+def test_commit_command_user_cancel(
+    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
+    """測試使用者直接 Ctrl+C 取消操作"""
+    msg_file = tmp_path / "COMMIT_MSG"
+    msg_file.touch()
 
     # 模擬使用者直接 Ctrl+C 取消操作
     mock_generator.generate_structured_message.side_effect = KeyboardInterrupt
@@ -162,13 +204,13 @@ def test_commit_command_user_cancel(mock_git_runner: Mock, mock_generator: Mock,
     assert "操作已取消" in result.output
 
 
-def test_commit_command_error(mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path) -> None:
+def test_commit_command_error(
+    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
     """測試執行 commit 指令的時候發生錯誤"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬生成 commit message 時發生錯誤
     mock_generator.generate_structured_message.side_effect = Exception("mock error")
     result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -178,13 +220,13 @@ def test_commit_command_error(mock_git_runner: Mock, mock_generator: Mock, tmp_p
     assert "mock error" in result.output
 
 
-def test_commit_command_generate_error(mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path) -> None:
+def test_commit_command_generate_error(
+    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
     """測試生成 commit message 時發生錯誤"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬生成 commit message 時發生錯誤 (返回 None)
     mock_generator.generate_structured_message.return_value = None
     result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -193,13 +235,11 @@ def test_commit_command_generate_error(mock_git_runner: Mock, mock_generator: Mo
     assert "✗ 生成 commit message 失敗" in result.output
 
 
-def test_commit_command_not_enable(tmp_path: Path) -> None:
+def test_commit_command_not_enable(tmp_path: Path, runner: CliRunner) -> None:
     """測試設定中不啟用 commit assistant"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬設定中不啟用 commit assistant
     with patch.dict("os.environ", {"ENABLE_COMMIT_ASSISTANT": "false"}):
         result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -207,15 +247,39 @@ def test_commit_command_not_enable(tmp_path: Path) -> None:
     assert result.exit_code == ExitCode.SUCCESS.value
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("true", True),
+        ("True", True),  # load_config 預設寫入的值
+        (" on ", True),
+        ("1", True),
+        ("false", False),
+        ("", False),
+    ],
+)
+def test_is_commit_assistant_enabled(value: str, expected: bool) -> None:
+    """測試判斷是否啟用 commit assistant"""
+    with patch.dict("os.environ", {ConfigKey.ENABLE_COMMIT_ASSISTANT.value: value}):
+        assert _is_commit_assistant_enabled() is expected
+
+
+def test_is_commit_assistant_enabled_default() -> None:
+    """測試未設定時預設啟用 commit assistant"""
+    with patch.dict("os.environ", {}, clear=True):
+        assert _is_commit_assistant_enabled() is True
+
+
 def test_commit_command_user_cancel_update_commit_message(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者在更新 message 檔案時，選擇取消作業"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬使用者選擇取消
     with patch.object(commit_module, "get_user_choice", return_value=UserChoices.CANCEL_OPERATION.value):
         result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -225,14 +289,15 @@ def test_commit_command_user_cancel_update_commit_message(
 
 
 def test_commit_command_user_choice_not_in_choices(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者在更新 message 檔案時，使用者選擇意外的不在選項中"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬使用者選擇非預期的選項
     with patch.object(commit_module, "get_user_choice", return_value="unexpected choice"):
         result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -242,14 +307,15 @@ def test_commit_command_user_choice_not_in_choices(
 
 
 def test_commit_command_user_update_commit_message_error(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者在更新 message 檔案時，發生錯誤"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬 get_user_choice 函數發生錯誤
     with patch.object(commit_module, "get_user_choice", side_effect=Exception("mock error")):
         result = runner.invoke(commit, ["--msg-file", str(msg_file), "--repo-path", str(tmp_path)])
@@ -259,14 +325,15 @@ def test_commit_command_user_update_commit_message_error(
 
 
 def test_commit_command_user_edit_update_commit_message(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者在更新 message 檔案時，選擇編輯作業"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬使用者選擇編輯
     with patch.object(commit_module, "get_user_choice", return_value=UserChoices.EDIT_AI_MESSAGE.value):
         # 模擬使用者編輯內容後，確認作業
@@ -278,14 +345,15 @@ def test_commit_command_user_edit_update_commit_message(
 
 
 def test_commit_command_user_cancel_edit_update_commit_message(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者在更新 message 檔案時，選擇編輯作業時取消"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬使用者選擇編輯
     with patch.object(commit_module, "get_user_choice", return_value=UserChoices.EDIT_AI_MESSAGE.value):
         # 模擬使用者開始編輯後，取消作業
@@ -344,14 +412,15 @@ def test_edit_commit_message_retry_then_confirm() -> None:
 
 # Regenerate 相關測試
 def test_commit_command_user_regenerate_once(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者選擇重新生成一次後使用 AI 訊息"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬 AI 生成兩次不同的訊息
     mock_generator.generate_structured_message.side_effect = [
         "feat: first generated message",
@@ -376,14 +445,15 @@ def test_commit_command_user_regenerate_once(
 
 
 def test_commit_command_user_regenerate_multiple_times(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者多次重新生成後才使用 AI 訊息"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬 AI 生成三次不同的訊息
     mock_generator.generate_structured_message.side_effect = [
         "feat: first message",
@@ -411,14 +481,15 @@ def test_commit_command_user_regenerate_multiple_times(
 
 
 def test_commit_command_user_regenerate_then_edit(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者選擇重新生成後，再編輯訊息"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬 AI 生成兩次不同的訊息
     mock_generator.generate_structured_message.side_effect = [
         "feat: first message",
@@ -443,14 +514,15 @@ def test_commit_command_user_regenerate_then_edit(
 
 
 def test_commit_command_user_regenerate_then_cancel(
-    mock_git_runner: Mock, mock_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試使用者選擇重新生成後，再取消操作"""
     msg_file = tmp_path / "COMMIT_MSG"
     msg_file.touch()
 
-    runner = CliRunner()
-
     # 模擬 AI 生成兩次不同的訊息
     mock_generator.generate_structured_message.side_effect = [
         "feat: first message",
@@ -470,3 +542,11 @@ def test_commit_command_user_regenerate_then_cancel(
     assert "Commit 已取消" in result.output
     # 確認 generate_structured_message 被呼叫了兩次
     assert mock_generator.generate_structured_message.call_count == 2
+
+
+def test_import_commit_module_does_not_load_questionary() -> None:
+    """測試載入 commit 模組時，不會一併載入 questionary"""
+    code = "import sys, commit_assistant.commands.commit; print('questionary' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 from typing import Generator
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
@@ -25,9 +25,8 @@ def mock_package_path(tmp_path: Path) -> Generator[Path, None, None]:
         yield tmp_path
 
 
-def test_setup_command(mock_package_path: Path) -> None:
+def test_setup_command(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 setup 命令"""
-    runner = CliRunner()
     result = runner.invoke(setup, input="test-api-key\n")
 
     # 檢查命令是否成功執行
@@ -45,12 +44,10 @@ def test_setup_command(mock_package_path: Path) -> None:
     assert "API Key 已成功保存" in result.output
 
 
-def test_setup_command_permission_error(mock_package_path: Path) -> None:
+def test_setup_command_permission_error(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 setup 命令失敗，權限問題無法寫入 .env 檔案"""
-    runner = CliRunner()
-
-    # 模擬 touch .env 時，權限問題
-    with patch.object(Path, "touch", side_effect=PermissionError("Permission denied")):
+    # 模擬寫入 .env 時，權限問題
+    with patch.object(Path, "write_bytes", side_effect=PermissionError("Permission denied")):
         result = runner.invoke(setup, input="test-api-key\n")
 
         assert result.exit_code == 1
@@ -58,19 +55,10 @@ def test_setup_command_permission_error(mock_package_path: Path) -> None:
         assert "Permission denied" in result.output
 
 
-def test_setup_command_write_error(mock_package_path: Path) -> None:
+def test_setup_command_write_error(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 setup 命令失敗，寫入過程發生錯誤時的處理"""
-    runner: CliRunner = CliRunner()
-
-    # 先創建檔案避免觸發 touch()
-    env_file = mock_package_path / ".env"
-    env_file.touch()
-
-    # 模擬開啟檔案時發生錯誤
-    mock_open_obj = mock_open()
-    mock_open_obj.side_effect = IOError("Disk full")
-
-    with patch("builtins.open", mock_open_obj):
+    # 模擬寫入檔案時發生錯誤
+    with patch.object(Path, "write_bytes", side_effect=IOError("Disk full")):
         result = runner.invoke(setup, input="test-api-key\n")
 
         assert result.exit_code == 1
@@ -78,10 +66,8 @@ def test_setup_command_write_error(mock_package_path: Path) -> None:
         assert "Disk full" in result.output
 
 
-def test_show_command() -> None:
+def test_show_command(runner: CliRunner) -> None:
     """測試 show 命令"""
-    runner = CliRunner()
-
     # 模擬環境變數
     with patch.dict(os.environ, {ConfigKey.GEMINI_API_KEY.value: "test-api-key-12345"}):
         result = runner.invoke(show)
@@ -91,10 +77,8 @@ def test_show_command() -> None:
         assert "test-********12345" in result.output
 
 
-def test_show_command_no_config(mock_package_path: Path) -> None:
+def test_show_command_no_config(mock_package_path: Path, runner: CliRunner) -> None:
     """測試未配置時的 show 命令"""
-    runner = CliRunner()
-
     # 確保環境變數不存在
     with patch.dict(os.environ, {}, clear=True):
         result = runner.invoke(show)
@@ -103,10 +87,8 @@ def test_show_command_no_config(mock_package_path: Path) -> None:
         assert "未配置" in result.output
 
 
-def test_clear_command(mock_package_path: Path) -> None:
+def test_clear_command(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 clear 命令"""
-    runner = CliRunner()
-
     # 創建測試用的 .env 檔案，並先寫入一些內容
     env_file = mock_package_path / ".env"
     env_file.write_text(f"{ConfigKey.GEMINI_API_KEY.value}=test-key")
@@ -118,10 +100,8 @@ def test_clear_command(mock_package_path: Path) -> None:
     assert "配置已清除" in result.output
 
 
-def test_clear_command_and_cancel(mock_package_path: Path) -> None:
+def test_clear_command_and_cancel(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 clear 命令，但取消刪除"""
-    runner = CliRunner()
-
     # 創建測試用的 .env 檔案，並先寫入一些內容
     env_file = mock_package_path / ".env"
     env_file.write_text(f"{ConfigKey.GEMINI_API_KEY.value}=test-key")
@@ -133,19 +113,16 @@ def test_clear_command_and_cancel(mock_package_path: Path) -> None:
     assert "動作已取消" in result.output
 
 
-def test_clear_command_no_file(mock_package_path: Path) -> None:
+def test_clear_command_no_file(mock_package_path: Path, runner: CliRunner) -> None:
     """測試當 .env 不存在時的 clear 命令"""
-    runner = CliRunner()
     result = runner.invoke(clear)
 
     assert result.exit_code == 0
     assert "沒有找到配置文件" in result.output
 
 
-def test_get_api_key(mock_package_path: Path) -> None:
+def test_get_api_key(mock_package_path: Path, runner: CliRunner) -> None:
     """測試 get_api_key 命令"""
-    runner = CliRunner()
-
     # 測試有 API key 的情況
     with patch.dict(os.environ, {ConfigKey.GEMINI_API_KEY.value: "test-api-key-12345"}):
         result = runner.invoke(get_api_key)
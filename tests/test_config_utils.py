@@ -8,6 +8,7 @@ import pytest
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.enums.commit_style import CommitStyle
 from commit_assistant.enums.config_key import ConfigKey
+from commit_assistant.utils import config_utils
 from commit_assistant.utils.config_utils import (
     _add_to_gitignore,
     _load_config_from_config_file,
@@ -75,6 +76,24 @@ def test_load_config_from_config_file(tmp_path: Path) -> None:
     assert "#" not in str(config)  # 確認註解沒有被載入
 
 
+def test_load_config_from_config_file_not_exists(tmp_path: Path) -> None:
+    """測試專案設定檔不存在時，不會載入任何設定"""
+    config: Dict[str, Any] = {}
+    _load_config_from_config_file(config, str(tmp_path))
+
+    assert config == {}
+
+
+def test_load_config_from_config_file_invalid_line(tmp_path: Path) -> None:
+    """測試設定檔中有缺少 '=' 的行時拋出錯誤"""
+    config_dir = tmp_path / ".commit-assistant"
+    config_dir.mkdir()
+    (config_dir / ".commit-assistant-config").write_text("COMMIT_STYLE\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        _load_config_from_config_file({}, str(tmp_path))
+
+
 def test_load_config_from_env(tmp_path: Path) -> None:
     """測試從環境變數載入設定"""
     # 建立測試用的 .env 檔案
@@ -105,6 +124,16 @@ def test_load_config_default_values(tmp_path: Path) -> None:
         assert os.environ[ConfigKey.COMMIT_STYLE.value] == CommitStyle.CONVENTIONAL.value
 
 
+def test_load_config_keep_default_config(tmp_path: Path) -> None:
+    """測試載入設定不會修改到共用的預設值"""
+    default_config = dict(config_utils._DEFAULT_CONFIG)
+
+    with patch.dict(os.environ, {ConfigKey.COMMIT_STYLE.value: CommitStyle.EMOJI.value}):
+        load_config(str(tmp_path))
+
+    assert config_utils._DEFAULT_CONFIG == default_config
+
+
 def test_load_config_priority(tmp_path: Path) -> None:
     """測試設定的優先順序"""
     # 建立 .env 檔案
@@ -46,6 +46,7 @@ def test_backup_existing_hook(hook_manager: HookManager, git_hooks_dir: Path) ->
         assert backup_path.exists()
         assert backup_path.name == "prepare-commit-msg.backup_20240214_120000"
         assert backup_path.read_text() == "original content"
+        assert not hook_path.exists()  # 原本的 hook 已移至備份檔
 
 
 def test_backup_existing_hook_no_hook(hook_manager: HookManager) -> None:
@@ -71,6 +72,17 @@ def test_detect_husky_with_package_json(hook_manager: HookManager, tmp_path: Pat
     assert hook_manager._detect_husky() is True
 
 
+def test_detect_husky_with_package_json_without_husky(hook_manager: HookManager, tmp_path: Path) -> None:
+    """測試 package.json 中沒有 husky 時，不需要解析 json"""
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"devDependencies": {"jest": "^29.0.0"}}')
+
+    with patch("json.loads") as mock_loads:
+        assert not hook_manager._detect_husky()
+
+    mock_loads.assert_not_called()
+
+
 def test_detect_husky_with_package_json_error(hook_manager: HookManager, tmp_path: Path) -> None:
     """測試偵測 package.json 中的 husky，但發生錯誤"""
     package_json = tmp_path / "package.json"
@@ -142,6 +154,39 @@ def test_install_hook_git_with_backup(hook_manager: HookManager, git_hooks_dir:
     assert HookManager.COMMIT_ASSISTANT_MARKER_END in content
 
 
+def test_install_hook_git_unchanged_skip_write(hook_manager: HookManager, git_hooks_dir: Path) -> None:
+    """測試 hook 內容與權限都沒有變化時，不重新寫入也不重新設置權限"""
+    hook_content = "test hook content"
+    hook_manager.install_hook(hook_content)
+
+    with (
+        patch.object(Path, "write_text") as mock_write,
+        patch.object(Path, "chmod") as mock_chmod,
+        patch.object(HookManager, "_backup_existing_hook", return_value=None),
+    ):
+        hook_manager.install_hook(hook_content)
+
+    mock_write.assert_not_called()
+    if sys.platform != "win32":
+        mock_chmod.assert_not_called()
+
+
+def test_install_hook_git_keeps_backup_content(hook_manager: HookManager, git_hooks_dir: Path) -> None:
+    """測試安裝後備份檔仍保留原本的 hook 內容"""
+    hook_path = git_hooks_dir / "prepare-commit-msg"
+    hook_path.write_text("#!/bin/sh\necho original\n", encoding="utf-8")
+
+    hook_manager.install_hook("test hook content")
+
+    backups = [*git_hooks_dir.glob("prepare-commit-msg.backup_*")]
+    assert len(backups) == 1
+    assert backups[0].read_text(encoding="utf-8") == "#!/bin/sh\necho original\n"
+
+    content = hook_path.read_text(encoding="utf-8")
+    assert "echo original" in content
+    assert "test hook content" in content
+
+
 def test_install_hook_husky(hook_manager: HookManager, tmp_path: Path) -> None:
     """測試安裝 husky hook"""
     # 建立 husky 目錄
@@ -167,6 +212,21 @@ def test_install_hook_husky(hook_manager: HookManager, tmp_path: Path) -> None:
     assert HookManager.COMMIT_ASSISTANT_MARKER_END in content
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows 沒有 Unix 的執行權限")
+def test_install_hook_husky_created_executable(hook_manager: HookManager, husky_dir: Path) -> None:
+    """測試建立 husky hook 時直接帶有執行權限，不需要另外設置"""
+    old_umask = os.umask(0o022)
+    try:
+        with patch.object(Path, "chmod") as mock_chmod:
+            hook_manager._install_hook_husky("test hook content")
+    finally:
+        os.umask(old_umask)
+
+    hook_path = husky_dir / "prepare-commit-msg"
+    assert hook_path.stat().st_mode & 0o777 == 0o755
+    mock_chmod.assert_not_called()
+
+
 def test_install_hook_husky_and_husky_hook_already_exists(hook_manager: HookManager, tmp_path: Path) -> None:
     """測試安裝 husky hook，但 husky hook 已經存在，且不包含新版的 marker"""
     # 建立 husky 目錄
@@ -280,6 +340,44 @@ def test_update_git_hook(hook_manager: HookManager, git_hooks_dir: Path) -> None
     assert HookManager.OLD_MARKER not in updated_content  # 確認舊的 marker 已經被移除
 
 
+def test_replace_commit_assistant_section(hook_manager: HookManager) -> None:
+    """測試替換 commit-assistant 部分，保留前後的內容"""
+    start = HookManager.COMMIT_ASSISTANT_MARKER_START
+    end = HookManager.COMMIT_ASSISTANT_MARKER_END
+    current_content = f"#!/bin/sh\nbefore\n{start}\nold content\n{end}\nafter\n"
+
+    # 替換內容中的 \ 需要原樣保留
+    updated_content = hook_manager._replace_commit_assistant_section(current_content, "echo \\1 \\n")
+
+    assert updated_content == f"#!/bin/sh\nbefore\n{start}\necho \\1 \\n\n{end}\nafter\n"
+
+
+def test_replace_commit_assistant_section_unchanged(hook_manager: HookManager) -> None:
+    """測試內容已是最新時直接回傳原本的字串"""
+    current_content = f"#!/bin/sh\n{HookManager.COMMIT_ASSISTANT_MARKER_START}\nsame\n{HookManager.COMMIT_ASSISTANT_MARKER_END}\n"
+
+    assert hook_manager._replace_commit_assistant_section(current_content, "same") is current_content
+
+
+def test_replace_commit_assistant_section_without_end_marker(hook_manager: HookManager) -> None:
+    """測試只有開頭標記、沒有結尾標記時不修改內容"""
+    current_content = f"{HookManager.COMMIT_ASSISTANT_MARKER_START}\nold content\n"
+
+    assert hook_manager._replace_commit_assistant_section(current_content, "new content") == current_content
+
+
+def test_replace_commit_assistant_section_multiple_sections(hook_manager: HookManager) -> None:
+    """測試有多個 commit-assistant 部分時全部替換"""
+    section = f"{HookManager.COMMIT_ASSISTANT_MARKER_START}\nold\n{HookManager.COMMIT_ASSISTANT_MARKER_END}"
+    new_section = (
+        f"{HookManager.COMMIT_ASSISTANT_MARKER_START}\nnew\n{HookManager.COMMIT_ASSISTANT_MARKER_END}"
+    )
+
+    updated_content = hook_manager._replace_commit_assistant_section(f"{section}\nmiddle\n{section}", "new")
+
+    assert updated_content == f"{new_section}\nmiddle\n{new_section}"
+
+
 def test_update_git_hook_but_backup_path_not_exist(hook_manager: HookManager, git_hooks_dir: Path) -> None:
     """測試更新 git hook，但備份的路徑不存在"""
     # 建立舊版本的 hook
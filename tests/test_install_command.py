@@ -48,11 +48,13 @@ def mock_project_paths(tmp_path: Path) -> Generator[Path, None, None]:
 
 
 def test_install_command_success(
-    mock_managers: tuple[Mock, Mock, Mock], mock_project_paths: Path, tmp_path: Path
+    mock_managers: tuple[Mock, Mock, Mock],
+    mock_project_paths: Path,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試安裝命令成功的情況"""
     hook_manager, install_manager, mock_install_config = mock_managers
-    runner = CliRunner()
 
     # 執行安裝命令
     result = runner.invoke(install, ["--repo-path", str(tmp_path)])
@@ -66,10 +68,8 @@ def test_install_command_success(
     install_manager.add_installation.assert_called_once_with(Path(tmp_path))
 
 
-def test_install_command_error_invalid_path() -> None:
+def test_install_command_error_invalid_path(runner: CliRunner) -> None:
     """測試安裝到無效路徑的情況"""
-    runner = CliRunner()
-
     # 執行安裝命令，使用不存在的路徑
     result = runner.invoke(install, ["--repo-path", "/invalid/path"])
 
@@ -78,11 +78,13 @@ def test_install_command_error_invalid_path() -> None:
 
 
 def test_install_command_hook_error(
-    mock_managers: tuple[Mock, Mock, Mock], mock_project_paths: Path, tmp_path: Path
+    mock_managers: tuple[Mock, Mock, Mock],
+    mock_project_paths: Path,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試安裝 hook 失敗的情況"""
     hook_manager, _, _ = mock_managers
-    runner = CliRunner()
 
     # 模擬 hook 安裝失敗
     hook_manager.install_hook.side_effect = Exception("Hook installation failed")
@@ -95,11 +97,13 @@ def test_install_command_hook_error(
 
 
 def test_install_command_config_error(
-    mock_managers: tuple[Mock, Mock, Mock], mock_project_paths: Path, tmp_path: Path
+    mock_managers: tuple[Mock, Mock, Mock],
+    mock_project_paths: Path,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試安裝 config 失敗的情況"""
     _, _, mock_install_config = mock_managers
-    runner = CliRunner()
 
     # 模擬 config 安裝失敗
     mock_install_config.side_effect = Exception("Config installation failed")
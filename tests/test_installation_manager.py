@@ -36,10 +36,55 @@ def test_generate_installation_id(installation_manager: InstallationManager, tmp
     """測試生成安裝的 ID"""
     test_path = tmp_path / "test_repo"
     normalized_path = installation_manager._normalize_path(test_path)
-    expected_id = hashlib.md5(normalized_path.encode()).hexdigest()
+    expected_id = hashlib.blake2b(normalized_path.encode("utf-8"), digest_size=16).hexdigest()
 
-    actual_id = installation_manager._generate_installation_id(test_path)
+    actual_id = installation_manager._generate_installation_id(normalized_path)
     assert actual_id == expected_id
+    assert len(actual_id) == 32
+
+
+def _write_legacy_installation(installation_manager: InstallationManager, repo_path: Path) -> str:
+    """寫入一筆以舊版 md5 ID 產生的安裝紀錄"""
+    normalized_path = installation_manager._normalize_path(repo_path)
+    legacy_id = hashlib.md5(normalized_path.encode()).hexdigest()
+    installation_manager._save_installations(
+        {"installations": {legacy_id: {"id": legacy_id, "repo_path": normalized_path, "version": "0.0.1"}}}
+    )
+    return legacy_id
+
+
+def test_get_installation_with_legacy_id(installation_manager: InstallationManager, tmp_path: Path) -> None:
+    """測試可以讀取舊版 md5 ID 的安裝紀錄"""
+    legacy_id = _write_legacy_installation(installation_manager, tmp_path)
+
+    assert installation_manager.get_installation(tmp_path)["id"] == legacy_id
+
+
+def test_add_installation_replaces_legacy_id(
+    installation_manager: InstallationManager, tmp_path: Path
+) -> None:
+    """測試重新安裝時會移除舊版 md5 ID 的紀錄"""
+    legacy_id = _write_legacy_installation(installation_manager, tmp_path)
+
+    installation_manager.add_installation(tmp_path)
+
+    installations = installation_manager._read_installations()["installations"]
+    assert legacy_id not in installations
+    assert (
+        installation_manager._generate_installation_id(installation_manager._normalize_path(tmp_path))
+        in installations
+    )
+
+
+def test_remove_installation_with_legacy_id(
+    installation_manager: InstallationManager, tmp_path: Path
+) -> None:
+    """測試可以移除舊版 md5 ID 的安裝紀錄"""
+    _write_legacy_installation(installation_manager, tmp_path)
+
+    installation_manager.remove_installation(tmp_path)
+
+    assert installation_manager._read_installations()["installations"] == {}
 
 
 def test_add_installation(installation_manager: InstallationManager, tmp_path: Path) -> None:
@@ -57,7 +102,7 @@ def test_add_installation(installation_manager: InstallationManager, tmp_path: P
     assert installation["repo_path"] == installation_manager._normalize_path(test_repo)
     assert installation["version"] == ProjectInfo.VERSION
     assert "installed_at" in installation
-    assert "last_updated_at" in installation
+    assert installation["last_updated_at"] == installation["installed_at"]
 
 
 def test_get_all_installations(installation_manager: InstallationManager, tmp_path: Path) -> None:
@@ -128,6 +173,22 @@ def test_get_all_installations_with_missing_path(
     assert len(installations) == 0
 
 
+def test_get_all_installations_parallel(installation_manager: InstallationManager, tmp_path: Path) -> None:
+    """測試安裝紀錄較多時，同時檢查路徑並維持原本的順序"""
+    repos = [tmp_path / f"repo{i}" for i in range(6)]
+    for repo in repos:
+        repo.mkdir()
+        installation_manager.add_installation(repo)
+
+    # 刪除其中一個資料夾
+    repos[2].rmdir()
+
+    installations = installation_manager.get_all_installations()
+
+    expected = [installation_manager._normalize_path(repo) for i, repo in enumerate(repos) if i != 2]
+    assert [info["repo_path"] for info in installations] == expected
+
+
 def test_read_installations_with_invalid_file(
     installation_manager: InstallationManager, tmp_path: Path
 ) -> None:
@@ -139,6 +200,32 @@ def test_read_installations_with_invalid_file(
     assert installations == {}
 
 
+def test_read_installations_cached(installation_manager: InstallationManager, tmp_path: Path) -> None:
+    """測試檔案沒有變化時，重複讀取不會重新解析"""
+    installation_manager.add_installation(tmp_path)
+
+    with patch("tomli.loads", return_value={}) as mock_loads:
+        first = installation_manager._read_installations()
+        second = installation_manager._read_installations()
+
+    assert mock_loads.call_count == 1
+    assert first is second
+
+
+def test_read_installations_cache_invalidated_after_save(
+    installation_manager: InstallationManager, tmp_path: Path
+) -> None:
+    """測試儲存後會重新讀取最新的安裝紀錄"""
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+
+    installation_manager.add_installation(tmp_path)
+    assert len(installation_manager._read_installations()["installations"]) == 1
+
+    installation_manager.add_installation(repo_path)
+    assert len(installation_manager._read_installations()["installations"]) == 2
+
+
 def test_save_installations_error(
     installation_manager: InstallationManager, tmp_path: Path, capsys: pytest.CaptureFixture
 ) -> None:
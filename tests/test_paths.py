@@ -62,6 +62,14 @@ def test_get_config_template() -> None:
     assert template_path == ProjectPaths.CONFIG_DIR / config_name
 
 
+def test_get_env_file() -> None:
+    """測試獲取 .env 設定檔路徑"""
+    env_file = ProjectPaths.get_env_file()
+
+    assert isinstance(env_file, Path)
+    assert env_file == ProjectPaths.PACKAGE_DIR / ".env"
+
+
 def test_class_attributes_are_paths() -> None:
     """測試所有類別屬性都是 Path 物件"""
     # 取得所有大寫的類別屬性（慣例上的常數）
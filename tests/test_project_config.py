@@ -19,8 +19,8 @@ def test_project_info_constants() -> None:
     assert ProjectInfo.PYTHON_REQUIRES[2:].replace(".", "").isdigit()
 
 
-def test_dependencies_enum() -> None:
-    """測試相依套件列舉"""
+def test_dependencies_format() -> None:
+    """測試相依套件格式"""
     # 檢查所有相依套件的格式
     for dep in ProjectInfo.get_dependencies():
         # 檢查格式是否為 "package>=version"
@@ -30,8 +30,8 @@ def test_dependencies_enum() -> None:
         assert all(part.isdigit() for part in version.split("."))
 
 
-def test_dev_dependencies_enum() -> None:
-    """測試開發相依套件列舉"""
+def test_dev_dependencies_format() -> None:
+    """測試開發相依套件格式"""
     for dep in ProjectInfo.get_dev_dependencies():
         package, version = dep.split(">=")
         assert package.strip()
@@ -42,23 +42,23 @@ def test_dev_dependencies_enum() -> None:
 def test_get_dependencies() -> None:
     """測試取得相依套件清單"""
     deps = ProjectInfo.get_dependencies()
-    dependencies = ProjectInfo.Dependencies
+    dependencies = ProjectInfo.DEPENDENCIES
 
     assert isinstance(deps, list)
     assert len(deps) == len(dependencies)
     assert all(isinstance(dep, str) for dep in deps)
-    assert all(dep.value in deps for dep in dependencies)
+    assert all(dep in deps for dep in dependencies)
 
 
 def test_get_dev_dependencies() -> None:
     """測試取得開發相依套件清單"""
     dev_deps = ProjectInfo.get_dev_dependencies()
-    dev_dependencies = ProjectInfo.DevDependencies
+    dev_dependencies = ProjectInfo.DEV_DEPENDENCIES
 
     assert isinstance(dev_deps, list)
     assert len(dev_deps) == len(dev_dependencies)
     assert all(isinstance(dep, str) for dep in dev_deps)
-    assert all(dep.value in dev_deps for dep in dev_dependencies)
+    assert all(dep in dev_deps for dep in dev_dependencies)
 
 
 def test_package_data() -> None:
@@ -27,6 +27,7 @@ def test_generate_toml_config() -> None:
 
     # 檢查 pytest 設定
     pytest = tool["pytest"]
+    assert pytest["ini_options"]["testpaths"] == list(ProjectInfo.TEST_PATHS)
     assert pytest["ini_options"]["addopts"] == ProjectInfo.TEST_COMMAND
 
     # 檢查 coverage 設定
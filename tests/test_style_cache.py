@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from commit_assistant.core.project_config import ProjectInfo
+from commit_assistant.utils.style_cache import StyleDescriptionCache
+
+
+@pytest.fixture
+def resources_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """將快取檔案寫到臨時目錄"""
+    resources_dir = tmp_path / "resources"
+    resources_dir.mkdir()
+    with patch("commit_assistant.core.paths.ProjectPaths.RESOURCES_DIR", resources_dir):
+        yield resources_dir
+
+
+@pytest.fixture
+def style_file(tmp_path: Path) -> Path:
+    """建立測試用的 style 檔案"""
+    style_file = tmp_path / "test_style.yaml"
+    style_file.write_text('description: "Test Style"', encoding="utf-8")
+    return style_file
+
+
+def test_get_without_cache(resources_dir: Path, style_file: Path) -> None:
+    """測試沒有快取檔案時，取不到任何 description"""
+    cache = StyleDescriptionCache()
+
+    assert cache.get(str(style_file), style_file.stat()) is None
+
+
+def test_set_and_save(resources_dir: Path, style_file: Path) -> None:
+    """測試寫入快取後，重新讀取仍可取得 description"""
+    cache = StyleDescriptionCache()
+    cache.set(str(style_file), style_file.stat(), "Test Style")
+    cache.save()
+
+    assert (resources_dir / ProjectInfo.STYLE_CACHE_FILE).exists()
+    assert StyleDescriptionCache().get(str(style_file), style_file.stat()) == "Test Style"
+
+
+def test_get_file_changed(resources_dir: Path, style_file: Path) -> None:
+    """測試 style 檔案變動後，快取失效"""
+    cache = StyleDescriptionCache()
+    cache.set(str(style_file), style_file.stat(), "Test Style")
+
+    style_file.write_text('description: "Changed Style"', encoding="utf-8")
+
+    assert cache.get(str(style_file), style_file.stat()) is None
+
+
+def test_save_without_change(resources_dir: Path) -> None:
+    """測試快取沒有變動時，不會寫入檔案"""
+    cache = StyleDescriptionCache()
+    cache.save()
+
+    assert not (resources_dir / ProjectInfo.STYLE_CACHE_FILE).exists()
+
+
+def test_save_remove_missing_files(resources_dir: Path, style_file: Path, tmp_path: Path) -> None:
+    """測試寫入快取時，會移除已經不存在的 style 檔案"""
+    missing_file = tmp_path / "missing.yaml"
+
+    cache = StyleDescriptionCache()
+    cache.set(str(style_file), style_file.stat(), "Test Style")
+    cache.set(str(missing_file), style_file.stat(), "Missing Style")
+    cache.save()
+
+    entries = json.loads((resources_dir / ProjectInfo.STYLE_CACHE_FILE).read_text(encoding="utf-8"))
+    assert str(style_file) in entries
+    assert str(missing_file) not in entries
+
+
+def test_save_error(resources_dir: Path, style_file: Path) -> None:
+    """測試寫入快取失敗時，不會影響執行"""
+    cache = StyleDescriptionCache()
+    cache.set(str(style_file), style_file.stat(), "Test Style")
+
+    with patch.object(Path, "write_text", side_effect=OSError("Disk full")):
+        cache.save()
+
+    assert not (resources_dir / ProjectInfo.STYLE_CACHE_FILE).exists()
+
+
+@pytest.mark.parametrize("content", ["not json", "[1, 2, 3]"])
+def test_load_invalid_cache(resources_dir: Path, style_file: Path, content: str) -> None:
+    """測試快取檔案內容錯誤時，視為沒有快取"""
+    (resources_dir / ProjectInfo.STYLE_CACHE_FILE).write_text(content, encoding="utf-8")
+
+    cache = StyleDescriptionCache()
+
+    assert cache.get(str(style_file), style_file.stat()) is None
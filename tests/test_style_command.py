@@ -1,12 +1,25 @@
+import stat
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from typing import Generator, Union
+from unittest.mock import MagicMock, patch
 
 import click
 import pytest
+import yaml
 from click.testing import CliRunner
 
-from commit_assistant.commands.style import _validate_yaml, add, list, remove, template, use
+from commit_assistant.commands.style import (
+    _print_all_styles,
+    _read_description,
+    _validate_yaml,
+    add,
+    list,
+    remove,
+    style,
+    template,
+    use,
+)
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.enums.commit_style import StyleScope
 
@@ -15,6 +28,15 @@ from commit_assistant.enums.commit_style import StyleScope
 style_module = sys.modules["commit_assistant.commands.style"]
 
 
+@pytest.fixture(autouse=True)
+def mock_resources_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """將 style description 快取檔案寫到臨時目錄，避免影響套件目錄"""
+    resources_dir = tmp_path / "resources"
+    resources_dir.mkdir()
+    with patch("commit_assistant.core.paths.ProjectPaths.RESOURCES_DIR", resources_dir):
+        yield resources_dir
+
+
 @pytest.fixture
 def mock_style_dirs(tmp_path: Path) -> dict[str, Path]:
     """建立測試用的風格目錄 (系統內建/全域/專案內)"""
@@ -53,13 +75,51 @@ def test_validate_yaml_invalid() -> None:
         _validate_yaml(None, None, "test.txt")
 
 
-def test_list_command(tmp_path: Path, mock_style_dirs: dict[str, Path]) -> None:
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ('name: "test"\ndescription: "Test Style"\nprompt: "p"', "Test Style"),  # 一般的情況
+        ("nested: {a: [1, 2]}\ndescription: plain text", "plain text"),  # 前面有巢狀的欄位
+        ("a: &anchor foo\nb: *anchor\ndescription: d", "d"),  # 前面有 alias
+        ('prompt: "p"', "無描述"),  # 沒有 description
+        ("description: 123", 123),  # 不是字串
+        ("description:\n  - a", ["a"]),  # 不是純量
+        ("base: &base\n  description: inherited\n<<: *base", "inherited"),  # 透過合併鍵繼承
+        ("description: first\ndescription: last", "last"),  # 重複的鍵以最後一個為準
+        ('description: "中文描述"'.encode("utf-8"), "中文描述"),  # 直接傳入檔案的 bytes
+    ],
+)
+def test_read_description(content: Union[str, bytes], expected: object) -> None:
+    """測試只讀取 style 的 description 欄位"""
+    assert _read_description(content) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'description: "d"\nprompt: [unclosed',  # description 後面有語法錯誤
+        'description: "d"\n---\nprompt: "p"',  # description 後面還有第二份文件
+    ],
+)
+def test_read_description_invalid_after_description(content: str) -> None:
+    """測試 description 之後的內容格式錯誤時，整份 style 視為讀取失敗"""
+    with pytest.raises(yaml.YAMLError):
+        _read_description(content)
+
+
+@pytest.mark.parametrize("content", ["- a\n- b", "just text", ""])
+def test_read_description_invalid_root(content: str) -> None:
+    """測試最外層不是 mapping 的 style 內容"""
+    with pytest.raises(AttributeError):
+        _read_description(content)
+
+
+def test_list_command(tmp_path: Path, mock_style_dirs: dict[str, Path], runner: CliRunner) -> None:
     """測試列出風格指令"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         # Mock 路徑
         mock_paths.STYLE_DIR = mock_style_dirs["system"].parent
 
-        runner = CliRunner()
         result = runner.invoke(list, ["--repo-path", str(tmp_path)])
 
         assert result.exit_code == 0
@@ -69,20 +129,113 @@ def test_list_command(tmp_path: Path, mock_style_dirs: dict[str, Path]) -> None:
         assert "Test Style" in result.output  # 這裡是驗證是否有正確套用到 mock_style_dirs 中設定的 yaml 內容
 
 
-def test_list_command_but_no_style_path_not_exist(tmp_path: Path) -> None:
+def test_list_command_use_cache(tmp_path: Path, mock_style_dirs: dict[str, Path], runner: CliRunner) -> None:
+    """測試 style 檔案沒有變動時，第二次列出會直接使用快取"""
+    with patch.object(style_module, "ProjectPaths") as mock_paths:
+        mock_paths.STYLE_DIR = mock_style_dirs["system"].parent
+
+        runner.invoke(list, ["--repo-path", str(tmp_path)])
+
+        with patch.object(style_module, "_read_description") as mock_read:
+            result = runner.invoke(list, ["--repo-path", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert result.output.count("Test Style") == 3
+        mock_read.assert_not_called()
+
+
+def test_list_command_cache_invalidated(
+    tmp_path: Path, mock_style_dirs: dict[str, Path], runner: CliRunner
+) -> None:
+    """測試 style 檔案有變動時，會重新解析 description"""
+    with patch.object(style_module, "ProjectPaths") as mock_paths:
+        mock_paths.STYLE_DIR = mock_style_dirs["system"].parent
+
+        runner.invoke(list, ["--repo-path", str(tmp_path)])
+
+        # 修改其中一個 style 檔案的內容
+        (mock_style_dirs["global"] / "global_style.yaml").write_text(
+            'prompt: "{changed_files} {diff_content}"\ndescription: "Changed Style"', encoding="utf-8"
+        )
+        result = runner.invoke(list, ["--repo-path", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Changed Style" in result.output
+        assert result.output.count("Test Style") == 2
+
+
+def test_print_all_styles_without_cache(
+    mock_style_dirs: dict[str, Path], capsys: pytest.CaptureFixture
+) -> None:
+    """測試沒有傳入快取時，直接解析 style 檔案"""
+    _print_all_styles(mock_style_dirs["system"])
+
+    assert "Test Style" in capsys.readouterr().out
+
+
+def test_print_all_styles_skip_hidden_and_backup_files(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """測試略過隱藏檔與備份檔"""
+    (tmp_path / "visible.yaml").write_text('description: "Visible"', encoding="utf-8")
+    (tmp_path / ".hidden.yaml").write_text('description: "Hidden"', encoding="utf-8")
+    (tmp_path / "visible.yaml~").write_text('description: "Backup"', encoding="utf-8")
+
+    _print_all_styles(tmp_path)
+
+    output = capsys.readouterr().out
+    assert "Visible" in output
+    assert "Hidden" not in output
+    assert "Backup" not in output
+
+
+def test_print_all_styles_escape_markup(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """測試描述文字中的 [] 不會被當成 rich markup 解析"""
+    (tmp_path / "markup.yaml").write_text('description: "[bold]Markup[/bold] style"', encoding="utf-8")
+
+    _print_all_styles(tmp_path)
+
+    output = capsys.readouterr().out
+    assert "- markup  [[bold]Markup[/bold] style]" in output
+
+
+def test_print_all_styles_parallel(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """測試 style 檔案較多時改用執行緒池解析，且輸出順序與掃描順序一致"""
+    style_dir = tmp_path / "many"
+    style_dir.mkdir()
+    for i in range(style_module._PARALLEL_THRESHOLD + 2):
+        (style_dir / f"style_{i}.yaml").write_text(f'description: "Style {i}"', encoding="utf-8")
+    (style_dir / "broken.yaml").write_text("description: [", encoding="utf-8")
+
+    with patch.object(style_module, "ThreadPoolExecutor", wraps=style_module.ThreadPoolExecutor) as mock_pool:
+        _print_all_styles(style_dir)
+
+    mock_pool.assert_called_once()
+
+    output = capsys.readouterr().out
+    assert "讀取失敗" in output
+    assert "Style 0" in output
+
+    # 輸出順序需與目錄掃描的順序相同
+    scanned = [p.name[: -len(".yaml")] for p in style_dir.iterdir()]
+    positions = [output.index(f"- {name} ") for name in scanned]
+    assert positions == sorted(positions)
+
+
+def test_list_command_but_no_style_path_not_exist(tmp_path: Path, runner: CliRunner) -> None:
     """測試列出風格指令，但所有路徑都不存在"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         # Mock 路徑
         mock_paths.STYLE_DIR = Path("not_exist_path")
 
-        runner = CliRunner()
         result = runner.invoke(list, ["--repo-path", str(tmp_path)])
 
         assert result.exit_code == 0
-        assert "尚無可用的 style" in result.output
+        # 三個層級都應該提示尚無可用的 style
+        assert result.output.count("尚無可用的 style") == 3
 
 
-def test_list_command_but_no_style_file_not_exist(mock_style_dirs: dict[str, Path]) -> None:
+def test_list_command_but_no_style_file_not_exist(
+    mock_style_dirs: dict[str, Path], runner: CliRunner
+) -> None:
     """測試列出風格指令，但所有資料夾下都沒有風格檔案"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         # Mock 路徑
@@ -93,14 +246,13 @@ def test_list_command_but_no_style_file_not_exist(mock_style_dirs: dict[str, Pat
             for style_file in style_dir.iterdir():
                 style_file.unlink()
 
-        runner = CliRunner()
         result = runner.invoke(list)
 
         assert result.exit_code == 0
         assert "尚無可用的 style" in result.output
 
 
-def test_list_command_error(mock_style_dirs: dict[str, Path]) -> None:
+def test_list_command_error(mock_style_dirs: dict[str, Path], runner: CliRunner) -> None:
     """測試列出所有風格指令時出錯"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         # Mock 路徑
@@ -108,14 +260,13 @@ def test_list_command_error(mock_style_dirs: dict[str, Path]) -> None:
 
         # 這裡模擬 open 的時候出錯
         with patch("builtins.open", side_effect=Exception):
-            runner = CliRunner()
             result = runner.invoke(list)
 
             assert result.exit_code == 0
             assert "讀取失敗" in result.output
 
 
-def test_template_command_success(tmp_path: Path) -> None:
+def test_template_command_success(tmp_path: Path, runner: CliRunner) -> None:
     """測試匯出模板指令成功的情況"""
     template_content = "template content"
     template_file = tmp_path / ProjectInfo.STYLE_TEMPLATE_NAME
@@ -127,7 +278,6 @@ def test_template_command_success(tmp_path: Path) -> None:
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        runner = CliRunner()
         result = runner.invoke(template, ["--output", str(output_dir)])
 
         assert result.exit_code == 0
@@ -136,13 +286,31 @@ def test_template_command_success(tmp_path: Path) -> None:
         assert (output_dir / ProjectInfo.STYLE_TEMPLATE_NAME).read_text() == template_content
 
 
-def test_template_command_template_not_found(tmp_path: Path) -> None:
+def test_template_command_read_only_template(tmp_path: Path, runner: CliRunner) -> None:
+    """測試套件內的模板為唯讀時，匯出的模板仍可以編輯"""
+    template_file = tmp_path / ProjectInfo.STYLE_TEMPLATE_NAME
+    template_file.write_text("template content", encoding="utf-8")
+    template_file.chmod(0o444)
+
+    with patch.object(style_module, "ProjectPaths") as mock_paths:
+        mock_paths.STYLE_DIR = tmp_path
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        result = runner.invoke(template, ["--output", str(output_dir)])
+
+    assert result.exit_code == 0
+    # 不沿用模板的唯讀權限
+    assert (output_dir / ProjectInfo.STYLE_TEMPLATE_NAME).stat().st_mode & stat.S_IWUSR
+
+
+def test_template_command_template_not_found(tmp_path: Path, runner: CliRunner) -> None:
     """測試匯出模板指令失敗的情況"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         # 這裡故意不建立模板檔
         mock_paths.STYLE_DIR = tmp_path
 
-        runner = CliRunner()
         result = runner.invoke(template)
 
         assert result.exit_code == 0
@@ -150,7 +318,7 @@ def test_template_command_template_not_found(tmp_path: Path) -> None:
         assert "找不到" in result.output
 
 
-def test_add_command(tmp_path: Path) -> None:
+def test_add_command(tmp_path: Path, runner: CliRunner) -> None:
     """測試新增風格指令"""
     # 建立測試用的 yaml 檔案
     test_style = tmp_path / "test_style.yaml"
@@ -160,7 +328,6 @@ def test_add_command(tmp_path: Path) -> None:
         """)
 
     with patch.object(style_module, "StyleImporter") as mock_importer:
-        runner = CliRunner()
         result = runner.invoke(add, [str(test_style)])
 
         assert result.exit_code == 0
@@ -168,7 +335,7 @@ def test_add_command(tmp_path: Path) -> None:
         mock_importer.return_value.start_import.assert_called_once()
 
 
-def test_add_command_error(tmp_path: Path) -> None:
+def test_add_command_error(tmp_path: Path, runner: CliRunner) -> None:
     """測試新增風格指令失敗"""
     # 建立測試用的 yaml 檔案
     test_style = tmp_path / "test_style.yaml"
@@ -180,7 +347,6 @@ def test_add_command_error(tmp_path: Path) -> None:
     with patch.object(style_module, "StyleImporter") as mock_importer:
         mock_importer.side_effect = Exception("Test Error")
 
-        runner = CliRunner()
         result = runner.invoke(add, [str(test_style)])
 
         assert result.exit_code == 0
@@ -189,10 +355,9 @@ def test_add_command_error(tmp_path: Path) -> None:
         assert "錯誤" in result.output
 
 
-def test_use_command() -> None:
+def test_use_command(runner: CliRunner) -> None:
     """測試使用風格指令"""
     with patch.object(style_module, "CommitStyleManager") as mock_style_manager:
-        runner = CliRunner()
         result = runner.invoke(use, ["test_style"])
 
         assert result.exit_code == 0
@@ -200,12 +365,11 @@ def test_use_command() -> None:
         assert "成功設定當前專案使用" in result.output
 
 
-def test_use_command_error() -> None:
+def test_use_command_error(runner: CliRunner) -> None:
     """測試使用風格指令出錯"""
     with patch.object(style_module, "CommitStyleManager") as mock_style_manager:
         mock_style_manager.return_value.set_project_commit_style.side_effect = ValueError("Test Error")
 
-        runner = CliRunner()
         result = runner.invoke(use, ["test_style"])
 
         assert result.exit_code == 0
@@ -213,7 +377,7 @@ def test_use_command_error() -> None:
         assert "錯誤" in result.output
 
 
-def test_remove_command(tmp_path: Path) -> None:
+def test_remove_command(tmp_path: Path, runner: CliRunner) -> None:
     """測試刪除風格指令"""
     # 建立測試用的風格檔案
     style_dir = tmp_path / "global"
@@ -228,7 +392,6 @@ def test_remove_command(tmp_path: Path) -> None:
         with patch.object(style_module, "ProjectPaths") as mock_paths:
             mock_paths.STYLE_DIR = tmp_path
 
-            runner = CliRunner()
             result = runner.invoke(remove, ["test_style", "--global"])
 
             assert result.exit_code == 0
@@ -236,7 +399,7 @@ def test_remove_command(tmp_path: Path) -> None:
             assert not style_file.exists()
 
 
-def test_remove_command_project(tmp_path: Path) -> None:
+def test_remove_command_project(tmp_path: Path, runner: CliRunner) -> None:
     """測試刪除風格指令 (專案內)"""
     # 建立測試用的風格檔案
     style_dir = tmp_path / ProjectInfo.REPO_ASSISTANT_DIR / "style"
@@ -248,11 +411,10 @@ def test_remove_command_project(tmp_path: Path) -> None:
         # 模擬使用者確認刪除
         mock_confirm.return_value.ask.return_value = True
 
-        # 模擬 Path(".").absolute() 的結果
-        with patch("pathlib.Path.absolute") as mock_absolute:
-            mock_absolute.return_value = tmp_path
+        # 模擬目前的工作目錄
+        with patch("pathlib.Path.cwd") as mock_cwd:
+            mock_cwd.return_value = tmp_path
 
-            runner = CliRunner()
             result = runner.invoke(remove, ["test_style"])
 
             assert result.exit_code == 0
@@ -260,7 +422,7 @@ def test_remove_command_project(tmp_path: Path) -> None:
             assert not style_file.exists()
 
 
-def test_remove_command_cancel(tmp_path: Path) -> None:
+def test_remove_command_cancel(tmp_path: Path, runner: CliRunner) -> None:
     """測試取消刪除風格的情況"""
     # 建立測試用的風格檔案
     style_dir = tmp_path / "global"
@@ -275,7 +437,6 @@ def test_remove_command_cancel(tmp_path: Path) -> None:
         with patch.object(style_module, "ProjectPaths") as mock_paths:
             mock_paths.STYLE_DIR = tmp_path
 
-            runner = CliRunner()
             result = runner.invoke(remove, ["test_style", "--global"])
 
             assert result.exit_code == 0
@@ -283,12 +444,11 @@ def test_remove_command_cancel(tmp_path: Path) -> None:
             assert style_file.exists()
 
 
-def test_remove_command_not_found(tmp_path: Path) -> None:
+def test_remove_command_not_found(tmp_path: Path, runner: CliRunner) -> None:
     """測試刪除不存在風格的情況"""
     with patch.object(style_module, "ProjectPaths") as mock_paths:
         mock_paths.STYLE_DIR = tmp_path
 
-        runner = CliRunner()
         result = runner.invoke(remove, ["non_existent_style", "--global"])
 
         assert result.exit_code == 0
@@ -297,7 +457,7 @@ def test_remove_command_not_found(tmp_path: Path) -> None:
         assert "請確認風格名稱是否正確，或者指定的層級是否正確" in result.output
 
 
-def test_remove_command_error(tmp_path: Path) -> None:
+def test_remove_command_error(tmp_path: Path, runner: CliRunner) -> None:
     """測試刪除指令失敗的情況"""
     # 建立測試用的風格檔案
     style_dir = tmp_path / "global"
@@ -313,9 +473,26 @@ def test_remove_command_error(tmp_path: Path) -> None:
             mock_paths.STYLE_DIR = tmp_path
 
             # 這裡需要發生錯誤
-            runner = CliRunner()
             result = runner.invoke(remove, ["test_style", "--global"])
 
             assert result.exit_code == 0
             assert "錯誤" in result.output
             assert style_file.exists()  # 原始檔案不應該被刪除
+
+
+@patch.object(style_module, "UpgradeChecker")
+def test_style_list_skip_upgrade_check(mock_upgrade_checker: MagicMock, runner: CliRunner) -> None:
+    """測試 style list 只讀取本地的風格列表，不會觸發版本檢查"""
+    runner.invoke(style, ["list", "--help"])
+
+    mock_upgrade_checker.assert_not_called()
+
+
+@patch.object(style_module, "UpgradeChecker")
+def test_style_other_commands_upgrade_check(mock_upgrade_checker: MagicMock, runner: CliRunner) -> None:
+    """測試 style 的其他子命令會在背景觸發版本檢查，並於命令結束時提示結果"""
+    runner.invoke(style, ["use", "--help"])
+
+    mock_checker_instance = mock_upgrade_checker.return_value
+    mock_checker_instance.start_background_check.assert_called_once()
+    mock_checker_instance.start_background_check.return_value.assert_called_once()
@@ -8,7 +8,12 @@ import pytest
 from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.enums.commit_style import CommitStyle, StyleScope
 from commit_assistant.enums.config_key import ConfigKey
-from commit_assistant.utils.style_utils import CommitStyleManager, StyleImporter, StyleValidator
+from commit_assistant.utils.style_utils import (
+    CommitStyleManager,
+    StyleImporter,
+    StyleValidator,
+    _safe_load_yaml,
+)
 
 
 @pytest.fixture
@@ -107,8 +112,10 @@ def test_start_import_style(
     importer = StyleImporter(temp_style_file, "test_style", True)
     importer.start_import()
 
-    # 檢查檔案是否被複製
-    assert (mock_style_dir / "global" / "test_style.yaml").exists()
+    # 檢查檔案是否被複製，且內容與原始檔案完全相同
+    target_file = mock_style_dir / "global" / "test_style.yaml"
+    assert target_file.exists()
+    assert target_file.read_bytes() == temp_style_file.read_bytes()
 
     # 檢查提示訊息
     console_out = capsys.readouterr().out
@@ -261,6 +268,25 @@ def test_get_style_path_system(temp_git_repo: Path) -> None:
     assert not is_global
 
 
+def test_get_style_path_cached(temp_git_repo: Path) -> None:
+    """測試同一個風格只會查找一次檔案"""
+    manager = CommitStyleManager()
+
+    style_dir = temp_git_repo / "system"
+    style_dir.mkdir(parents=True)
+    manager.system_styles_dir = style_dir
+
+    style_file = style_dir / "test_style.yaml"
+    style_file.write_text("prompt: test")
+
+    with patch.object(manager, "_find_style_path", wraps=manager._find_style_path) as mock_find:
+        first = manager.get_style_path("test_style")
+        second = manager.get_style_path("test_style")
+
+    assert first == second == (style_file, False)
+    mock_find.assert_called_once_with("test_style")
+
+
 def test_get_style_path_not_found() -> None:
     """測試獲取不存在的風格"""
     manager = CommitStyleManager()
@@ -376,6 +402,41 @@ def test_set_project_commit_style_global_warning(tmp_path: Path, capsys: pytest.
     assert f"[{StyleScope.PROJECT.value}]" in captured.out
 
 
+def test_set_project_commit_style_keeps_other_lines(tmp_path: Path) -> None:
+    """測試只替換 COMMIT_STYLE 那一行，其餘內容 (包含結尾換行) 維持原樣"""
+    manager = CommitStyleManager()
+    config_file = tmp_path / ProjectInfo.CONFIG_TEMPLATE_NAME
+    config_file.write_text(
+        f"# {ConfigKey.COMMIT_STYLE.value}=commented\n {ConfigKey.COMMIT_STYLE.value} = old_style\nOTHER=1\n",
+        encoding="utf-8",
+    )
+
+    manager.project_config_file = config_file
+
+    with patch.object(manager, "get_style_path", return_value=(Path("new\\1.yaml"), False)):
+        manager.set_project_commit_style("new\\1")
+
+    assert config_file.read_text(encoding="utf-8") == (
+        f"# {ConfigKey.COMMIT_STYLE.value}=commented\n{ConfigKey.COMMIT_STYLE.value}=new\\1\nOTHER=1\n"
+    )
+
+
+def test_set_project_commit_style_unchanged_skip_write(tmp_path: Path) -> None:
+    """測試設定的風格與原本相同時不重新寫入"""
+    manager = CommitStyleManager()
+    config_file = tmp_path / ProjectInfo.CONFIG_TEMPLATE_NAME
+    config_file.write_text(f"{ConfigKey.COMMIT_STYLE.value}=same_style\n", encoding="utf-8")
+    manager.project_config_file = config_file
+
+    with (
+        patch.object(manager, "get_style_path", return_value=(Path("same_style.yaml"), False)),
+        patch.object(Path, "write_text") as mock_write,
+    ):
+        manager.set_project_commit_style("same_style")
+
+    mock_write.assert_not_called()
+
+
 def test_get_prompt_valid_style() -> None:
     """測試獲取有效的 commit 風格提示"""
     manager = CommitStyleManager()
@@ -392,8 +453,59 @@ def test_get_prompt_valid_style() -> None:
         assert "test diff" in prompt
 
 
+def test_get_prompt_cached() -> None:
+    """測試同一個風格只會讀取一次檔案，重新生成時直接使用快取的 prompt"""
+    manager = CommitStyleManager()
+
+    first = manager.get_prompt(CommitStyle.CONVENTIONAL.value, ["file1.py"], "first diff")
+
+    with patch.object(Path, "read_text") as mock_read:
+        second = manager.get_prompt(CommitStyle.CONVENTIONAL.value, ["file2.py"], "second diff")
+
+    mock_read.assert_not_called()
+    assert "first diff" in first
+    assert "second diff" in second
+    assert "file2.py" in second
+
+
+def test_get_prompt_reload_after_edit(tmp_path: Path) -> None:
+    """測試風格檔案被編輯後會重新讀取"""
+    manager = CommitStyleManager()
+    style_file = tmp_path / "custom.yaml"
+    style_file.write_text("prompt: 'old {changed_files} {diff_content}'\n", encoding="utf-8")
+
+    with patch.object(manager, "get_style_path", return_value=(style_file, False)):
+        first = manager.get_prompt("custom", ["a.py"], "diff")
+
+        style_file.write_text("prompt: 'new {changed_files} {diff_content}'\n", encoding="utf-8")
+        stat = style_file.stat()
+        os.utime(style_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = manager.get_prompt("custom", ["a.py"], "diff")
+
+    assert first.startswith("old")
+    assert second.startswith("new")
+
+
 def test_get_prompt_invalid_style() -> None:
     """測試獲取無效的 commit 風格提示"""
     manager = CommitStyleManager()
     with pytest.raises(ValueError, match="找不到風格模板："):
         manager.get_prompt("invalid_style", [], "")
+
+
+def test_safe_load_yaml() -> None:
+    """測試解析 yaml 內容"""
+    assert _safe_load_yaml("prompt: test\n") == {"prompt": "test"}
+
+
+def test_safe_load_yaml_without_libyaml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """測試沒有 LibYAML 時退回純 Python 版本解析"""
+    import yaml
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+
+    with patch("yaml.load", wraps=yaml.load) as mock_load:
+        assert _safe_load_yaml("prompt: test\n") == {"prompt": "test"}
+
+    assert mock_load.call_args.kwargs["Loader"] is yaml.SafeLoader
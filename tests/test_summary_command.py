@@ -47,6 +47,12 @@ def mock_summary_generator() -> Generator[Mock, None, None]:
         ("7d", (datetime.now() - timedelta(days=7)).replace(hour=0, minute=0, second=0)),
         ("2024-02-14", datetime(2024, 2, 14)),
         ("2024/02/14", datetime(2024, 2, 14)),
+        ("2024.02.14", datetime(2024, 2, 14)),
+        ("2024/2/4", datetime(2024, 2, 4)),
+        ("20240214", datetime(2024, 2, 14)),
+        ("14-02-2024", datetime(2024, 2, 14)),
+        ("2024-02-14 10:11:12", datetime(2024, 2, 14, 10, 11, 12)),
+        ("2024/02/14 10:11:12", datetime(2024, 2, 14, 10, 11, 12)),
         (None, datetime.now()),
     ],
 )
@@ -61,10 +67,20 @@ def test_parse_date(date_str: str, expected: datetime) -> None:
         assert result == expected
 
 
-def test_parse_date_invalid_format() -> None:
+@pytest.mark.parametrize(
+    "invalid_date_str",
+    [
+        "invalid-date",
+        "2024-13-01",  # 月份超出範圍
+        "2024-02-30",  # 日期不存在
+        "2024.02.14 10:11:12",  # . 分隔的日期不支援時間
+        "2024-02-14 10:11",  # 時間格式不完整
+    ],
+)
+def test_parse_date_invalid_format(invalid_date_str: str) -> None:
     """測試無效的日期格式"""
     with pytest.raises(click.BadParameter, match="Unsupported date format"):
-        _parse_date("invalid-date")
+        _parse_date(invalid_date_str)
 
 
 @pytest.mark.parametrize(
@@ -84,7 +100,7 @@ def test_parse_date_invalid_days(invalid_date_str: str) -> None:
 # CommitSummaryGenerator 測試
 def test_generate_commit_summary() -> None:
     """測試生成摘要"""
-    with patch("google.genai") as mock_genai:
+    with patch("google.genai", create=True) as mock_genai:
         mock_genai.Client.return_value = Mock()
         with patch.dict("os.environ", {"GEMINI_API_KEY": "test_api_key"}):
             generator = CommitSummaryGenerator()
@@ -104,7 +120,7 @@ def test_generate_commit_summary() -> None:
 
 def test_generate_commit_summary_error() -> None:
     """測試生成摘要出現錯誤"""
-    with patch("google.genai") as mock_genai:
+    with patch("google.genai", create=True) as mock_genai:
         mock_genai.Client.return_value = Mock()
         with patch.dict("os.environ", {"GEMINI_API_KEY": "test_api_key"}):
             generator = CommitSummaryGenerator()
@@ -118,11 +134,11 @@ def test_generate_commit_summary_error() -> None:
 
 
 # summary 命令測試
-def test_summary_command_success(mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path) -> None:
+def test_summary_command_success(
+    mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
     """測試摘要命令成功執行"""
-    runner = CliRunner()
-
-    with patch.object(summary_module, "pyperclip") as mock_pyperclip:
+    with patch("pyperclip.copy") as mock_copy:
         result = runner.invoke(
             summary, ["--start-from", "2024-02-14", "--end-to", "2024-02-15", "--repo-path", str(tmp_path)]
         )
@@ -132,12 +148,11 @@ def test_summary_command_success(mock_git_runner: Mock, mock_summary_generator:
         # 檢查是否有正確調用相關方法
         mock_git_runner.get_commits_in_date_range.assert_called_once()
         mock_summary_generator.generate_commit_summary.assert_called_once()
-        mock_pyperclip.copy.assert_called_once()
+        mock_copy.assert_called_once()
 
 
-def test_summary_command_no_commits(mock_git_runner: Mock, tmp_path: Path) -> None:
+def test_summary_command_no_commits(mock_git_runner: Mock, tmp_path: Path, runner: CliRunner) -> None:
     """測試沒有找到 commit 的情況"""
-    runner = CliRunner()
     mock_git_runner.get_commits_in_date_range.return_value = ""
 
     result = runner.invoke(
@@ -148,12 +163,27 @@ def test_summary_command_no_commits(mock_git_runner: Mock, tmp_path: Path) -> No
     assert "沒有找到符合條件的" in result.output
 
 
+def test_summary_command_no_commits_skip_load_config(
+    mock_git_runner: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
+    """測試沒有找到 commit 時，不需要載入環境設定"""
+    mock_git_runner.get_commits_in_date_range.return_value = ""
+
+    with patch.object(summary_module, "load_config") as mock_load_config:
+        result = runner.invoke(summary, ["--repo-path", str(tmp_path)])
+
+    assert result.exit_code == ExitCode.CANCEL.value
+    mock_load_config.assert_not_called()
+
+
 def test_summary_command_no_start_date(
-    mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_summary_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試沒有指定開始日期"""
-    runner = CliRunner()
-    with patch.object(summary_module, "pyperclip") as mock_pyperclip:
+    with patch("pyperclip.copy") as mock_copy:
         result = runner.invoke(summary, ["--end-to", "2024-02-15", "--repo-path", str(tmp_path)])
 
     # 應該要能正常執行
@@ -162,15 +192,17 @@ def test_summary_command_no_start_date(
     # 檢查是否有正確調用相關方法
     mock_git_runner.get_commits_in_date_range.assert_called_once()
     mock_summary_generator.generate_commit_summary.assert_called_once()
-    mock_pyperclip.copy.assert_called_once()
+    mock_copy.assert_called_once()
 
 
 def test_summary_command_no_end_date(
-    mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_summary_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試沒有指定結束日期"""
-    runner = CliRunner()
-    with patch.object(summary_module, "pyperclip") as mock_pyperclip:
+    with patch("pyperclip.copy") as mock_copy:
         result = runner.invoke(summary, ["--start-from", "2024-02-14", "--repo-path", str(tmp_path)])
 
     # 應該要能正常執行
@@ -179,36 +211,38 @@ def test_summary_command_no_end_date(
     # 檢查是否有正確調用相關方法
     mock_git_runner.get_commits_in_date_range.assert_called_once()
     mock_summary_generator.generate_commit_summary.assert_called_once()
-    mock_pyperclip.copy.assert_called_once()
+    mock_copy.assert_called_once()
 
 
 def test_summary_command_summary_error(
-    mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_summary_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試生成摘要時出現錯誤"""
-    runner = CliRunner()
-
     # 模擬 summary 生成失敗，返回 None
     mock_summary_generator.generate_commit_summary.return_value = None
 
-    with patch.object(summary_module, "pyperclip") as mock_pyperclip:
+    with patch("pyperclip.copy") as mock_copy:
         result = runner.invoke(
             summary, ["--start-from", "2024-02-14", "--end-to", "2024-02-15", "--repo-path", str(tmp_path)]
         )
 
         assert result.exit_code == ExitCode.ERROR.value
         assert "摘要生成失敗" in result.output
-        mock_pyperclip.copy.assert_not_called()
+        mock_copy.assert_not_called()
 
 
 def test_summary_command_pyperclip_error(
-    mock_git_runner: Mock, mock_summary_generator: Mock, tmp_path: Path
+    mock_git_runner: Mock,
+    mock_summary_generator: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試複製到剪貼板時出現錯誤"""
-    runner = CliRunner()
-
-    with patch.object(summary_module, "pyperclip") as mock_pyperclip:
-        mock_pyperclip.copy.side_effect = Exception("Test Error")
+    with patch("pyperclip.copy") as mock_copy:
+        mock_copy.side_effect = Exception("Test Error")
 
         result = runner.invoke(
             summary, ["--start-from", "2024-02-14", "--end-to", "2024-02-15", "--repo-path", str(tmp_path)]
@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Generator
 from unittest.mock import Mock, patch
@@ -36,10 +38,12 @@ def mock_update_manager() -> Generator[Mock, None, None]:
 
 
 def test_update_command_single_update(
-    mock_installation_manager: Mock, mock_update_manager: Mock, tmp_path: Path
+    mock_installation_manager: Mock,
+    mock_update_manager: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試更新單一專案"""
-    runner = CliRunner()
     result = runner.invoke(update, ["--repo-path", str(tmp_path)])
 
     assert result.exit_code == 0
@@ -53,11 +57,12 @@ def test_update_command_single_update(
 
 
 def test_update_command_single_update_error(
-    mock_installation_manager: Mock, mock_update_manager: Mock, tmp_path: Path
+    mock_installation_manager: Mock,
+    mock_update_manager: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試更新單一專案，發生錯誤"""
-    runner = CliRunner()
-
     with patch.object(update_module, "_update", side_effect=Exception("Test Error")):
         result = runner.invoke(update, ["--repo-path", str(tmp_path)])
 
@@ -67,10 +72,12 @@ def test_update_command_single_update_error(
 
 
 def test_update_command_all_update(
-    mock_installation_manager: Mock, mock_update_manager: Mock, tmp_path: Path
+    mock_installation_manager: Mock,
+    mock_update_manager: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試更新所有專案"""
-    runner = CliRunner()
     result = runner.invoke(update, ["--repo-path", str(tmp_path), "--all-repo"])
 
     assert result.exit_code == 0
@@ -85,10 +92,12 @@ def test_update_command_all_update(
 
 
 def test_update_command_all_update_with_no_installations(
-    mock_installation_manager: Mock, mock_update_manager: Mock, tmp_path: Path
+    mock_installation_manager: Mock,
+    mock_update_manager: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試更新所有專案，但沒有任何專案被安裝"""
-    runner = CliRunner()
     mock_installation_manager.get_all_installations.return_value = []  # 模擬沒有任何專案需要更新
 
     result = runner.invoke(update, ["--repo-path", str(tmp_path), "--all-repo"])
@@ -98,11 +107,12 @@ def test_update_command_all_update_with_no_installations(
 
 
 def test_update_command_all_update_error(
-    mock_installation_manager: Mock, mock_update_manager: Mock, tmp_path: Path
+    mock_installation_manager: Mock,
+    mock_update_manager: Mock,
+    tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     """測試更新所有專案，發生錯誤"""
-    runner = CliRunner()
-
     mock_update_manager.update.side_effect = [Exception("Test Error"), None]
 
     result = runner.invoke(update, ["--repo-path", str(tmp_path), "--all-repo"])
@@ -116,3 +126,34 @@ def test_update_command_all_update_error(
 
     # 檢查 add_installation 方法被正確呼叫，第一次失敗，第二次成功所以只能呼叫一次
     assert mock_installation_manager.add_installation.call_count == 1
+
+
+def test_update_command_all_update_keep_order(
+    mock_installation_manager: Mock, tmp_path: Path, runner: CliRunner
+) -> None:
+    """測試同時更新多個專案時，結果仍依照專案順序列出，且更新過程的訊息不會交錯輸出"""
+    first_started = threading.Event()
+
+    class FakeUpdateManager:
+        def __init__(self, repo_path: Path) -> None:
+            self.repo_path = repo_path
+
+        def update(self) -> None:
+            if self.repo_path == Path("test_repo_path"):
+                # 第一個專案等待第二個專案開始後才完成
+                first_started.set()
+                time.sleep(0.05)
+            else:
+                first_started.wait(timeout=1)
+            update_module.console.print(f"updated {self.repo_path}")
+
+    with patch.object(update_module, "UpdateManager", FakeUpdateManager):
+        result = runner.invoke(update, ["--repo-path", str(tmp_path), "--all-repo"])
+
+    assert result.exit_code == 0
+    output = result.output
+    assert "updated test_repo_path" not in output
+    assert "已更新 2 個專案" in output
+    assert output.index("test_repo_path ") < output.index("test_repo_path2")
+    assert output.count("成功") == 2
+    assert mock_installation_manager.add_installation.call_count == 2
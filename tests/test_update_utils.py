@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Dict, Generator
+from unittest.mock import patch
 
 import pytest
 
@@ -76,6 +77,18 @@ def test_update_example_config_overwrites_existing(
     assert "COMMIT_STYLE=conventional" in content
 
 
+def test_update_example_config_unchanged_skip_write(
+    update_manager: UpdateManager, mock_template_paths: Dict
+) -> None:
+    """測試 example 設定檔已是最新內容時不重新寫入"""
+    update_manager._update_example_config()
+
+    with patch.object(Path, "write_text") as mock_write:
+        update_manager._update_example_config()
+
+    mock_write.assert_not_called()
+
+
 def test_migrate_pre_example_config_no_op_if_config_not_exists(
     update_manager: UpdateManager, mock_template_paths: Dict
 ) -> None:
@@ -150,3 +163,27 @@ def test_update(update_manager: UpdateManager, mock_template_paths: Dict) -> Non
     assert update_manager.example_config_path.exists()
     content = update_manager.example_config_path.read_text(encoding="utf-8")
     assert "COMMIT_STYLE=conventional" in content
+
+
+def test_update_reads_example_template_once(update_manager: UpdateManager, mock_template_paths: Dict) -> None:
+    """測試遷移與更新 example 設定檔時，模板只會讀取一次"""
+    update_manager.config_path.parent.mkdir(parents=True, exist_ok=True)
+    update_manager.config_path.write_text("COMMIT_STYLE=custom", encoding="utf-8")
+
+    template_path = update_manager.example_template_path
+    with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+        update_manager._migrate_pre_example_config()
+        update_manager._update_example_config()
+
+    assert [call.args[0] for call in mock_read.call_args_list].count(template_path) == 1
+    assert update_manager.example_config_path.read_text(encoding="utf-8") == template_path.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_update_hook_uses_template_content(update_manager: UpdateManager, mock_template_paths: Dict) -> None:
+    """測試更新時以 hook 模板內容更新 hook"""
+    with patch.object(UpdateManager, "_update_hook") as mock_update_hook:
+        update_manager.update()
+
+    mock_update_hook.assert_called_once_with("test hook content")
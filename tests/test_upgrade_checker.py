@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Generator, Optional
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -11,6 +11,20 @@ from commit_assistant.core.project_config import ProjectInfo
 from commit_assistant.utils.upgrade_checker import UpgradeChecker
 
 
+@pytest.fixture(autouse=True)
+def mock_resources_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """將檢查更新紀錄檔寫到臨時目錄，避免測試之間互相影響"""
+    with patch.object(ProjectPaths, "RESOURCES_DIR", tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture(autouse=True)
+def reset_version_checked() -> Generator[None, None, None]:
+    """每個測試都視為新的行程，尚未執行過背景版本檢查"""
+    with patch.object(UpgradeChecker, "_version_checked", False):
+        yield
+
+
 @pytest.fixture
 def upgrade_checker() -> UpgradeChecker:
     """建立 UpgradeChecker 實例"""
@@ -27,26 +41,35 @@ def upgrade_check_file(tmp_path: Path) -> Path:
 
 def test_get_latest_check_time_file_not_exists(upgrade_checker: UpgradeChecker) -> None:
     """測試檢查更新時，上次檢測時間紀錄檔案不存在的情況"""
-    with patch("pathlib.Path.exists", return_value=False):
-        result = upgrade_checker.get_latest_check_time()
-        assert result is None
+    result = upgrade_checker.get_latest_check_time()
+    assert result is None
 
 
+@freeze_time("2025-01-01 12:00:00")
 def test_get_latest_check_time_valid_data(upgrade_checker: UpgradeChecker) -> None:
-    """測試檢查更新時，上次檢測時間紀錄檔案存在且有有效資料的情況"""
-    test_time = datetime.now()
-    with patch("pathlib.Path.exists", return_value=True):
-        with patch("builtins.open", mock_open(read_data=test_time.isoformat())):
-            result = upgrade_checker.get_latest_check_time()
-            assert result == test_time
+    """測試檢查更新時，以紀錄檔的修改時間作為上次檢測時間"""
+    upgrade_checker.save_latest_check_time()
+
+    with patch("builtins.open") as mock_file:
+        result = upgrade_checker.get_latest_check_time()
+
+    assert result == datetime(2025, 1, 1, 12, 0, 0)
+    mock_file.assert_not_called()  # 不需要讀取檔案內容
+
+
+def test_get_cached_latest_tag_without_tag(upgrade_checker: UpgradeChecker) -> None:
+    """測試紀錄檔中沒有版本號時，不使用快取"""
+    upgrade_checker.save_latest_check_time()
+
+    assert upgrade_checker.get_cached_latest_tag() is None
 
 
-def test_get_latest_check_time_invalid_data(upgrade_checker: UpgradeChecker) -> None:
-    """測試檢查更新時，上次檢測時間紀錄檔案存在但讀取資料錯誤的情況"""
-    with patch("pathlib.Path.exists", return_value=True):
-        with patch("builtins.open", mock_open(read_data="invalid_date")):
-            result = upgrade_checker.get_latest_check_time()
-            assert result is None
+def test_get_cached_latest_tag_read_error(upgrade_checker: UpgradeChecker) -> None:
+    """測試讀取紀錄檔失敗時，不使用快取"""
+    upgrade_checker.save_latest_check_time("v99.0.0")
+
+    with patch("pathlib.Path.read_text", side_effect=OSError):
+        assert upgrade_checker.get_cached_latest_tag() is None
 
 
 def test_should_check_update_no_previous_check(upgrade_checker: UpgradeChecker) -> None:
@@ -81,6 +104,8 @@ def test_save_latest_check_time(upgrade_checker: UpgradeChecker, upgrade_check_f
         mock_file.assert_called_once_with(upgrade_check_file, "w", encoding="utf-8")
         mock_file().write.assert_called_once_with("2025-01-01T12:00:00")
 
+    assert upgrade_check_file.stat().st_mtime == datetime(2025, 1, 1, 12, 0, 0).timestamp()
+
 
 @pytest.mark.parametrize(
     "current_version,latest_tag,expected_result",
@@ -94,7 +119,7 @@ def test_check_for_updates_version(
     current_version: str, latest_tag: str, expected_result: Optional[str], upgrade_checker: UpgradeChecker
 ) -> None:
     """測試檢查是否有新版本"""
-    mock_response = MagicMock()
+    mock_response = MagicMock(status_code=200, headers={})
     mock_response.json.return_value = [{"name": latest_tag}]
 
     # mock 發請請求的函數
@@ -111,6 +136,101 @@ def test_check_for_updates_version_exception(upgrade_checker: UpgradeChecker) ->
         assert result is None
 
 
+def test_check_for_updates_version_use_cache(upgrade_checker: UpgradeChecker) -> None:
+    """測試最近檢查過時，直接使用快取的版本號，不發送網路請求"""
+    upgrade_checker.save_latest_check_time("v99.0.0")
+
+    with patch("requests.get") as mock_get:
+        result = upgrade_checker.check_for_updates_version()
+
+    assert result == "v99.0.0"
+    mock_get.assert_not_called()
+
+
+def test_check_for_updates_version_force(upgrade_checker: UpgradeChecker) -> None:
+    """測試強制檢查時，會忽略快取並寫入新的版本號"""
+    upgrade_checker.save_latest_check_time("v99.0.0")
+
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = [{"name": "v100.0.0"}, {"name": "v98.0.0"}]
+
+    with patch("requests.get", return_value=mock_response) as mock_get:
+        result = upgrade_checker.check_for_updates_version(force=True)
+
+    assert result == "v100.0.0"
+    mock_get.assert_called_once()
+    assert upgrade_checker.get_cached_latest_tag() == "v100.0.0"
+
+
+def test_check_for_updates_version_no_tags(upgrade_checker: UpgradeChecker) -> None:
+    """測試 GitHub 上沒有任何 tag 的情況"""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = []
+
+    with patch("requests.get", return_value=mock_response):
+        result = upgrade_checker.check_for_updates_version()
+
+    assert result is None
+    assert upgrade_checker.get_cached_latest_tag() == UpgradeChecker.UNTAGGED_VERSION
+
+
+def test_check_for_updates_version_exception_save_check_time(upgrade_checker: UpgradeChecker) -> None:
+    """測試查詢失敗時仍會記錄檢查時間，但不會留下版本號快取"""
+    with patch("requests.get", side_effect=Exception):
+        upgrade_checker.check_for_updates_version()
+
+    assert upgrade_checker.should_check_update() is False
+    assert upgrade_checker.get_cached_latest_tag() is None
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_check_for_updates_version_exception_quiet(
+    upgrade_checker: UpgradeChecker, capsys: pytest.CaptureFixture, quiet: bool
+) -> None:
+    """測試查詢失敗時，只有在非 quiet 模式下才輸出錯誤訊息"""
+    with patch("requests.get", side_effect=Exception):
+        assert upgrade_checker.check_for_updates_version(show_spinner=False, quiet=quiet) is None
+
+    assert ("檢查更新失敗" in capsys.readouterr().out) is not quiet
+
+
+def test_check_for_updates_version_save_check_time_before_fetch(upgrade_checker: UpgradeChecker) -> None:
+    """測試查詢前就先記錄檢查時間並保留上次的版本號，查詢途中程序結束時也不會每次都重新查詢"""
+    with freeze_time(datetime.now() - timedelta(seconds=UpgradeChecker.CHECK_INTERVAL + 100)):
+        upgrade_checker.save_latest_check_time("v99.0.0")
+
+    def interrupted_fetch() -> str:
+        # 查詢途中，紀錄檔已經是最新的檢查時間，且保留上次的版本號
+        assert upgrade_checker.should_check_update() is False
+        assert upgrade_checker.get_cached_latest_tag() == "v99.0.0"
+        raise KeyboardInterrupt
+
+    with patch.object(UpgradeChecker, "fetch_latest_tag", side_effect=interrupted_fetch):
+        with pytest.raises(KeyboardInterrupt):
+            upgrade_checker.check_for_updates_version(show_spinner=False)
+
+
+def test_get_cached_latest_tag_expired(upgrade_checker: UpgradeChecker) -> None:
+    """測試快取超過 CHECK_INTERVAL 時，不使用快取的版本號"""
+    with freeze_time(datetime.now() - timedelta(seconds=UpgradeChecker.CHECK_INTERVAL + 100)):
+        upgrade_checker.save_latest_check_time("v99.0.0")
+
+    assert upgrade_checker.get_cached_latest_tag() is None
+
+
+def test_check_for_updates_version_without_spinner(upgrade_checker: UpgradeChecker) -> None:
+    """測試不顯示讀取動畫時，仍可正常檢查新版本"""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = [{"name": "v99.0.0"}]
+
+    with patch("requests.get", return_value=mock_response):
+        with patch("commit_assistant.utils.upgrade_checker.loading_spinner") as mock_spinner:
+            result = upgrade_checker.check_for_updates_version(show_spinner=False)
+
+    assert result == "v99.0.0"
+    mock_spinner.assert_not_called()
+
+
 def test_print_update_message(upgrade_checker: UpgradeChecker, capsys: pytest.CaptureFixture) -> None:
     """測試印出更新提示訊息"""
     upgrade_checker.print_update_message("v2.0.0")
@@ -126,31 +246,49 @@ def test_run_version_check_no_update_needed(upgrade_checker: UpgradeChecker) ->
     """測試不需要檢查更新的情況"""
     with patch.object(UpgradeChecker, "should_check_update", return_value=False):
         with patch.object(UpgradeChecker, "check_for_updates_version") as mock_check:
-            with patch.object(UpgradeChecker, "save_latest_check_time") as mock_save:
-                upgrade_checker.run_version_check(force=False)
-                mock_check.assert_not_called()
-                mock_save.assert_not_called()
+            upgrade_checker.run_version_check(force=False)
+            mock_check.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "cached_tag,expected",
+    [
+        ("v99.0.0", "v99.0.0"),  # 紀錄檔中的版本較新
+        ("v0.0.1", None),  # 紀錄檔中的版本較舊
+        ("not-a-version", None),  # 紀錄檔內容異常
+        (None, None),  # 上次查詢失敗，沒有記錄版本號
+    ],
+)
+def test_run_version_check_use_cached_tag(
+    upgrade_checker: UpgradeChecker, cached_tag: Optional[str], expected: Optional[str]
+) -> None:
+    """測試未超過檢查間隔時，使用紀錄檔中的版本號，不發送網路請求"""
+    upgrade_checker.save_latest_check_time(cached_tag)
+
+    with patch("requests.get") as mock_get:
+        assert upgrade_checker.run_version_check() == expected
+
+    mock_get.assert_not_called()
 
 
 def test_run_version_check_force_update(upgrade_checker: UpgradeChecker) -> None:
     """測試強制檢查更新的情況"""
     with patch.object(UpgradeChecker, "should_check_update", return_value=False):
         with patch.object(UpgradeChecker, "check_for_updates_version", return_value=None) as mock_check:
-            with patch.object(UpgradeChecker, "save_latest_check_time") as mock_save:
-                upgrade_checker.run_version_check(force=True)
-                mock_check.assert_called_once()
-                mock_save.assert_called_once()
+            upgrade_checker.run_version_check(force=True)
+            mock_check.assert_called_once_with(show_spinner=False, force=True, quiet=True)
 
 
 def test_run_version_check_new_version_available(upgrade_checker: UpgradeChecker) -> None:
     """測試有新版本可用的情況"""
     with patch.object(UpgradeChecker, "should_check_update", return_value=True):
-        with patch.object(UpgradeChecker, "check_for_updates_version", return_value="v2.0.0"):
+        with patch.object(UpgradeChecker, "check_for_updates_version", return_value="v2.0.0") as mock_check:
             with patch.object(UpgradeChecker, "print_update_message") as mock_print:
-                with patch.object(UpgradeChecker, "save_latest_check_time") as mock_save:
-                    upgrade_checker.run_version_check()
-                    mock_print.assert_called_once_with("v2.0.0")
-                    mock_save.assert_called_once()
+                assert upgrade_checker.run_version_check() == "v2.0.0"
+                # 在背景執行緒中不直接輸出訊息
+                mock_print.assert_not_called()
+                # 已確定需要檢查，不應該再使用快取
+                mock_check.assert_called_once_with(show_spinner=False, force=True, quiet=True)
 
 
 def test_run_version_check_no_new_version(upgrade_checker: UpgradeChecker) -> None:
@@ -158,7 +296,123 @@ def test_run_version_check_no_new_version(upgrade_checker: UpgradeChecker) -> No
     with patch.object(UpgradeChecker, "should_check_update", return_value=True):
         with patch.object(UpgradeChecker, "check_for_updates_version", return_value=None):
             with patch.object(UpgradeChecker, "print_update_message") as mock_print:
-                with patch.object(UpgradeChecker, "save_latest_check_time") as mock_save:
-                    upgrade_checker.run_version_check()
-                    mock_print.assert_not_called()
-                    mock_save.assert_called_once()
+                assert upgrade_checker.run_version_check() is None
+                mock_print.assert_not_called()
+
+
+def test_run_version_check_once_per_process(upgrade_checker: UpgradeChecker) -> None:
+    """測試同一個行程中，非強制的版本檢查只會執行一次"""
+    with patch.object(UpgradeChecker, "should_check_update", return_value=True) as mock_should_check:
+        with patch.object(UpgradeChecker, "check_for_updates_version", return_value=None) as mock_check:
+            upgrade_checker.run_version_check()
+            UpgradeChecker().run_version_check()
+
+    mock_should_check.assert_called_once()
+    mock_check.assert_called_once()
+
+
+def test_run_version_check_force_ignore_checked(upgrade_checker: UpgradeChecker) -> None:
+    """測試強制檢查時，不受同一個行程中已檢查過的限制"""
+    with patch.object(UpgradeChecker, "should_check_update", return_value=True):
+        with patch.object(UpgradeChecker, "check_for_updates_version", return_value=None) as mock_check:
+            upgrade_checker.run_version_check()
+            upgrade_checker.run_version_check(force=True)
+
+    assert mock_check.call_count == 2
+
+
+@pytest.mark.parametrize("newest_version", ["v2.0.0", None])
+def test_start_background_check(upgrade_checker: UpgradeChecker, newest_version: Optional[str]) -> None:
+    """測試背景檢查完成後，只有在有新版本時才印出更新訊息"""
+    with patch("threading.Thread") as mock_thread:
+        # 直接在目前的執行緒中執行檢查，模擬命令結束前背景檢查已完成
+        mock_thread.return_value.start.side_effect = lambda: mock_thread.call_args.kwargs["target"]()
+
+        with patch.object(UpgradeChecker, "run_version_check", return_value=newest_version):
+            with patch.object(UpgradeChecker, "print_update_message") as mock_print:
+                print_pending_update_message = upgrade_checker.start_background_check()
+
+                # 檢查完成後不會立即輸出訊息，等到命令結束時才輸出
+                mock_print.assert_not_called()
+                print_pending_update_message()
+
+    assert mock_thread.call_args.kwargs["daemon"] is True
+    if newest_version:
+        mock_print.assert_called_once_with(newest_version)
+    else:
+        mock_print.assert_not_called()
+
+
+def test_start_background_check_not_finished(upgrade_checker: UpgradeChecker) -> None:
+    """測試命令結束時背景檢查尚未完成，不等待也不印出更新訊息"""
+    with patch("threading.Thread") as mock_thread:
+        with patch.object(UpgradeChecker, "print_update_message") as mock_print:
+            upgrade_checker.start_background_check()()
+
+    mock_thread.return_value.start.assert_called_once()
+    mock_thread.return_value.join.assert_not_called()
+    mock_print.assert_not_called()
+
+
+def test_fetch_latest_tag_not_modified(upgrade_checker: UpgradeChecker) -> None:
+    """測試 GitHub 回應 304 時，直接使用快取的版本號"""
+    first_response = MagicMock(
+        status_code=200, headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025"}
+    )
+    first_response.json.return_value = [{"name": "v1.0.0"}, {"name": "v1.2.0"}]
+
+    with patch("requests.get", return_value=first_response):
+        assert upgrade_checker.fetch_latest_tag() == "v1.2.0"
+
+    not_modified_response = MagicMock(status_code=304, headers={})
+
+    with patch("requests.get", return_value=not_modified_response) as mock_get:
+        assert upgrade_checker.fetch_latest_tag() == "v1.2.0"
+
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2025"}
+    assert mock_get.call_args.kwargs["timeout"] == UpgradeChecker.REQUEST_TIMEOUT
+    not_modified_response.json.assert_not_called()
+
+
+def test_fetch_latest_tag_without_cache(upgrade_checker: UpgradeChecker) -> None:
+    """測試沒有快取時，不帶條件式請求的 header"""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = [{"name": "v1.0.0"}]
+
+    with patch("requests.get", return_value=mock_response) as mock_get:
+        assert upgrade_checker.fetch_latest_tag() == "v1.0.0"
+
+    assert mock_get.call_args.kwargs["headers"] == {}
+
+
+def test_fetch_latest_tag_invalid_cache(upgrade_checker: UpgradeChecker, tmp_path: Path) -> None:
+    """測試快取檔案格式錯誤時，視為沒有快取"""
+    (tmp_path / ProjectInfo.RELEASE_TAGS_CACHE_FILE).write_text("[]", encoding="utf-8")
+
+    assert upgrade_checker._read_tags_cache() == {}
+
+
+def test_fetch_latest_tag_save_cache_error(upgrade_checker: UpgradeChecker) -> None:
+    """測試快取寫入失敗時，仍回傳查到的版本號"""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = [{"name": "v1.0.0"}]
+
+    with (
+        patch("requests.get", return_value=mock_response),
+        patch("pathlib.Path.write_text", side_effect=OSError),
+    ):
+        assert upgrade_checker.fetch_latest_tag() == "v1.0.0"
+
+
+def test_fetch_latest_tag_cache_without_validators(upgrade_checker: UpgradeChecker, tmp_path: Path) -> None:
+    """測試快取中沒有 ETag 與 Last-Modified 時，不帶條件式請求的 header"""
+    (tmp_path / ProjectInfo.RELEASE_TAGS_CACHE_FILE).write_text('{"latest_tag": "v1.0.0"}', encoding="utf-8")
+
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = [{"name": "v1.1.0"}]
+
+    with patch("requests.get", return_value=mock_response) as mock_get:
+        assert upgrade_checker.fetch_latest_tag() == "v1.1.0"
+
+    assert mock_get.call_args.kwargs["headers"] == {}
@@ -17,14 +17,13 @@ def mock_version_data() -> dict[str, str]:
 
 
 @patch.object(upgrade_module, "UpgradeChecker")
-def test_check_has_update(mock_checker_class: MagicMock, mock_version_data: dict) -> None:
+def test_check_has_update(mock_checker_class: MagicMock, mock_version_data: dict, runner: CliRunner) -> None:
     """測試檢查是否有新版本"""
     # Setup mock
     mock_checker = MagicMock()
     mock_checker.check_for_updates_version.return_value = mock_version_data.get("new_version")
     mock_checker_class.return_value = mock_checker
 
-    runner = CliRunner()
     result = runner.invoke(check)
 
     # 驗證結果
@@ -36,7 +35,7 @@ def test_check_has_update(mock_checker_class: MagicMock, mock_version_data: dict
 
 @patch.object(upgrade_module, "UpgradeChecker")
 @patch("commit_assistant.core.project_config.ProjectInfo.VERSION", new_callable=lambda: "v1.0.0")
-def test_check_no_update(mock_version: str, mock_checker_class: MagicMock) -> None:
+def test_check_no_update(mock_version: str, mock_checker_class: MagicMock, runner: CliRunner) -> None:
     """測試當前已經是最新版本"""
     # Setup mock
     mock_checker = MagicMock()
@@ -44,7 +43,6 @@ def test_check_no_update(mock_version: str, mock_checker_class: MagicMock) -> No
     mock_checker_class.return_value = mock_checker
 
     with patch("commit_assistant.utils.console_utils.console.print") as mock_print:
-        runner = CliRunner()
         result = runner.invoke(check)
 
         # 驗證結果
@@ -57,20 +55,18 @@ def test_check_no_update(mock_version: str, mock_checker_class: MagicMock) -> No
 
 
 @patch.object(upgrade_module, "_upgrade")
-def test_upgrade_command_no_subcommand(mock_upgrade: MagicMock) -> None:
+def test_upgrade_command_no_subcommand(mock_upgrade: MagicMock, runner: CliRunner) -> None:
     """測試執行 upgrade 指令"""
-    runner = CliRunner()
     result = runner.invoke(upgrade)
 
     # 驗證結果
     assert result.exit_code == 0
-    mock_upgrade.assert_called_once_with(False)
+    mock_upgrade.assert_called_once_with(False, False)
 
 
 @patch.object(upgrade_module, "upgrade")
-def test_upgrade_with_subcommand(mock_upgrade: MagicMock) -> None:
+def test_upgrade_with_subcommand(mock_upgrade: MagicMock, runner: CliRunner) -> None:
     """測試執行 upgrade 指令並帶上子命令"""
-    runner = CliRunner()
     result = runner.invoke(upgrade, ["check"])
 
     # 這裡有帶上子命令，所以不應該執行_upgrade 函數
@@ -79,14 +75,34 @@ def test_upgrade_with_subcommand(mock_upgrade: MagicMock) -> None:
 
 
 @patch.object(upgrade_module, "_upgrade")
-def test_upgrade_command_with_yes_flag(mock_upgrade: MagicMock) -> None:
+def test_upgrade_command_with_yes_flag(mock_upgrade: MagicMock, runner: CliRunner) -> None:
     """測試執行 upgrade 指令並帶上 --yes 參數"""
-    runner = CliRunner()
     result = runner.invoke(upgrade, ["--yes"])
 
     # 驗證結果
     assert result.exit_code == 0
-    mock_upgrade.assert_called_once_with(True)
+    mock_upgrade.assert_called_once_with(True, False)
+
+
+@patch.object(upgrade_module, "_upgrade")
+def test_upgrade_command_with_force_flag(mock_upgrade: MagicMock, runner: CliRunner) -> None:
+    """測試執行 upgrade 指令並帶上 --force 參數"""
+    result = runner.invoke(upgrade, ["--force"])
+
+    assert result.exit_code == 0
+    mock_upgrade.assert_called_once_with(False, True)
+
+
+@patch.object(upgrade_module, "UpgradeChecker")
+def test_check_with_force_flag(mock_checker_class: MagicMock, runner: CliRunner) -> None:
+    """測試執行 check 指令並帶上 --force 參數，會忽略快取"""
+    mock_checker = mock_checker_class.return_value
+    mock_checker.check_for_updates_version.return_value = None
+
+    result = runner.invoke(check, ["--force"])
+
+    assert result.exit_code == 0
+    mock_checker.check_for_updates_version.assert_called_once_with(force=True)
 
 
 @patch.object(upgrade_module, "UpgradeChecker")